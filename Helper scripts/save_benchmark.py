@@ -0,0 +1,127 @@
+"""
+Benchmark the set-based node save against the per-relationship save.
+
+Saves a node with 1, 10, 100 and 1000 relationships through both paths of
+Neo4jModel._save_node_transaction and reports round trips and wall time.
+All data is written to a throwaway project that is deleted afterwards.
+
+Usage:
+    python save_benchmark.py --uri bolt://localhost:7687 --user neo4j --password secret
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from core.neo4jmodel import Neo4jModel  # noqa: E402
+
+RELATIONSHIP_COUNTS = (1, 10, 100, 1000)
+RELATIONSHIP_TYPES = ("KNOWS", "OWNS", "VISITED", "FOUGHT")
+
+
+class BenchmarkConfig:
+    """Minimal stand-in for Config with a throwaway project."""
+
+    def __init__(self, project, set_based):
+        self.user = SimpleNamespace(PROJECT=project)
+        self._values = {"SET_BASED_SAVE": set_based, "COALESCE_READ_QUERIES": False}
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+
+class CountingTransaction:
+    """Transaction wrapper that counts statements sent to the server."""
+
+    def __init__(self, tx):
+        self._tx = tx
+        self.statements = 0
+
+    def run(self, *args, **kwargs):
+        self.statements += 1
+        return self._tx.run(*args, **kwargs)
+
+
+def node_data(relationship_count):
+    return {
+        "name": "Benchmark Hero",
+        "description": "Benchmark node",
+        "tags": ["benchmark"],
+        "labels": ["Person"],
+        "additional_properties": {"rank": "captain"},
+        "relationships": [
+            (
+                RELATIONSHIP_TYPES[i % len(RELATIONSHIP_TYPES)],
+                f"Benchmark Target {i}",
+                ">" if i % 2 else "<",
+                {"weight": i},
+            )
+            for i in range(relationship_count)
+        ],
+    }
+
+
+def save_once(model, data):
+    """Save a node once and return (round trips, seconds)."""
+    counter = {}
+
+    def transaction(tx):
+        counting = CountingTransaction(tx)
+        model._save_node_transaction(counting, data)
+        counter["statements"] = counting.statements
+
+    with model.driver.session() as session:
+        started = time.perf_counter()
+        session.execute_write(transaction)
+        elapsed = time.perf_counter() - started
+    return counter["statements"], elapsed
+
+
+def run_benchmark(args):
+    project = f"save-benchmark-{uuid.uuid4().hex[:8]}"
+    models = {
+        "per-row": Neo4jModel(
+            args.uri, args.user, args.password, BenchmarkConfig(project, False)
+        ),
+        "set-based": Neo4jModel(
+            args.uri, args.user, args.password, BenchmarkConfig(project, True)
+        ),
+    }
+    try:
+        print(f"{'rels':>6} {'path':>10} {'round trips':>12} {'median ms':>10}")
+        for count in RELATIONSHIP_COUNTS:
+            data = node_data(count)
+            for label, model in models.items():
+                timings = []
+                statements = 0
+                for _ in range(args.repeat):
+                    statements, elapsed = save_once(model, data)
+                    timings.append(elapsed)
+                median_ms = statistics.median(timings) * 1000
+                print(f"{count:>6} {label:>10} {statements:>12} {median_ms:>10.1f}")
+    finally:
+        with models["set-based"].driver.session() as session:
+            session.run(
+                "MATCH (n {_project: $project}) DETACH DELETE n", project=project
+            ).consume()
+        for model in models.values():
+            model.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default=os.environ.get("NEO4J_PASSWORD", ""))
+    parser.add_argument("--repeat", type=int, default=5)
+    run_benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Benchmark saving a node's properties with and without reads before the write.
+
+The pre-read path replays the statements the full save used to send: read
+_created, create the node if missing, reset its properties, read its labels
+and add the extra properties. The single-statement path is the current
+Neo4jModel._save_node_transaction, which keeps the system properties and
+diffs the labels inside one write statement. Both save the same node without
+relationships and with unchanged labels, so the difference is the latency of
+the removed round trips. All data is written to a throwaway project that is
+deleted afterwards.
+
+Usage:
+    python system_props_benchmark.py --uri bolt://localhost:7687 --user neo4j --password secret
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from core.neo4jmodel import Neo4jModel  # noqa: E402
+
+GET_SYSTEM = """
+    MATCH (n:_Node {name: $name, _project: $project})
+    RETURN n._created AS created
+"""
+CREATE = """
+    CREATE (n:_Node {name: $name, description: $description, tags: $tags, _project: $project})
+"""
+RESET = """
+    MATCH (n:_Node {name: $name, _project: $project})
+    SET n = $base_props
+"""
+GET_LABELS = """
+    MATCH (n:_Node {name: $name, _project: $project})
+    RETURN [label IN labels(n) WHERE NOT label STARTS WITH '_'] AS labels
+"""
+ADDITIONAL_PROPS = """
+    MATCH (n:_Node {name: $name, _project: $project})
+    SET n += $additional_properties
+"""
+REMOVE_RELS = "MATCH (n:_Node {name: $name, _project: $project})-[r]-() DELETE r"
+
+
+class BenchmarkConfig:
+    """Minimal stand-in for Config with a throwaway project."""
+
+    def __init__(self, project):
+        self.user = SimpleNamespace(PROJECT=project)
+        self._values = {"COALESCE_READ_QUERIES": False}
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+
+class CountingTransaction:
+    """Transaction wrapper that counts statements sent to the server."""
+
+    def __init__(self, tx):
+        self._tx = tx
+        self.statements = 0
+
+    def run(self, *args, **kwargs):
+        self.statements += 1
+        return self._tx.run(*args, **kwargs)
+
+
+def node_data():
+    return {
+        "name": "Benchmark Hero",
+        "description": "Benchmark node",
+        "tags": ["benchmark"],
+        "labels": ["Person"],
+        "additional_properties": {"rank": "captain"},
+        "relationships": [],
+    }
+
+
+def pre_read_save(model, tx, data):
+    """The full save as it was before system properties moved server-side."""
+    project = model._project
+    name = data["name"]
+    record = tx.run(GET_SYSTEM, name=name, project=project).single()
+    if record is None:
+        tx.run(
+            CREATE,
+            name=name,
+            description=data["description"],
+            tags=data["tags"],
+            project=project,
+        )
+    now = datetime.now().isoformat()
+    created = record["created"] if record and record["created"] else now
+    base_props = {
+        "name": name,
+        "description": data["description"],
+        "tags": data["tags"],
+        "_author": "System",
+        "_modified": now,
+        "_project": project,
+        "_created": created,
+    }
+    tx.run(RESET, name=name, base_props=base_props, project=project)
+    labels = tx.run(GET_LABELS, name=name, project=project).single()["labels"]
+    for query in model._label_change_queries(labels, data["labels"]):
+        tx.run(query, name=name, project=project)
+    tx.run(
+        ADDITIONAL_PROPS,
+        name=name,
+        additional_properties=data["additional_properties"],
+        project=project,
+    )
+    tx.run(REMOVE_RELS, name=name, project=project)
+
+
+def single_statement_save(model, tx, data):
+    model._save_node_transaction(tx, data)
+
+
+def save_once(model, save, data):
+    """Save a node once and return (statements, seconds)."""
+    counter = {}
+
+    def transaction(tx):
+        counting = CountingTransaction(tx)
+        save(model, counting, data)
+        counter["statements"] = counting.statements
+
+    with model.driver.session() as session:
+        started = time.perf_counter()
+        session.execute_write(transaction)
+        elapsed = time.perf_counter() - started
+    return counter["statements"], elapsed
+
+
+def run_benchmark(args):
+    project = f"props-benchmark-{uuid.uuid4().hex[:8]}"
+    model = Neo4jModel(args.uri, args.user, args.password, BenchmarkConfig(project))
+    paths = {"pre-read": pre_read_save, "single": single_statement_save}
+    data = node_data()
+    try:
+        # Create the node once so both paths measure the update of a node
+        save_once(model, single_statement_save, data)
+        print(f"{'path':>10} {'statements':>11} {'median ms':>10} {'p90 ms':>8}")
+        for label, save in paths.items():
+            timings = []
+            statements = 0
+            for _ in range(args.repeat):
+                statements, elapsed = save_once(model, save, data)
+                timings.append(elapsed * 1000)
+            timings.sort()
+            p90 = timings[int(len(timings) * 0.9) - 1]
+            print(
+                f"{label:>10} {statements:>11} "
+                f"{statistics.median(timings):>10.2f} {p90:>8.2f}"
+            )
+    finally:
+        with model.driver.session() as session:
+            session.run(
+                "MATCH (n {_project: $project}) DETACH DELETE n", project=project
+            ).consume()
+        model.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default=os.environ.get("NEO4J_PASSWORD", ""))
+    parser.add_argument("--repeat", type=int, default=50)
+    run_benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
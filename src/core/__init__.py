@@ -4,21 +4,29 @@ Contains models and workers for handling database operations.
 """
 
 from .neo4jmodel import Neo4jModel
+from .async_neo4jmodel import AsyncNeo4jModel
 from .neo4jworkers import (
     BaseNeo4jWorker,
     QueryWorker,
+    StreamingQueryWorker,
     WriteWorker,
     DeleteWorker,
     BatchWorker,
     SuggestionWorker,
 )
+from .worker_executor import CancellationToken, WorkerExecutor, WorkerPriority
 
 __all__ = [
     "Neo4jModel",
+    "AsyncNeo4jModel",
     "BaseNeo4jWorker",
     "QueryWorker",
+    "StreamingQueryWorker",
     "WriteWorker",
     "DeleteWorker",
     "BatchWorker",
     "SuggestionWorker",
+    "CancellationToken",
+    "WorkerExecutor",
+    "WorkerPriority",
 ]
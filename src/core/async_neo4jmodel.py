@@ -0,0 +1,363 @@
+"""
+This module provides the AsyncNeo4jModel class, an asyncio data-access layer
+that runs alongside the pooled QThread-style workers.
+All coroutines run on one dedicated event-loop thread and share a small async
+driver, so many small concurrent reads are multiplexed over a few connections.
+Results are delivered back to the Qt thread through a signal bridge.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, Record
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from structlog import get_logger
+
+from core.neo4jmodel import Neo4jModel
+from core.schema_manager import visible_labels
+
+logger = get_logger(__name__)
+
+
+class _QtResultBridge(QObject):
+    """
+    Delivers callbacks from the event-loop thread onto the Qt thread.
+
+    The bridge is created on the Qt thread, so signals emitted from the loop
+    thread are queued and the callback runs in the Qt event loop.
+    """
+
+    delivered = pyqtSignal(object, object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delivered.connect(self._invoke)
+
+    @pyqtSlot(object, object)
+    def _invoke(self, callback: Callable[[Any], None], value: Any) -> None:
+        callback(value)
+
+
+class AsyncNeo4jModel:
+    """
+    Asyncio gateway to the Neo4j database.
+
+    Shares connection settings, project and query text with the synchronous
+    ``Neo4jModel`` it is created from, but owns its own async driver and
+    event-loop thread.
+
+    Args:
+        model (Neo4jModel): The synchronous model to take settings from.
+    """
+
+    def __init__(self, model: Neo4jModel) -> None:
+        """
+        Initialize the model and start its event-loop thread.
+
+        Args:
+            model (Neo4jModel): The synchronous model to take settings from.
+        """
+        self._model = model
+        self._project = model._project
+        self._driver: Optional[AsyncDriver] = None
+        self._bridge = _QtResultBridge()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="neo4j-async", daemon=True
+        )
+        self._thread.start()
+
+        logger.info(
+            "AsyncNeo4jModel event loop started",
+            module="AsyncNeo4jModel",
+            function="__init__",
+        )
+
+    #############################################
+    # 1. Loop and Driver Management
+    #############################################
+
+    def submit(
+        self,
+        coro: Awaitable[Any],
+        callback: Optional[Callable[[Any], None]] = None,
+        error_callback: Optional[Callable[[str], None]] = None,
+    ) -> Future:
+        """
+        Schedule a coroutine on the event loop and deliver its outcome to Qt.
+
+        Callbacks run on the Qt thread. Cancelling the returned future cancels
+        the coroutine; neither callback is called in that case.
+
+        Args:
+            coro: The coroutine to run.
+            callback: Called with the coroutine's result.
+            error_callback: Called with the error message if the coroutine fails.
+
+        Returns:
+            Future: The future of the scheduled coroutine.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+        def deliver(done: Future) -> None:
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                logger.error(
+                    "Async query failed",
+                    module="AsyncNeo4jModel",
+                    function="submit",
+                    error=str(error),
+                )
+                if error_callback:
+                    self._bridge.delivered.emit(error_callback, str(error))
+            elif callback:
+                self._bridge.delivered.emit(callback, done.result())
+
+        future.add_done_callback(deliver)
+        return future
+
+    async def _get_driver(self) -> AsyncDriver:
+        """
+        Get the async driver, creating it on the event loop on first use.
+
+        Returns:
+            AsyncDriver: The shared async driver.
+        """
+        if self._driver is None:
+            settings = self._model._pool_settings()
+            settings["max_connection_pool_size"] = self._model._config.get(
+                "ASYNC_MAX_CONNECTION_POOL_SIZE", 5
+            )
+            self._driver = AsyncGraphDatabase.driver(
+                self._model._uri, auth=self._model._auth, **settings
+            )
+            await self._driver.verify_connectivity()
+        return self._driver
+
+    async def _close_driver(self) -> None:
+        if self._driver is not None:
+            await self._driver.close()
+            self._driver = None
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Close the async driver and stop the event-loop thread.
+
+        Args:
+            timeout (float): Seconds to wait for the driver to close.
+        """
+        if not self._loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_driver(), self._loop).result(
+                timeout
+            )
+        except Exception as e:
+            logger.warning(
+                "Async driver did not close cleanly",
+                module="AsyncNeo4jModel",
+                function="close",
+                error=str(e),
+            )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        logger.info(
+            "AsyncNeo4jModel closed.", module="AsyncNeo4jModel", function="close"
+        )
+
+    async def _run_read(self, query: str, params: Dict[str, Any]) -> List[Record]:
+        """
+        Run a read query in its own session and collect all records.
+
+        Args:
+            query (str): The Cypher query to execute.
+            params (dict): Parameters for the query.
+
+        Returns:
+            list: The result records.
+        """
+        driver = await self._get_driver()
+        async with driver.session() as session:
+            result = await session.run(query, params)
+            return [record async for record in result]
+
+    #############################################
+    # 2. Node Operations
+    #############################################
+
+    async def load_node(self, name: str) -> List[Record]:
+        """
+        Load a node and its relationships by name.
+
+        Args:
+            name (str): Name of the node to load.
+
+        Returns:
+            list: Records in the same shape as ``Neo4jModel.load_node``.
+        """
+        return await self._run_read(
+            self._model.queries.get("load_node"),
+            {"name": name, "project": self._project},
+        )
+
+    async def save_node(self, node_data: Dict[str, Any]) -> Optional[int]:
+        """
+        Save or update a node and its relationships.
+
+        Like ``Neo4jModel.save_node``, cached records of the node and of the
+        nodes it is connected to are invalidated before the write and again
+        once it finished, so a load running meanwhile cannot cache what the
+        write replaced.
+
+        Args:
+            node_data (dict): Node data including properties and relationships.
+
+        Returns:
+            int: The version the node has after the save.
+        """
+        model = self._model
+        model.validate_node_data(node_data)
+        keys = model._cache_keys(model._written_names(node_data))
+        model.node_cache.invalidate(keys)
+        try:
+            driver = await self._get_driver()
+            async with driver.session() as session:
+                return await session.execute_write(
+                    self._save_node_transaction, node_data
+                )
+        finally:
+            model.node_cache.invalidate(keys)
+
+    async def _save_node_transaction(
+        self, tx: Any, node_data: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Async transaction handler for save_node.
+        Mirrors ``Neo4jModel._save_node_transaction`` step for step, always
+        using the set-based relationship statements.
+
+        Args:
+            tx: The async transaction object.
+            node_data (dict): Node data including properties and relationships.
+
+        Returns:
+            int: The version the node has after the save.
+        """
+        model = self._model
+        queries = model.queries
+        project = self._project
+        name = node_data["name"]
+
+        result = await tx.run(
+            queries.get("save.upsert"),
+            name=name,
+            properties=model._node_properties(node_data),
+            labels=list(dict.fromkeys(visible_labels(node_data["labels"]))),
+            now=datetime.now().isoformat(),
+            project=project,
+            version=node_data.get("version"),
+        )
+        record = await result.single()
+        model._check_version(record, node_data)
+        if record is not None:
+            for query_labels in model._label_queries(
+                record["labels_to_add"], record["labels_to_remove"]
+            ):
+                await tx.run(query_labels, name=name, project=project)
+
+        await tx.run(queries.get("save.remove_rels"), name=name, project=project)
+        relationships = node_data["relationships"]
+        if relationships:
+            await tx.run(
+                queries.get("save.create_stumps"),
+                stumps=model._stump_batch(relationships),
+                project=project,
+            )
+            for (rel_type, direction), rows in model._group_relationships(
+                relationships
+            ).items():
+                await tx.run(
+                    model._relationship_batch_query(rel_type, direction),
+                    name=name,
+                    rels=rows,
+                    project=project,
+                )
+        return record["version"] if record is not None else None
+
+    async def get_node_relationships(self, node_name: str, depth: int) -> List[Record]:
+        """
+        Get the relationships of a node by name up to a specified depth.
+
+        Args:
+            node_name (str): Name of the node.
+            depth (int): The depth of relationships to retrieve.
+
+        Returns:
+            list: Records in the same shape as ``Neo4jModel.get_node_relationships``.
+        """
+        return await self._run_read(
+            self._model._relationships_query(depth),
+            {"name": node_name, "project": self._project},
+        )
+
+    async def get_all_node_names(self) -> List[str]:
+        """
+        Get all node names of the active project.
+
+        Returns:
+            list: Node names in alphabetical order.
+        """
+        records = await self._run_read(
+            self._model.queries.get("all_node_names"), {"project": self._project}
+        )
+        return [record["name"] for record in records]
+
+    async def execute_read_query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Record]:
+        """
+        Execute a read-only Cypher query.
+
+        Args:
+            query: The Cypher query to execute. Must be a read-only query.
+            params: Optional parameters for the query
+
+        Returns:
+            list: The result records.
+
+        Raises:
+            ValueError: If the query appears to be a write operation
+        """
+        params = dict(params or {})
+        params.setdefault("project", self._project)
+        Neo4jModel._validate_read_query(query)
+        return await self._run_read(query, params)
+
+    async def gather_read_queries(
+        self, queries: Dict[str, Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """
+        Run several read-only queries concurrently.
+
+        Used to issue the independent queries behind one node view (e.g. the
+        node itself, its timeline events and its calendar) at the same time.
+        A failing query yields its exception instead of failing the others.
+
+        Args:
+            queries: Mapping of result key to (query, params).
+
+        Returns:
+            dict: Mapping of result key to records or the raised exception.
+        """
+        keys = list(queries)
+        results = await asyncio.gather(
+            *(self.execute_read_query(*queries[key]) for key in keys),
+            return_exceptions=True,
+        )
+        return dict(zip(keys, results))
@@ -0,0 +1,116 @@
+"""
+This module holds the helpers for searching nodes through the Neo4j full-text
+index created by the SchemaManager. It turns user input into Lucene queries and
+builds highlighted snippets for the matched text, which the server does not
+provide.
+"""
+
+import html
+import re
+from typing import Iterable, List, Optional
+
+# Full-text index over the searchable text properties of all managed nodes
+FULLTEXT_INDEX = "node_search"
+FULLTEXT_FIELDS = ("name", "description", "tags")
+
+_LUCENE_SPECIAL = set('+-&|!(){}[]^"~*?:\\/')
+
+
+def escape_term(term: str) -> str:
+    """
+    Escape the Lucene query syntax characters in a single term.
+
+    Args:
+        term (str): A search term as typed by the user.
+
+    Returns:
+        str: The term, safe to embed in a Lucene query.
+    """
+    return "".join("\\" + char if char in _LUCENE_SPECIAL else char for char in term)
+
+
+def search_terms(text: str) -> List[str]:
+    """
+    Split search input into lower-case terms.
+
+    Args:
+        text (str): The search input.
+
+    Returns:
+        list: The terms, in input order.
+    """
+    return text.lower().split()
+
+
+def build_lucene_query(
+    text: str, fields: Iterable[str] = FULLTEXT_FIELDS, fuzzy: bool = False
+) -> str:
+    """
+    Build a Lucene query in which every term must match in one of the fields.
+
+    Each term matches as a whole word, boosted so it ranks above partial
+    matches, or as a prefix, so results appear while the user is typing. With
+    ``fuzzy`` a term also matches words within a small edit distance.
+
+    Args:
+        text (str): The search input.
+        fields (iterable): Indexed properties to search.
+        fuzzy (bool): Whether to match misspelled terms.
+
+    Returns:
+        str: The Lucene query, or an empty string if the input has no terms.
+    """
+    fields = list(fields)
+    clauses = []
+    for term in map(escape_term, search_terms(text)):
+        variants = []
+        for field in fields:
+            variants.extend((f"{field}:{term}^2", f"{field}:{term}*"))
+            if fuzzy:
+                variants.append(f"{field}:{term}~")
+        clauses.append("(" + " OR ".join(variants) + ")")
+    return " AND ".join(clauses)
+
+
+def highlight_snippet(
+    text: Optional[str], terms: List[str], width: int = 80
+) -> Optional[str]:
+    """
+    Cut a snippet around the first term found in a text and mark all terms.
+
+    The snippet is HTML: the text is escaped and matches are wrapped in
+    ``<b>`` tags.
+
+    Args:
+        text (str, optional): The text to search in.
+        terms (list): Terms to highlight, matched case-insensitively.
+        width (int): Approximate number of characters around the first match.
+
+    Returns:
+        str, optional: The snippet, or None if no term occurs in the text.
+    """
+    terms = [term for term in terms if term]
+    if not text or not terms:
+        return None
+
+    alternatives = sorted(set(terms), key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, alternatives)), re.IGNORECASE)
+    first = pattern.search(text)
+    if first is None:
+        return None
+
+    start = max(0, first.start() - width // 2)
+    end = min(len(text), max(first.end(), start + width))
+    window = text[start:end]
+
+    parts = []
+    position = 0
+    for match in pattern.finditer(window):
+        parts.append(html.escape(window[position : match.start()]))
+        parts.append(f"<b>{html.escape(match.group())}</b>")
+        position = match.end()
+    parts.append(html.escape(window[position:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + "".join(parts) + suffix
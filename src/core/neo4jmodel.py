@@ -5,13 +5,40 @@ It includes methods for connecting to the database, performing CRUD operations o
 
 import datetime
 from datetime import datetime
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Iterable, Optional, List, Set, Tuple, Union
 
-from neo4j import GraphDatabase
+from neo4j import Driver, GraphDatabase
 from neo4j.exceptions import AuthError
 from structlog import get_logger
 
-from core.neo4jworkers import QueryWorker, WriteWorker, DeleteWorker, SuggestionWorker
+from core.fulltext import FULLTEXT_INDEX, build_lucene_query
+from core.neo4jworkers import (
+    BaseNeo4jWorker,
+    BatchWorker,
+    BulkDeleteWorker,
+    DeleteWorker,
+    QueryWorker,
+    StreamingQueryWorker,
+    StumpCollectorWorker,
+    SuggestionWorker,
+    TransactionWorker,
+    WriteWorker,
+)
+from core.query_coalescer import QueryCoalescer
+from core.node_cache import NodeCache, relationship_signature
+from core.node_diff import NodeDiff, NodeVersionConflict, diff_node_data
+from core.node_references import (
+    BRANCH_NAMES_INDEX,
+    BRANCH_PROPERTY_PREFIX,
+    SET_BRANCH_NAMES,
+    branch_updates,
+    chunked,
+    description_updates,
+    visible_properties,
+)
+from core.query_registry import QueryRegistry
+from core.retry_policy import CircuitBreaker, RetryPolicy
+from core.schema_manager import SchemaManager, visible_labels
 from utils.converters import Neo4jNameValidator
 
 # Configure the standard logging
@@ -28,6 +55,468 @@ class Neo4jModel:
         password (str): The password for authentication.
     """
 
+    LOAD_NODE_QUERY = """
+        MATCH (n:_Node {name: $name, _project: $project})
+        WITH n, [label IN labels(n) WHERE NOT label STARTS WITH '_'] AS labels,
+             [(n)-[r]->(m) | {end: m.name, type: type(r), dir: '>', props: properties(r)}] AS out_rels,
+             [(n)<-[r2]-(o) | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}] AS in_rels,
+             properties(n) AS all_props
+        RETURN n,
+               out_rels + in_rels AS relationships,
+               labels,
+               all_props
+        LIMIT 1
+    """
+
+    ALL_NODE_NAMES_QUERY = """
+        MATCH (n:_Node)
+        WHERE n._project = $project
+        AND n.name IS NOT NULL
+        RETURN n.name AS name
+        ORDER BY n.name
+    """
+
+    NODE_EXISTS_QUERY = """
+        MATCH (n:_Node {name: $name, _project: $project})
+        RETURN true AS exists
+        LIMIT 1
+    """
+
+    # Lists relationships the way LOAD_NODE_QUERY does, so a cached record can
+    # be checked without loading the node's properties again
+    NODE_REVISION_QUERY = """
+        MATCH (n:_Node {name: $name, _project: $project})
+        RETURN n._version AS version,
+               n._modified AS modified,
+               [(n)-[r]->(m) | {end: m.name, type: type(r), dir: '>', props: properties(r)}] +
+               [(n)<-[r2]-(o) | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}] AS relationships
+        LIMIT 1
+    """
+
+    # Versioned writes: the node's write lock is taken before its _version is
+    # read, so concurrent saves cannot both pass the check. On a conflict
+    # nothing is written and the server's copy is returned instead.
+    SAVE_SERVER_COPY_RETURN = """
+        RETURN current AS written,
+               CASE WHEN current THEN version + 1 ELSE version END AS version,
+               CASE WHEN current THEN null ELSE {
+                   properties: properties(n),
+                   labels: [label IN labels(n) WHERE NOT label STARTS WITH '_'],
+                   relationships:
+                       [(n)-[r]->(m) | {end: m.name, type: type(r), dir: '>', props: properties(r)}] +
+                       [(n)<-[r2]-(o) | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}]
+               } END AS server
+    """
+
+    # Full save in one statement: the node is created if needed, the system
+    # properties are kept or set server-side, and the label changes are
+    # returned, so a save needs no read before writing. A node created by this
+    # statement, e.g. after being deleted meanwhile, is saved without a check.
+    SAVE_UPSERT_QUERY = (
+        """
+        MERGE (n:_Node {name: $name, _project: $project})
+        ON CREATE SET n._new = true
+        SET n._lock = true
+        REMOVE n._lock
+        WITH n, coalesce(n._version, 0) AS version, coalesce(n._new, false) AS created,
+             coalesce(n._created, $now) AS created_at,
+             [label IN labels(n) WHERE NOT label STARTS WITH '_'] AS labels_before
+        WITH n, version, created_at, labels_before,
+             ($version IS NULL OR created OR version = $version) AS current
+        FOREACH (_ IN CASE WHEN current THEN [1] ELSE [] END |
+            SET n = $properties,
+                n._project = $project, n._author = 'System',
+                n._created = created_at, n._modified = $now,
+                n._version = version + 1
+        )
+    """
+        + SAVE_SERVER_COPY_RETURN
+        + """,
+               [label IN $labels WHERE NOT label IN labels_before] AS labels_to_add,
+               [label IN labels_before WHERE NOT label IN $labels] AS labels_to_remove
+    """
+    )
+
+    SAVE_REMOVE_RELS_QUERY = (
+        "MATCH (n:_Node {name: $name, _project: $project})-[r]-() DELETE r"
+    )
+
+    SAVE_CHECK_TARGET_QUERY = (
+        "MATCH (target:_Node {name: $rel_name, _project: $project}) RETURN target"
+    )
+
+    SAVE_CREATE_STUMP_QUERY = """
+        CREATE (target:STUMP:_Node)
+        SET target = $stump_props
+    """
+
+    # Templates: labels, relationship types and path lengths cannot be
+    # parameters, so the query registry renders one text per value
+    SAVE_ADD_LABEL_QUERY = (
+        "MATCH (n:_Node {name: $name, _project: $project}) SET n:%(label)s"
+    )
+
+    SAVE_REMOVE_LABEL_QUERY = (
+        "MATCH (n:_Node {name: $name, _project: $project}) REMOVE n:%(label)s"
+    )
+
+    SAVE_MERGE_OUTGOING_QUERY = (
+        """
+        MATCH (n:_Node {name: $name, _project: $project}), (target:_Node {name: $rel_name, _project: $project})
+        MERGE (n)-[r:%(rel_type)s]->(target)
+        SET r = $properties
+    """
+        + SET_BRANCH_NAMES
+    )
+
+    SAVE_MERGE_INCOMING_QUERY = (
+        """
+        MATCH (n:_Node {name: $name, _project: $project}), (target:_Node {name: $rel_name, _project: $project})
+        MERGE (n)<-[r:%(rel_type)s]-(target)
+        SET r = $properties
+    """
+        + SET_BRANCH_NAMES
+    )
+
+    SAVE_CREATE_STUMPS_QUERY = """
+        UNWIND $stumps AS stump
+        OPTIONAL MATCH (existing:_Node {name: stump.name, _project: $project})
+        WITH stump, existing
+        WHERE existing IS NULL
+        CREATE (target:STUMP:_Node)
+        SET target = stump
+    """
+
+    SAVE_MERGE_OUTGOING_BATCH_QUERY = (
+        """
+        MATCH (n:_Node {name: $name, _project: $project})
+        UNWIND $rels AS rel
+        MATCH (target:_Node {name: rel.target, _project: $project})
+        MERGE (n)-[r:%(rel_type)s]->(target)
+        SET r = rel.properties
+    """
+        + SET_BRANCH_NAMES
+    )
+
+    SAVE_MERGE_INCOMING_BATCH_QUERY = (
+        """
+        MATCH (n:_Node {name: $name, _project: $project})
+        UNWIND $rels AS rel
+        MATCH (target:_Node {name: rel.target, _project: $project})
+        MERGE (n)<-[r:%(rel_type)s]-(target)
+        SET r = rel.properties
+    """
+        + SET_BRANCH_NAMES
+    )
+
+    SAVE_UPDATE_NODE_QUERY = (
+        """
+        MATCH (n:_Node {name: $name, _project: $project})
+        SET n._lock = true
+        REMOVE n._lock
+        WITH n, coalesce(n._version, 0) AS version
+        WITH n, version, ($version IS NULL OR version = $version) AS current
+        FOREACH (_ IN CASE WHEN current THEN [1] ELSE [] END |
+            SET n += $properties, n._modified = $modified, n._author = 'System',
+                n._version = version + 1
+        )
+    """
+        + SAVE_SERVER_COPY_RETURN
+    )
+
+    SAVE_DELETE_OUTGOING_BATCH_QUERY = """
+        MATCH (n:_Node {name: $name, _project: $project})
+        UNWIND $rels AS rel
+        MATCH (n)-[r:%(rel_type)s]->(target:_Node {name: rel.target, _project: $project})
+        DELETE r
+    """
+
+    SAVE_DELETE_INCOMING_BATCH_QUERY = """
+        MATCH (n:_Node {name: $name, _project: $project})
+        UNWIND $rels AS rel
+        MATCH (n)<-[r:%(rel_type)s]-(target:_Node {name: rel.target, _project: $project})
+        DELETE r
+    """
+
+    RELATIONSHIPS_QUERY = """
+        MATCH path = (n:_Node {name: $name, _project: $project})-[*1..%(depth)s]-(connected_node)
+        WHERE ALL(r IN relationships(path) WHERE startNode(r) IS NOT NULL AND endNode(r) IS NOT NULL)
+          AND ALL(node IN nodes(path) WHERE node IS NOT NULL)
+        WITH path, length(path) AS path_length
+        UNWIND range(1, path_length) AS idx
+        WITH
+            nodes(path)[idx] AS current_node,
+            relationships(path)[idx - 1] AS current_rel,
+            nodes(path)[idx - 1] AS parent_node,
+            idx AS depth
+        RETURN DISTINCT
+            current_node.name AS node_name,
+            [label IN labels(current_node) WHERE NOT label STARTS WITH '_'] AS labels,
+            parent_node.name AS parent_name,
+            type(current_rel) AS rel_type,
+            CASE
+                WHEN startNode(current_rel) = parent_node THEN '>' ELSE '<' END AS direction,
+            depth
+        ORDER BY depth ASC
+    """
+
+    NODE_HIERARCHY_QUERY = """
+        MATCH (n:_Node {_project: $project})
+        WITH n, [label IN labels(n) WHERE NOT label STARTS WITH '_'] AS labels
+        WHERE size(labels) > 1
+        RETURN DISTINCT head(labels) AS category,
+               collect(n.name) AS nodes
+        ORDER BY category
+    """
+
+    # Ordered by the node_modified index
+    LAST_MODIFIED_NODE_QUERY = """
+        MATCH (n:_Node)
+        WHERE n._modified IS NOT NULL AND n._project = $project
+        RETURN n.name AS name, n._modified AS modified
+        ORDER BY n._modified DESC
+        LIMIT 1
+    """
+
+    NODE_NAMES_QUERY = """
+        MATCH (n:_Node)
+        WHERE n._project = $project
+        AND toLower(n.name) CONTAINS toLower($prefix)
+        RETURN n.name AS name
+        LIMIT $limit
+    """
+
+    NODE_NAMES_FULLTEXT_QUERY = """
+        CALL db.index.fulltext.queryNodes($index, $query) YIELD node, score
+        WHERE node._project = $project
+        RETURN node.name AS name
+        ORDER BY score DESC
+        LIMIT $limit
+    """
+
+    # Multi-node save: one statement per step for all nodes of the batch.
+    # Nodes that exist already are left as they are; the creation marker
+    # tells the caller which nodes were new.
+    SAVE_NODES_CREATE_QUERY = """
+        UNWIND $nodes AS node
+        MERGE (n:_Node {name: node.name, _project: $project})
+        ON CREATE SET n += node.properties,
+            n._project = $project, n._author = 'System',
+            n._created = $now, n._modified = $now,
+            n._version = 1, n._new = true
+        WITH n, node, n._new IS NOT NULL AS created
+        FOREACH (_ IN CASE WHEN created THEN [1] ELSE [] END | REMOVE n._new)
+        RETURN node.name AS name, created
+    """
+
+    SAVE_NODES_ADD_LABEL_QUERY = """
+        UNWIND $names AS name
+        MATCH (n:_Node {name: name, _project: $project})
+        SET n:%(label)s
+    """
+
+    SAVE_NODES_MERGE_RELS_QUERY = (
+        """
+        UNWIND $rels AS rel
+        MATCH (source:_Node {name: rel.source, _project: $project})
+        MATCH (target:_Node {name: rel.target, _project: $project})
+        MERGE (source)-[r:%(rel_type)s]->(target)
+        ON CREATE SET r = rel.properties
+    """
+        + SET_BRANCH_NAMES
+    )
+
+    RENAME_NODE_QUERY = """
+        MATCH (n:_Node {_project: $project})
+        WHERE elementId(n) = $element_id
+        WITH n, n.name AS old_name
+        SET n.name = $new_name,
+            n._modified = $timestamp,
+            n._version = coalesce(n._version, 0) + 1
+        RETURN old_name
+    """
+
+    RENAME_DESCRIPTION_REFS_FULLTEXT_QUERY = """
+        CALL db.index.fulltext.queryNodes($index, $query) YIELD node
+        WHERE node._project = $project
+        RETURN elementId(node) AS id, node.description AS description
+    """
+
+    RENAME_DESCRIPTION_REFS_QUERY = """
+        MATCH (n:_Node {_project: $project})
+        WHERE n.description CONTAINS $old_name
+        RETURN elementId(n) AS id, n.description AS description
+    """
+
+    RENAME_BRANCH_REFS_FULLTEXT_QUERY = """
+        CALL db.index.fulltext.queryRelationships($index, $query) YIELD relationship AS r
+        WHERE startNode(r)._project = $project
+        WITH r, [key IN keys(r) WHERE key STARTS WITH $prefix AND r[key] = $old_name] AS keys
+        WHERE size(keys) > 0
+        RETURN elementId(r) AS id, keys
+    """
+
+    # Starts from the shows_branch_count index, so only branching lines are read
+    RENAME_BRANCH_REFS_QUERY = """
+        MATCH ()-[r:SHOWS]->()
+        WHERE r.branch_count IS NOT NULL AND startNode(r)._project = $project
+        WITH r, [key IN keys(r) WHERE key STARTS WITH $prefix AND r[key] = $old_name] AS keys
+        WHERE size(keys) > 0
+        RETURN elementId(r) AS id, keys
+    """
+
+    RENAME_SET_DESCRIPTIONS_QUERY = """
+        UNWIND $rows AS row
+        MATCH (n:_Node)
+        WHERE elementId(n) = row.id
+        SET n.description = row.description,
+            n._modified = $timestamp,
+            n._version = coalesce(n._version, 0) + 1
+    """
+
+    RENAME_SET_BRANCHES_QUERY = (
+        """
+        UNWIND $rows AS row
+        MATCH ()-[r]->()
+        WHERE elementId(r) = row.id
+        SET r += row.properties
+    """
+        + SET_BRANCH_NAMES
+    )
+
+    MIGRATE_PROJECT_QUERY = """
+        MATCH (n)
+        WHERE n._project IS NULL OR n._project = ''
+        SET n._project = "default"
+        RETURN count(n) as migrated
+    """
+
+    DELETE_NODE_QUERY = """
+        MATCH (n:_Node {name: $name, _project: $project})
+        DETACH DELETE n
+    """
+
+    DELETE_NODES_QUERY = """
+        UNWIND $names AS name
+        MATCH (n:_Node {name: name, _project: $project})
+        DETACH DELETE n
+        RETURN count(n) AS deleted
+    """
+
+    # A STUMP is an orphan once nothing is connected to it any more
+    COUNT_ORPHAN_STUMPS_QUERY = """
+        MATCH (n:STUMP:_Node {_project: $project})
+        WHERE NOT (n)--()
+        RETURN count(n) AS orphans
+    """
+
+    LIST_ORPHAN_STUMPS_QUERY = """
+        MATCH (n:STUMP:_Node {_project: $project})
+        WHERE NOT (n)--()
+        RETURN n.name AS name
+        ORDER BY name
+        LIMIT $limit
+    """
+
+    DELETE_ORPHAN_STUMPS_QUERY = """
+        MATCH (n:STUMP:_Node {_project: $project})
+        WHERE NOT (n)--()
+        WITH n LIMIT $batch_size
+        DELETE n
+        RETURN count(*) AS deleted
+    """
+
+    # Loads the neighbours most likely to be opened next, in the shape of
+    # LOAD_NODE_QUERY records. Neighbours reached through a relationship type
+    # listed earlier in $type_priority come first, then outgoing before
+    # incoming relationships.
+    PREFETCH_NEIGHBOURS_QUERY = """
+        MATCH (c:_Node {name: $name, _project: $project})-[r]-(n:_Node {_project: $project})
+        WHERE n <> c AND NOT n.name IN $skip
+        WITH n, min(
+                 coalesce(
+                     [i IN range(0, size($type_priority) - 1)
+                      WHERE $type_priority[i] = type(r)][0],
+                     size($type_priority)
+                 ) * 2 + CASE WHEN startNode(r) = c THEN 0 ELSE 1 END
+             ) AS rank
+        ORDER BY rank, n.name
+        LIMIT $limit
+        WITH n, [label IN labels(n) WHERE NOT label STARTS WITH '_'] AS labels,
+             [(n)-[r]->(m) | {end: m.name, type: type(r), dir: '>', props: properties(r)}] AS out_rels,
+             [(n)<-[r2]-(o) | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}] AS in_rels,
+             properties(n) AS all_props
+        RETURN n,
+               out_rels + in_rels AS relationships,
+               labels,
+               all_props
+    """
+
+    # One level of a breadth-first context walk: the given nodes and, unless
+    # the walk stops at this level, their relationships
+    CONTEXT_LEVEL_QUERY = """
+        UNWIND $names AS name
+        MATCH (n:_Node {name: name, _project: $project})
+        OPTIONAL MATCH (n)-[r]-(m:_Node {_project: $project})
+        WHERE $expand
+        RETURN n.name AS name,
+               [label IN labels(n) WHERE NOT label STARTS WITH '_'] AS labels,
+               n.tags AS tags,
+               n.description AS description,
+               collect(CASE WHEN r IS NOT NULL THEN {
+                   type: type(r),
+                   target: m.name,
+                   direction: CASE WHEN startNode(r) = n THEN 'OUTGOING' ELSE 'INCOMING' END
+               } END) AS relationships
+    """
+
+    DEFAULT_NODE_CACHE_BYTES = 16 * 1024 * 1024
+
+    # Registry name of every statement above
+    QUERIES = {
+        "load_node": LOAD_NODE_QUERY,
+        "all_node_names": ALL_NODE_NAMES_QUERY,
+        "node.exists": NODE_EXISTS_QUERY,
+        "node.revision": NODE_REVISION_QUERY,
+        "prefetch.neighbours": PREFETCH_NEIGHBOURS_QUERY,
+        "context.level": CONTEXT_LEVEL_QUERY,
+        "save.upsert": SAVE_UPSERT_QUERY,
+        "save.add_label": SAVE_ADD_LABEL_QUERY,
+        "save.remove_label": SAVE_REMOVE_LABEL_QUERY,
+        "save.remove_rels": SAVE_REMOVE_RELS_QUERY,
+        "save.check_target": SAVE_CHECK_TARGET_QUERY,
+        "save.create_stump": SAVE_CREATE_STUMP_QUERY,
+        "save.merge_outgoing": SAVE_MERGE_OUTGOING_QUERY,
+        "save.merge_incoming": SAVE_MERGE_INCOMING_QUERY,
+        "save.create_stumps": SAVE_CREATE_STUMPS_QUERY,
+        "save.merge_outgoing_batch": SAVE_MERGE_OUTGOING_BATCH_QUERY,
+        "save.merge_incoming_batch": SAVE_MERGE_INCOMING_BATCH_QUERY,
+        "save.update_node": SAVE_UPDATE_NODE_QUERY,
+        "save.delete_outgoing_batch": SAVE_DELETE_OUTGOING_BATCH_QUERY,
+        "save.delete_incoming_batch": SAVE_DELETE_INCOMING_BATCH_QUERY,
+        "save_nodes.create": SAVE_NODES_CREATE_QUERY,
+        "save_nodes.add_label": SAVE_NODES_ADD_LABEL_QUERY,
+        "save_nodes.merge_rels": SAVE_NODES_MERGE_RELS_QUERY,
+        "rename.node": RENAME_NODE_QUERY,
+        "rename.description_refs_fulltext": RENAME_DESCRIPTION_REFS_FULLTEXT_QUERY,
+        "rename.description_refs": RENAME_DESCRIPTION_REFS_QUERY,
+        "rename.branch_refs_fulltext": RENAME_BRANCH_REFS_FULLTEXT_QUERY,
+        "rename.branch_refs": RENAME_BRANCH_REFS_QUERY,
+        "rename.set_descriptions": RENAME_SET_DESCRIPTIONS_QUERY,
+        "rename.set_branches": RENAME_SET_BRANCHES_QUERY,
+        "migrate.project": MIGRATE_PROJECT_QUERY,
+        "delete.node": DELETE_NODE_QUERY,
+        "delete.nodes": DELETE_NODES_QUERY,
+        "gc.count_orphan_stumps": COUNT_ORPHAN_STUMPS_QUERY,
+        "gc.list_orphan_stumps": LIST_ORPHAN_STUMPS_QUERY,
+        "gc.delete_orphan_stumps": DELETE_ORPHAN_STUMPS_QUERY,
+        "relationships": RELATIONSHIPS_QUERY,
+        "node.hierarchy": NODE_HIERARCHY_QUERY,
+        "node.last_modified": LAST_MODIFIED_NODE_QUERY,
+        "search.node_names": NODE_NAMES_QUERY,
+        "search.node_names_fulltext": NODE_NAMES_FULLTEXT_QUERY,
+    }
+
     def __init__(
         self, uri: str, username: str, password: str, config: "Config"
     ) -> None:
@@ -43,11 +532,32 @@ class Neo4jModel:
         self._uri = uri
         self._auth = (username, password)
         self._driver = None
+        self._connection_healthy = False
         self._config = config
         self._project = config.user.PROJECT
+        QueryWorker.terminate_on_cancel = bool(
+            config.get("TERMINATE_CANCELLED_QUERIES", True)
+        )
+        self.coalescer = (
+            QueryCoalescer() if config.get("COALESCE_READ_QUERIES", True) else None
+        )
+        self.node_cache = NodeCache(
+            config.get("NODE_CACHE_MAX_BYTES", self.DEFAULT_NODE_CACHE_BYTES)
+        )
+        self.circuit_breaker = CircuitBreaker.from_config(config)
+        self._set_based_save = bool(config.get("SET_BASED_SAVE", True))
+        self.last_save_statistics: Optional[Dict[str, Any]] = None
+        self.schema_report: Optional[Dict[str, Any]] = None
+        self._fulltext_enabled = bool(config.get("FULLTEXT_SEARCH", True))
+        self.queries = QueryRegistry()
+        for name, template in self.QUERIES.items():
+            self.queries.register(name, template)
+        BaseNeo4jWorker.retry_policy = RetryPolicy.from_config(config)
+        BaseNeo4jWorker.circuit_breaker = self.circuit_breaker
 
         self.connect()
         self.migrate_project_property()
+        self.bootstrap_schema()
 
         logger.info(
             "Neo4jModel initialized and connected to the database.",
@@ -69,7 +579,9 @@ class Neo4jModel:
             ServiceUnavailable: If database is not accessible
         """
         if not self._driver:
-            self._driver = GraphDatabase.driver(self._uri, auth=self._auth)
+            self._driver = GraphDatabase.driver(
+                self._uri, auth=self._auth, **self._pool_settings()
+            )
 
             # Immediately verify connectivity and authentication
             try:
@@ -82,19 +594,53 @@ class Neo4jModel:
                 # Re-raise the exception
                 raise
 
+            self._connection_healthy = True
             logger.info(
                 "Connected to Neo4j database.", module="Neo4jModel", function="connect"
             )
 
+    def _pool_settings(self) -> Dict[str, Any]:
+        """
+        Build the connection pool settings for the shared driver from config.
+
+        Returns:
+            dict: Keyword arguments for ``GraphDatabase.driver``.
+        """
+        return {
+            "max_connection_pool_size": self._config.get(
+                "MAX_CONNECTION_POOL_SIZE", 20
+            ),
+            "connection_acquisition_timeout": self._config.get(
+                "CONNECTION_ACQUISITION_TIMEOUT", 30.0
+            ),
+            "liveness_check_timeout": self._config.get("LIVENESS_CHECK_TIMEOUT", 30.0),
+        }
+
+    @property
+    def driver(self) -> Driver:
+        """
+        The process-wide pooled driver that all workers borrow sessions from.
+
+        Returns:
+            Driver: The shared Neo4j driver.
+        """
+        if not self._driver:
+            self.connect()
+        return self._driver
+
     def ensure_connection(self) -> None:
         """
         Ensure that the connection to the Neo4j database is valid.
         Reconnect if the connection is not valid.
 
+        While the circuit breaker is open, fails fast instead of reconnecting.
+
         Raises:
             AuthError: If authentication fails
             ServiceUnavailable: If database is not accessible
+            CircuitOpenError: If the database was recently found unavailable
         """
+        self.circuit_breaker.check()
         try:
             if self._driver:
                 self._driver.verify_connectivity()
@@ -106,25 +652,146 @@ class Neo4jModel:
                 module="Neo4jModel",
                 function="ensure_connection",
             )
+            self._connection_healthy = False
             # Don't try to reconnect on authentication failure
             if isinstance(e, AuthError):
                 raise
+            self.circuit_breaker.record_failure(e)
             self.connect()
+        else:
+            self._connection_healthy = True
+            self.circuit_breaker.record_success()
+
+    @property
+    def connection_healthy(self) -> bool:
+        """
+        Cached connection state, kept current by the connection health monitor.
+
+        Returns:
+            bool: False if the last check failed or the circuit breaker is open.
+        """
+        return (
+            self._connection_healthy
+            and self.circuit_breaker.state == CircuitBreaker.CLOSED
+        )
+
+    def set_connection_health(self, healthy: bool) -> None:
+        """
+        Record the outcome of a background liveness check.
+
+        Args:
+            healthy (bool): Whether the database answered.
+        """
+        self._connection_healthy = healthy
+
+    @property
+    def fulltext_available(self) -> bool:
+        """
+        Whether searches can use the full-text index.
+
+        Returns:
+            bool: False if full-text search is disabled, the schema was not
+            bootstrapped or the index was reported missing.
+        """
+        return (
+            self._fulltext_enabled
+            and self.schema_report is not None
+            and FULLTEXT_INDEX not in self.schema_report.get("missing", [])
+        )
+
+    @property
+    def branch_index_available(self) -> bool:
+        """
+        Whether renames can find map lines through the branch names index.
+
+        Returns:
+            bool: False under the same conditions as ``fulltext_available``,
+            or if the branch names index was reported missing.
+        """
+        return (
+            self._fulltext_enabled
+            and self.schema_report is not None
+            and BRANCH_NAMES_INDEX not in self.schema_report.get("missing", [])
+        )
+
+    def mark_fulltext_unavailable(self) -> None:
+        """
+        Fall back to substring searches after a full-text query failed
+        because the index does not exist.
+        """
+        if self._fulltext_enabled:
+            logger.warning(
+                "Full-text index unavailable, falling back to substring search",
+                module="Neo4jModel",
+                function="mark_fulltext_unavailable",
+            )
+        self._fulltext_enabled = False
+
+    def check_connection(self) -> QueryWorker:
+        """
+        Create a worker for a minimal liveness query.
+
+        Returns:
+            QueryWorker: Worker that emits ``query_finished`` if the database
+            answers and ``error_occurred`` otherwise.
+        """
+        return QueryWorker(self.driver, "RETURN 1 AS ok")
 
     def get_session(self) -> Any:
         """
-        Get a database session, ensuring connection is valid.
+        Get a database session.
+
+        Connectivity is only verified while the cached connection state is
+        unhealthy; otherwise the pooled driver's own liveness checks apply.
 
         Returns:
             The database session.
         """
-        self.ensure_connection()
+        if not self.connection_healthy:
+            self.ensure_connection()
         return self._driver.session()
 
+    def _query_worker(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> QueryWorker:
+        """
+        Create a read worker on the shared driver.
+
+        Args:
+            query (str): The Cypher query to execute.
+            params (dict, optional): Parameters for the query.
+
+        Returns:
+            QueryWorker: The worker, coalescing with identical reads in flight.
+        """
+        worker = QueryWorker(self.driver, query, params)
+        worker.coalescer = self.coalescer
+        return worker
+
     def close(self) -> None:
         """
         Safely close the driver.
         """
+        if self.coalescer is not None:
+            logger.info(
+                "Read query coalescing summary",
+                module="Neo4jModel",
+                function="close",
+                saved_round_trips=self.coalescer.saved_round_trips,
+            )
+        logger.info(
+            "Node cache summary",
+            module="Neo4jModel",
+            function="close",
+            **self.node_cache.stats(),
+        )
+        logger.info(
+            "Query registry summary",
+            module="Neo4jModel",
+            function="close",
+            distinct_statements=self.queries.distinct_statements,
+            hot_statements=self.queries.stats()[:5],
+        )
         if self._driver:
             try:
                 self._driver.close()
@@ -167,61 +834,571 @@ class Neo4jModel:
 
         return True
 
-    def load_node(self, name: str, callback: Callable) -> QueryWorker:
+    def load_node(
+        self, name: str, callback: Callable
+    ) -> Union[QueryWorker, TransactionWorker]:
         """
         Load a node and its relationships by name using a worker.
 
+        A cached record is passed to the callback right away. The returned
+        worker then only checks the node's ``_version``, ``_modified`` and
+        relationships, and calls the callback again with the reloaded record
+        if the node changed since it was cached.
+
         Args:
             name (str): Name of the node to load.
             callback (function): Function to call with the result.
 
         Returns:
-            QueryWorker: A worker that will execute the query.
+            QueryWorker | TransactionWorker: A worker that will load the node,
+            or revalidate the cached record.
         """
-        query = """
-            MATCH (n {name: $name, _project: $project})
-            WITH n, labels(n) AS labels,
-                 [(n)-[r]->(m) | {end: m.name, type: type(r), dir: '>', props: properties(r)}] AS out_rels,
-                 [(n)<-[r2]-(o) | {end: o.name, type: type(r2), dir: '<', props: properties(r2)}] AS in_rels,
-                 properties(n) AS all_props
-            RETURN n,
-                   out_rels + in_rels AS relationships,
-                   labels,
-                   all_props
-            LIMIT 1
-        """
-        params = {"name": name, "project": self._project}
-        worker = QueryWorker(self._uri, self._auth, query, params)
+        key = (self._project, name)
+        generation = self.node_cache.generation
+        cached = self.node_cache.get(key)
+        if cached is not None:
+            logger.debug(
+                "Node cache hit", module="Neo4jModel", function="load_node", name=name
+            )
+            callback(cached)
+            worker = TransactionWorker(
+                self.driver,
+                self._revalidate_node_transaction,
+                name,
+                self._node_revision(cached),
+            )
+
+            def handle_revalidated(records: Optional[List[Any]]) -> None:
+                if records is not None:
+                    self.node_cache.put(key, records, generation)
+                    callback(records)
 
+            worker.transaction_finished.connect(handle_revalidated)
+            return worker
+
+        params = {"name": name, "project": self._project}
+        worker = self._query_worker(self.queries.get("load_node"), params)
+        worker.query_finished.connect(
+            lambda records: self.node_cache.put(key, records, generation)
+        )
         worker.query_finished.connect(callback)
         return worker
 
-    def save_node(self, node_data: Dict[str, Any], callback: Callable) -> WriteWorker:
+    def get_node_records(self, name: str) -> List[Any]:
+        """
+        Load a node and its relationships by name synchronously.
+
+        Records are served from and added to the node cache. Unlike
+        ``load_node``, a cached record is not revalidated; writes through
+        this model invalidate it.
+
+        Args:
+            name (str): Name of the node to load.
+
+        Returns:
+            list: The records of the load query, empty if there is no node.
+        """
+        key = (self._project, name)
+        generation = self.node_cache.generation
+        cached = self.node_cache.get(key)
+        if cached is not None:
+            return cached
+        with self.get_session() as session:
+            records = list(
+                session.run(
+                    self.queries.get("load_node"), name=name, project=self._project
+                )
+            )
+        self.node_cache.put(key, records, generation)
+        return records
+
+    def prefetch_neighbours(
+        self, name: str, limit: int, type_priority: Optional[List[str]] = None
+    ) -> Optional[QueryWorker]:
+        """
+        Load the neighbours of a node into the node cache using a worker.
+
+        All neighbours are loaded with one query. Neighbours that are already
+        cached are skipped.
+
+        Args:
+            name (str): Name of the node whose neighbours to load.
+            limit (int): Maximum number of neighbours to load.
+            type_priority (list, optional): Relationship types whose
+                neighbours are loaded first, most likely opened first.
+
+        Returns:
+            QueryWorker: A worker that will load the neighbours, or None if
+            there is nothing to load.
+        """
+        if limit <= 0 or not self.node_cache.max_bytes:
+            return None
+        cached = self.node_cache.peek((self._project, name))
+        if cached == []:
+            # The node does not exist
+            return None
+        neighbours = {
+            rel["end"] for record in cached or [] for rel in record["relationships"]
+        }
+        neighbours.discard(name)
+        skip = [n for n in neighbours if self.node_cache.peek((self._project, n))]
+        if cached and len(skip) == len(neighbours):
+            return None
+
+        generation = self.node_cache.generation
+        params = {
+            "name": name,
+            "project": self._project,
+            "limit": int(limit),
+            "type_priority": list(type_priority or []),
+            "skip": skip,
+        }
+        worker = self._query_worker(self.queries.get("prefetch.neighbours"), params)
+        worker.query_finished.connect(
+            lambda records: self._cache_prefetched(name, records, generation)
+        )
+        return worker
+
+    def _cache_prefetched(self, name: str, records: List[Any], generation: int) -> int:
+        """
+        Put prefetched neighbour records into the node cache.
+
+        Args:
+            name (str): Name of the node whose neighbours were loaded.
+            records (list): Records of the prefetch query.
+            generation (int): Cache generation read before the query started.
+
+        Returns:
+            int: Number of neighbours cached.
+        """
+        cached = sum(
+            self.node_cache.put(
+                (self._project, record["n"]["name"]), [record], generation
+            )
+            for record in records
+        )
+        logger.debug(
+            "Prefetched neighbours",
+            module="Neo4jModel",
+            function="prefetch_neighbours",
+            name=name,
+            loaded=len(records),
+            cached=cached,
+        )
+        return cached
+
+    def get_context_subgraph(
+        self, name: str, depth: int, max_nodes: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Load the neighbourhood of a node up to a depth synchronously.
+
+        The walk is breadth-first with one query per level, all in one read
+        transaction.
+
+        Args:
+            name (str): Name of the node to start from.
+            depth (int): Maximum number of relationship hops.
+            max_nodes (int): Maximum number of nodes to load.
+
+        Returns:
+            list: Nodes in the order they were reached, see
+            ``_context_subgraph_transaction``.
+        """
+        with self.get_session() as session:
+            return session.execute_read(
+                self._context_subgraph_transaction, name, depth, max_nodes
+            )
+
+    def _context_subgraph_transaction(
+        self, tx: Any, name: str, depth: int, max_nodes: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Private transaction handler for get_context_subgraph.
+
+        Args:
+            tx: The transaction object.
+            name (str): Name of the node to start from.
+            depth (int): Maximum number of relationship hops.
+            max_nodes (int): Maximum number of nodes to load.
+
+        Returns:
+            list: Dicts with ``name``, ``labels``, ``tags``, ``description``,
+            the ``depth`` and the ``path`` of relationships the node was
+            reached by, as (type, direction) pairs, and its ``relationships``
+            with ``type``, ``target`` and ``direction``.
+        """
+        paths = {name: []}
+        level = [name]
+        nodes = []
+        for current_depth in range(max(0, depth) + 1):
+            if not level:
+                break
+            records = {
+                record["name"]: record
+                for record in tx.run(
+                    self.queries.get("context.level"),
+                    names=level,
+                    project=self._project,
+                    expand=current_depth < depth,
+                )
+            }
+            next_level = []
+            for node_name in level:
+                record = records.get(node_name)
+                if record is None:
+                    continue
+                relationships = record["relationships"]
+                nodes.append(
+                    {
+                        "name": node_name,
+                        "labels": record["labels"],
+                        "tags": record["tags"] or [],
+                        "description": record["description"] or "",
+                        "depth": current_depth,
+                        "path": paths[node_name],
+                        "relationships": relationships,
+                    }
+                )
+                for rel in relationships:
+                    target = rel["target"]
+                    if target in paths or len(paths) >= max_nodes:
+                        continue
+                    paths[target] = paths[node_name] + [(rel["type"], rel["direction"])]
+                    next_level.append(target)
+            level = next_level
+        return nodes
+
+    @staticmethod
+    def _node_revision(records: List[Any]) -> Optional[Tuple[Any, Any, str]]:
+        """
+        Get what identifies the version of a loaded node.
+
+        Args:
+            records (list): Records of the load query.
+
+        Returns:
+            tuple: ``_version``, ``_modified`` and the signature of the
+            relationships, or None if the node did not exist.
+        """
+        if not records:
+            return None
+        record = records[0]
+        return (
+            record["all_props"].get("_version"),
+            record["all_props"].get("_modified"),
+            relationship_signature(record["relationships"]),
+        )
+
+    def _revalidate_node_transaction(
+        self, tx: Any, name: str, revision: Optional[Tuple[Any, Any, str]]
+    ) -> Optional[List[Any]]:
+        """
+        Private transaction handler checking a cached node record.
+
+        Args:
+            tx: The transaction object.
+            name (str): Name of the node.
+            revision (tuple): ``_node_revision`` of the cached record.
+
+        Returns:
+            list: The reloaded records if the node changed, else None.
+        """
+        params = {"name": name, "project": self._project}
+        record = tx.run(self.queries.get("node.revision"), **params).single()
+        current = None
+        if record is not None:
+            current = (
+                record["version"],
+                record["modified"],
+                relationship_signature(record["relationships"]),
+            )
+        if current == revision:
+            return None
+        return list(tx.run(self.queries.get("load_node"), **params))
+
+    def _cache_keys(self, names: Iterable[str]) -> Set[Tuple[str, str]]:
+        """
+        Get the cache keys of nodes and of the nodes their cached records
+        are connected to, whose relationship lists change with them.
+
+        Args:
+            names (iterable): Names of written nodes, including the targets
+                of written relationships.
+
+        Returns:
+            set: (project, name) keys to invalidate.
+        """
+        keys = set()
+        for name in names:
+            key = (self._project, name)
+            keys.add(key)
+            for record in self.node_cache.peek(key) or []:
+                keys.update(
+                    (self._project, rel["end"]) for rel in record["relationships"]
+                )
+        return keys
+
+    def _invalidate_on_write(self, worker: Any, signal: str, keys: Set) -> None:
+        """
+        Invalidate cached records now and again once a write completed, so a
+        load running meanwhile cannot cache what the write replaced.
+
+        Args:
+            worker: The write worker.
+            signal (str): Name of the worker's completion signal.
+            keys (set): Cache keys, see ``_cache_keys``.
+        """
+        self.node_cache.invalidate(keys)
+        getattr(worker, signal).connect(lambda *_: self.node_cache.invalidate(keys))
+
+    @staticmethod
+    def _written_names(node_data: Dict[str, Any]) -> List[str]:
+        """Name of a saved node and of its relationship targets."""
+        return [node_data["name"]] + [
+            rel[1] for rel in node_data.get("relationships", [])
+        ]
+
+    def save_node(
+        self,
+        node_data: Dict[str, Any],
+        callback: Callable,
+        conflict_callback: Optional[Callable] = None,
+    ) -> WriteWorker:
         """
         Save or update a node and its relationships using a worker.
 
+        If the node data carries the ``version`` the node was loaded with, the
+        save only succeeds if nobody changed the node since.
+
         Args:
             node_data (dict): Node data including properties and relationships.
-            callback (function): Function to call when done.
+            callback (function): Function to call with the node's version
+                after the save.
+            conflict_callback (function, optional): Function to call with a
+                NodeVersionConflict if the node was changed meanwhile.
+
+        Returns:
+            WriteWorker: A worker that will execute the write operation.
+        """
+        self.validate_node_data(node_data)
+        worker = WriteWorker(self.driver, self._save_node_transaction, node_data)
+        self._invalidate_on_write(
+            worker, "write_finished", self._cache_keys(self._written_names(node_data))
+        )
+        worker.write_finished.connect(callback)
+        if conflict_callback:
+            worker.write_conflict.connect(conflict_callback)
+        return worker
+
+    def save_node_changes(
+        self,
+        original_data: Dict[str, Any],
+        node_data: Dict[str, Any],
+        callback: Callable,
+        conflict_callback: Optional[Callable] = None,
+    ) -> WriteWorker:
+        """
+        Save only what changed since a node was loaded, using a worker.
+
+        Relationships and properties that did not change are left untouched.
+        Falls back to a full save if the node does not exist yet. The save is
+        checked against the node's version like ``save_node``.
+
+        Args:
+            original_data (dict): Node data as loaded.
+            node_data (dict): Node data to save.
+            callback (function): Function to call with the node's version
+                after the save; unchanged if nothing changed.
+            conflict_callback (function, optional): Function to call with a
+                NodeVersionConflict if the node was changed meanwhile.
 
         Returns:
             WriteWorker: A worker that will execute the write operation.
         """
         self.validate_node_data(node_data)
         worker = WriteWorker(
-            self._uri, self._auth, self._save_node_transaction, node_data
+            self.driver, self._save_node_changes_transaction, original_data, node_data
         )
+        names = self._written_names(node_data) + self._written_names(original_data)
+        self._invalidate_on_write(worker, "write_finished", self._cache_keys(names))
         worker.write_finished.connect(callback)
+        if conflict_callback:
+            worker.write_conflict.connect(conflict_callback)
         return worker
 
-    def _save_node_transaction(self, tx: Any, node_data: Dict[str, Any]) -> None:
+    def _save_node_changes_transaction(
+        self, tx: Any, original_data: Dict[str, Any], node_data: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Private transaction handler for save_node_changes.
+
+        Args:
+            tx: The transaction object.
+            original_data (dict): Node data as loaded.
+            node_data (dict): Node data to save.
+
+        Returns:
+            int: The version the node has after the save.
+        """
+        name = node_data["name"]
+        diff = diff_node_data(
+            original_data, node_data, self._filter_additional_properties
+        )
+        if diff.is_empty:
+            # Nothing is written, so the version stays as loaded
+            self._record_save_statistics(diff, incremental=True)
+            return node_data.get("version")
+
+        # 1. Core and additional properties; removed ones are set to null
+        record = tx.run(
+            self.queries.get("save.update_node"),
+            name=name,
+            project=self._project,
+            properties=diff.properties,
+            modified=datetime.now().isoformat(),
+            version=node_data.get("version"),
+        ).single()
+        if not record:
+            # Not in the database yet, e.g. a new node typed into the form
+            version = self._save_node_transaction(tx, node_data)
+            self._record_save_statistics(diff, incremental=False)
+            return version
+        self._check_version(record, node_data, original_data)
+
+        # 2. Labels
+        for query_labels in self._label_change_queries(
+            diff.labels_before, diff.labels_after
+        ):
+            tx.run(query_labels, name=name, project=self._project)
+
+        # 3. Removed relationships
+        removed = [
+            (rel_type, target, direction, {})
+            for rel_type, target, direction in diff.relationships_removed
+        ]
+        for (rel_type, direction), rows in self._group_relationships(removed).items():
+            tx.run(
+                self._relationship_delete_query(rel_type, direction),
+                name=name,
+                rels=rows,
+                project=self._project,
+            )
+
+        # 4. Added and updated relationships
+        self._save_relationships(tx, name, diff.relationships_written)
+        self._record_save_statistics(diff, incremental=True)
+        return record["version"]
+
+    def _check_version(
+        self,
+        record: Any,
+        node_data: Dict[str, Any],
+        original_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Raise if a versioned save statement found a newer node version.
+
+        Args:
+            record: Result of the ``save.upsert`` or ``save.update_node`` statement.
+            node_data (dict): Node data that was to be saved.
+            original_data (dict, optional): Node data as loaded.
+
+        Raises:
+            NodeVersionConflict: If the statement wrote nothing.
+        """
+        if record is None or record["written"]:
+            return
+        server = record["server"]
+        server_data = self._server_node_data(server, record["version"])
+        logger.warning(
+            "Node version conflict",
+            module="Neo4jModel",
+            function="_check_version",
+            name=node_data["name"],
+            expected_version=node_data.get("version"),
+            server_version=record["version"],
+        )
+        raise NodeVersionConflict(
+            node_data["name"],
+            node_data.get("version"),
+            record["version"],
+            server_data,
+            node_data,
+            original_data,
+        )
+
+    def _server_node_data(self, server: Dict[str, Any], version: int) -> Dict[str, Any]:
+        """
+        Convert the server's copy of a node into node data format.
+
+        Args:
+            server (dict): ``properties``, ``labels`` and ``relationships``.
+            version (int): The node's version.
+
+        Returns:
+            dict: Node data like the result of ``collect_node_data``.
+        """
+        properties = dict(server["properties"])
+        return {
+            "name": properties.get("name"),
+            "description": properties.get("description", ""),
+            "tags": properties.get("tags") or [],
+            "labels": list(server["labels"]),
+            "relationships": [
+                (
+                    rel["type"],
+                    rel["end"],
+                    rel["dir"],
+                    visible_properties(rel["props"] or {}),
+                )
+                for rel in server["relationships"]
+            ],
+            "additional_properties": self._filter_additional_properties(properties),
+            "version": version,
+        }
+
+    def _record_save_statistics(self, diff: NodeDiff, incremental: bool) -> None:
+        """
+        Log and keep the statistics of a save.
+
+        Args:
+            diff (NodeDiff): The changes of the save.
+            incremental (bool): False if the save fell back to a full save.
+        """
+        self.last_save_statistics = {
+            "name": diff.name,
+            "incremental": incremental,
+            "rows_touched": diff.rows_touched,
+            "bytes_written": diff.bytes_written,
+            "properties_changed": len(diff.properties),
+            "relationships_added": len(diff.relationships_added),
+            "relationships_updated": len(diff.relationships_updated),
+            "relationships_removed": len(diff.relationships_removed),
+        }
+        logger.info(
+            "Node save statistics",
+            module="Neo4jModel",
+            function="_save_node_changes_transaction",
+            **self.last_save_statistics,
+        )
+
+    def _save_node_transaction(
+        self, tx: Any, node_data: Dict[str, Any]
+    ) -> Optional[int]:
         """
         Private transaction handler for save_node.
-        Preserves and updates system properties (_created, _modified, _author) while replacing all others.
+
+        Properties, system properties and the version check are handled by a
+        single write statement, which also reports the label changes. Unless
+        labels change, no statement runs before the relationships are written.
 
         Args:
             tx: The transaction object.
             node_data (dict): Node data including properties and relationships.
+
+        Returns:
+            int: The version the node has after the save.
         """
         logger.debug(
             "Starting Save Node Transaction",
@@ -229,181 +1406,493 @@ class Neo4jModel:
             function="_save_node_transaction",
         )
 
-        # Extract data from node_data
         name = node_data["name"]
-        description = node_data["description"]
-        tags = node_data["tags"]
-        additional_properties = node_data["additional_properties"]
         relationships = node_data["relationships"]
-        labels = node_data["labels"]
-
-        # 1. Get existing system properties
-        # Updated to specifically check for _created timestamp
-        query_get_system = """
-        MATCH (n {name: $name, _project: $project})
-        RETURN n._created as created
-        """
-        result = tx.run(query_get_system, name=name, project=self._project)
-        record = result.single()
-
-        # 2. Prepare system properties
-        system_props = {
-            "_author": "System",  # Always set author
-            "_modified": datetime.now().isoformat(),  # Always update modified time
-            "_project": self._project,  # Always set to active project
+
+        # 1. Create or reset the node, keeping _created
+        record = tx.run(
+            self.queries.get("save.upsert"),
+            name=name,
+            properties=self._node_properties(node_data),
+            labels=list(dict.fromkeys(visible_labels(node_data["labels"]))),
+            now=datetime.now().isoformat(),
+            project=self._project,
+            version=node_data.get("version"),
+        ).single()
+        self._check_version(record, node_data)
+
+        # 2. Labels, only if they changed
+        if record is not None:
+            for query_labels in self._label_queries(
+                record["labels_to_add"], record["labels_to_remove"]
+            ):
+                tx.run(query_labels, name=name, project=self._project)
+
+        # 3. Handle relationships
+        # Remove existing relationships
+        tx.run(self.queries.get("save.remove_rels"), name=name, project=self._project)
+
+        # Create/update relationships
+        if self._set_based_save:
+            self._save_relationships(tx, name, relationships)
+        else:
+            self._save_relationships_per_row(tx, name, relationships)
+
+        logger.debug(
+            "Finished Save Node Transaction",
+            module="Neo4jModel",
+            function="_save_node_transaction",
+        )
+        return record["version"] if record is not None else None
+
+    def save_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+        links: List[Tuple[str, str, str, Dict[str, Any]]],
+        callback: Callable,
+    ) -> TransactionWorker:
+        """
+        Create many nodes and the links between them in one transaction.
+
+        Nodes that do not exist yet are created from their node data. Nodes
+        that exist already, e.g. because a template was applied before, are
+        left unchanged: their properties, labels and relationships are not
+        touched, so no version check is needed. The relationships in the node
+        data and ``links`` are merged, adding those that are missing. Either
+        everything is committed or nothing is.
+
+        Args:
+            nodes (list): Node data dicts as for ``save_node``.
+            links (list): (source, type, target, properties) tuples.
+            callback (function): Function to call with a dict listing the
+                ``created`` and the ``existing`` node names.
+
+        Returns:
+            TransactionWorker: A worker that will execute the write operation.
+
+        Raises:
+            ValueError: If any node data or link is invalid.
+        """
+        for node_data in nodes:
+            self.validate_node_data(node_data)
+        errors = [
+            f"Link {source} -> {target}: relationship type must not be empty."
+            for source, rel_type, target, _ in links
+            if not rel_type or not source or not target
+        ]
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        worker = TransactionWorker(
+            self.driver, self._save_nodes_transaction, nodes, links, write=True
+        )
+        names = [name for node in nodes for name in self._written_names(node)]
+        names += [name for source, _, target, _ in links for name in (source, target)]
+        self._invalidate_on_write(
+            worker, "transaction_finished", self._cache_keys(names)
+        )
+        worker.transaction_finished.connect(callback)
+        return worker
+
+    def _save_nodes_transaction(
+        self,
+        tx: Any,
+        nodes: List[Dict[str, Any]],
+        links: List[Tuple[str, str, str, Dict[str, Any]]],
+    ) -> Dict[str, List[str]]:
+        """
+        Private transaction handler for save_nodes.
+
+        The number of statements depends on the number of distinct labels and
+        relationship types, not on the number of nodes or links.
+
+        Args:
+            tx: The transaction object.
+            nodes (list): Node data dicts.
+            links (list): (source, type, target, properties) tuples.
+
+        Returns:
+            dict: ``created`` and ``existing`` node names.
+        """
+        # The last data given for a name wins
+        nodes_by_name = {node_data["name"]: node_data for node_data in nodes}
+        now = datetime.now().isoformat()
+
+        # 1. Create the nodes that do not exist yet
+        rows = [
+            {
+                "name": name,
+                "properties": {
+                    "name": name,
+                    "description": node_data.get("description", ""),
+                    "tags": node_data.get("tags") or [],
+                    **self._filter_additional_properties(
+                        node_data.get("additional_properties") or {}
+                    ),
+                },
+            }
+            for name, node_data in nodes_by_name.items()
+        ]
+        created = {
+            record["name"]: record["created"]
+            for record in tx.run(
+                self.queries.get("save_nodes.create"),
+                nodes=rows,
+                now=now,
+                project=self._project,
+            )
+        }
+        created_names = [name for name in nodes_by_name if created.get(name)]
+        existing_names = [name for name in nodes_by_name if not created.get(name)]
+        statements = 1
+
+        # 2. Labels of the created nodes, one statement per label
+        labels_to_add: Dict[str, List[str]] = {}
+        for name in created_names:
+            for label in dict.fromkeys(visible_labels(nodes_by_name[name]["labels"])):
+                labels_to_add.setdefault(label, []).append(name)
+        for label, label_names in sorted(labels_to_add.items()):
+            tx.run(
+                self.queries.get("save_nodes.add_label", label=label),
+                names=label_names,
+                project=self._project,
+            )
+        statements += len(labels_to_add)
+
+        # 3. Merge the relationships; existing ones are kept
+        groups = self._group_links(nodes_by_name, links)
+        if groups:
+            endpoints = dict.fromkeys(
+                name
+                for rows in groups.values()
+                for row in rows
+                for name in (row["source"], row["target"])
+                if name not in nodes_by_name
+            )
+            if endpoints:
+                tx.run(
+                    self.queries.get("save.create_stumps"),
+                    stumps=[self._build_stump_props(name) for name in endpoints],
+                    project=self._project,
+                )
+                statements += 1
+            for rel_type, rows in groups.items():
+                tx.run(
+                    self.queries.get("save_nodes.merge_rels", rel_type=rel_type),
+                    rels=rows,
+                    project=self._project,
+                )
+            statements += len(groups)
+
+        logger.info(
+            "Saved nodes in one transaction",
+            module="Neo4jModel",
+            function="_save_nodes_transaction",
+            created=len(created_names),
+            existing=len(existing_names),
+            relationships=sum(len(rows) for rows in groups.values()),
+            statements=statements,
+        )
+        return {"created": created_names, "existing": existing_names}
+
+    @staticmethod
+    def _group_links(
+        nodes_by_name: Dict[str, Dict[str, Any]],
+        links: List[Tuple[str, str, str, Dict[str, Any]]],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Group the relationships of saved nodes and extra links by type.
+
+        Every relationship is turned into an outgoing one, and a relationship
+        given twice, e.g. by both of its nodes, is kept once.
+
+        Args:
+            nodes_by_name (dict): Node data by name.
+            links (list): (source, type, target, properties) tuples.
+
+        Returns:
+            dict: Type to rows with ``source``, ``target`` and ``properties``.
+        """
+        edges = [
+            (name, rel_type, target, properties)
+            if direction == ">"
+            else (target, rel_type, name, properties)
+            for name, node_data in nodes_by_name.items()
+            for rel_type, target, direction, properties in node_data.get(
+                "relationships", []
+            )
+        ] + list(links)
+
+        unique: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for source, rel_type, target, properties in edges:
+            unique[(rel_type, source, target)] = {
+                "source": source,
+                "target": target,
+                "properties": properties or {},
+            }
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for (rel_type, _, _), row in unique.items():
+            groups.setdefault(rel_type, []).append(row)
+        return groups
+
+    def _save_relationships(
+        self, tx: Any, name: str, relationships: List[Tuple[str, str, str, Dict]]
+    ) -> None:
+        """
+        Create a saved node's relationships with set-based statements.
+
+        One statement creates STUMP nodes for all missing targets, then one
+        MERGE per relationship type and direction handles all relationships
+        of that group. The number of round trips does not depend on the
+        number of relationships.
+
+        Args:
+            tx: The transaction object.
+            name (str): Name of the saved node.
+            relationships (list): (type, target, direction, properties) tuples.
+        """
+        if not relationships:
+            return
+
+        tx.run(
+            self.queries.get("save.create_stumps"),
+            stumps=self._stump_batch(relationships),
+            project=self._project,
+        )
+        for (rel_type, direction), rows in self._group_relationships(
+            relationships
+        ).items():
+            tx.run(
+                self._relationship_batch_query(rel_type, direction),
+                name=name,
+                rels=rows,
+                project=self._project,
+            )
+
+    def _save_relationships_per_row(
+        self, tx: Any, name: str, relationships: List[Tuple[str, str, str, Dict]]
+    ) -> None:
+        """
+        Create a saved node's relationships one at a time.
+
+        Costs two to three round trips per relationship. Kept as the fallback
+        for SET_BASED_SAVE = false and as the baseline for benchmarks.
+
+        Args:
+            tx: The transaction object.
+            name (str): Name of the saved node.
+            relationships (list): (type, target, direction, properties) tuples.
+        """
+        for rel in relationships:
+            rel_type, rel_name, direction, properties = rel
+
+            # First check if target exists
+            result = tx.run(
+                self.queries.get("save.check_target"),
+                rel_name=rel_name,
+                project=self._project,
+            )
+            target_exists = result.single() is not None
+
+            # Handle target node
+            if not target_exists:
+                # Create new node with STUMP label
+                tx.run(
+                    self.queries.get("save.create_stump"),
+                    stump_props=self._build_stump_props(rel_name),
+                )
+
+            # Create the relationship
+            tx.run(
+                self._relationship_query(rel_type, direction),
+                name=name,
+                rel_name=rel_name,
+                properties=properties,
+                project=self._project,
+            )
+
+    def _stump_batch(
+        self, relationships: List[Tuple[str, str, str, Dict]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build STUMP properties for every distinct relationship target.
+
+        Args:
+            relationships (list): (type, target, direction, properties) tuples.
+
+        Returns:
+            list: Properties for the ``save.create_stumps`` statement.
+        """
+        targets = dict.fromkeys(rel_name for _, rel_name, _, _ in relationships)
+        return [self._build_stump_props(rel_name) for rel_name in targets]
+
+    @staticmethod
+    def _group_relationships(
+        relationships: List[Tuple[str, str, str, Dict]]
+    ) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """
+        Group relationships by type and direction, keeping their order.
+
+        Args:
+            relationships (list): (type, target, direction, properties) tuples.
+
+        Returns:
+            dict: (type, '>' or '<') to rows with ``target`` and ``properties``.
+        """
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for rel_type, rel_name, direction, properties in relationships:
+            key = (rel_type, ">" if direction == ">" else "<")
+            groups.setdefault(key, []).append(
+                {"target": rel_name, "properties": properties}
+            )
+        return groups
+
+    def _node_properties(self, node_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the properties a full save writes, without system properties.
+
+        Args:
+            node_data (dict): Node data including properties and relationships.
+
+        Returns:
+            dict: ``name``, ``description``, ``tags`` and the additional
+            properties that are not system properties.
+        """
+        return {
+            "name": node_data["name"],
+            "description": node_data["description"],
+            "tags": node_data["tags"],
+            **self._filter_additional_properties(node_data["additional_properties"]),
         }
 
-        # Only set _created if it doesn't exist
-        if not record or record["created"] is None:
-            system_props["_created"] = datetime.now().isoformat()
-        else:
-            system_props["_created"] = record[
-                "created"
-            ]  # Preserve existing creation time
+    def _build_stump_props(self, rel_name: str) -> Dict[str, Any]:
+        """
+        Build the properties of a STUMP placeholder for a missing target.
 
-        # Create a new node if it doesn't exist
-        if not record:
-            query_create = """
-            CREATE (n {name: $name, description: $description, tags: $tags,_project: $project})
-            """
-            tx.run(
-                query_create,
-                name=name,
-                description=description,
-                tags=tags,
-                project=self._project,
-            )
+        Args:
+            rel_name (str): Name of the relationship target.
 
-        # 3. Reset node with core properties and system properties
-        base_props = {
-            "name": name,
-            "description": description,
-            "tags": tags,
-            **system_props,  # Include system properties in base set
+        Returns:
+            dict: Properties for the new STUMP node.
+        """
+        return {
+            "name": rel_name,
+            "_author": "System",
+            "_created": datetime.now().isoformat(),
+            "_modified": datetime.now().isoformat(),
+            "_project": self._project,
         }
 
-        query_reset = """
-        MATCH (n {name: $name, _project: $project})
-        SET n = $base_props
+    def _label_change_queries(
+        self, existing_labels: List[str], labels: List[str]
+    ) -> List[str]:
         """
-        tx.run(query_reset, name=name, base_props=base_props, project=self._project)
+        Build the queries that bring a node's labels in line with ``labels``.
 
-        # 4. Handle labels
-        result = tx.run(
-            "MATCH (n {name: $name,_project:$project}) RETURN labels(n) AS labels",
-            name=name,
-            project=self._project,
+        Each label is added or removed by its own registered statement, so a
+        new combination of labels never produces a new query text.
+
+        Args:
+            existing_labels (list): Labels currently on the node.
+            labels (list): Desired labels.
+
+        Returns:
+            list: Queries taking ``$name`` and ``$project`` parameters.
+        """
+        # System labels such as the schema label are never touched
+        input_labels_set = set(visible_labels(labels))
+        existing_labels_set = set(visible_labels(existing_labels))
+        return self._label_queries(
+            input_labels_set - existing_labels_set,
+            existing_labels_set - input_labels_set,
         )
-        record = result.single()
-        existing_labels = record["labels"] if record else []
 
-        # Determine labels to add and remove
-        input_labels_set = set(labels)
-        existing_labels_set = set(existing_labels)
-        labels_to_add = input_labels_set - existing_labels_set
-        labels_to_remove = existing_labels_set - input_labels_set
+    def _label_queries(
+        self, labels_to_add: List[str], labels_to_remove: List[str]
+    ) -> List[str]:
+        """
+        Build the queries adding and removing the given labels.
 
-        # Add new labels
-        if labels_to_add:
-            labels_str = ":".join([f"`{label}`" for label in labels_to_add])
-            query_add = (
-                f"MATCH (n {{name: $name,_project:$project }}) SET n:{labels_str}"
-            )
-            tx.run(query_add, name=name, project=self._project)
+        Args:
+            labels_to_add (iterable): Labels to add.
+            labels_to_remove (iterable): Labels to remove.
 
-        # Remove old labels
-        if labels_to_remove:
-            labels_str = ", ".join([f"n:`{label}`" for label in labels_to_remove])
-            query_remove = (
-                f"MATCH (n {{name: $name,_project:$project }}) REMOVE {labels_str}"
-            )
-            tx.run(query_remove, name=name, project=self._project)
+        Returns:
+            list: Queries taking ``$name`` and ``$project`` parameters, in
+            label order.
+        """
+        return [
+            self.queries.get("save.add_label", label=label)
+            for label in sorted(labels_to_add)
+        ] + [
+            self.queries.get("save.remove_label", label=label)
+            for label in sorted(labels_to_remove)
+        ]
+
+    @staticmethod
+    def _filter_additional_properties(
+        additional_properties: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Filter out system properties and core fields from additional properties.
 
-        # Add non-system properties
+        Args:
+            additional_properties (dict): User-supplied extra properties.
 
-        # Filter out system properties and description from additional properties
-        filtered_additional_props = {
+        Returns:
+            dict: Properties that may be written with ``SET n +=``.
+        """
+        return {
             k: v
             for k, v in additional_properties.items()
             if not k.startswith("_") and k not in ["description", "tags", "name"]
         }
 
-        if filtered_additional_props:
-            query_props = "MATCH (n {name: $name, _project:$project}) SET n += $additional_properties"
-            tx.run(
-                query_props,
-                name=name,
-                additional_properties=filtered_additional_props,
-                project=self._project,
-            )
+    def _relationship_query(self, rel_type: str, direction: str) -> str:
+        """
+        Get the MERGE query for one relationship of a saved node.
 
-        # 6. Handle relationships
-        # Remove existing relationships
-        query_remove_rels = "MATCH (n {name: $name,_project:$project})-[r]-() DELETE r"
-        tx.run(query_remove_rels, name=name, project=self._project)
+        Args:
+            rel_type (str): Relationship type.
+            direction (str): '>' for outgoing, anything else for incoming.
 
-        # Create/update relationships
-        for rel in relationships:
-            rel_type, rel_name, direction, properties = rel
+        Returns:
+            str: Query taking ``$name``, ``$rel_name``, ``$properties`` and ``$project``.
+        """
+        if direction == ">":
+            return self.queries.get("save.merge_outgoing", rel_type=rel_type)
+        return self.queries.get("save.merge_incoming", rel_type=rel_type)
 
-            # Prepare stump node properties
-            stump_props = {
-                "name": rel_name,
-                "_author": "System",
-                "_created": datetime.now().isoformat(),
-                "_modified": datetime.now().isoformat(),
-                "_project": self._project,
-            }
+    def _relationship_batch_query(self, rel_type: str, direction: str) -> str:
+        """
+        Get the set-based MERGE query for all relationships of one type.
 
-            # First check if target exists
-            check_query = (
-                "MATCH (target {name: $rel_name, _project:$project}) RETURN target"
-            )
-            result = tx.run(check_query, rel_name=rel_name, project=self._project)
-            target_exists = result.single() is not None
+        Args:
+            rel_type (str): Relationship type.
+            direction (str): '>' for outgoing, anything else for incoming.
 
-            # Handle target node
-            if not target_exists:
-                # Create new node with STUMP label
-                create_query = """
-                    CREATE (target:STUMP)
-                    SET target = $stump_props
-                """
-                tx.run(create_query, stump_props=stump_props)
+        Returns:
+            str: Query taking ``$name``, ``$rels`` and ``$project``.
+        """
+        if direction == ">":
+            return self.queries.get("save.merge_outgoing_batch", rel_type=rel_type)
+        return self.queries.get("save.merge_incoming_batch", rel_type=rel_type)
 
-            # Create the relationship
-            if direction == ">":
-                query_rel = (
-                    """
-                    MATCH (n {name: $name,_project:$project}), (target {name: $rel_name, _project:$project})
-                    MERGE (n)-[r:`%s`]->(target)
-                    SET r = $properties
-                """
-                    % rel_type
-                )
-            else:
-                query_rel = (
-                    """
-                    MATCH (n {name: $name,_project:$project}), (target {name: $rel_name, _project:$project})
-                    MERGE (n)<-[r:`%s`]-(target)
-                    SET r = $properties
-                """
-                    % rel_type
-                )
+    def _relationship_delete_query(self, rel_type: str, direction: str) -> str:
+        """
+        Get the set-based DELETE query for relationships of one type.
 
-            tx.run(
-                query_rel,
-                name=name,
-                rel_name=rel_name,
-                properties=properties,
-                project=self._project,
-            )
+        Args:
+            rel_type (str): Relationship type.
+            direction (str): '>' for outgoing, anything else for incoming.
 
-        logger.debug(
-            "Finished Save Node Transaction",
-            module="Neo4jModel",
-            function="_save_node_transaction",
-        )
+        Returns:
+            str: Query taking ``$name``, ``$rels`` and ``$project``.
+        """
+        if direction == ">":
+            return self.queries.get("save.delete_outgoing_batch", rel_type=rel_type)
+        return self.queries.get("save.delete_incoming_batch", rel_type=rel_type)
 
     def delete_node(self, name: str, callback: Callable) -> DeleteWorker:
         """
@@ -416,9 +1905,8 @@ class Neo4jModel:
         Returns:
             DeleteWorker: A worker that will execute the delete operation.
         """
-        worker = DeleteWorker(
-            self._uri, self._auth, self._delete_node_transaction, name
-        )
+        worker = DeleteWorker(self.driver, self._delete_node_transaction, name)
+        self._invalidate_on_write(worker, "delete_finished", self._cache_keys([name]))
         worker.delete_finished.connect(callback)
         return worker
 
@@ -430,8 +1918,106 @@ class Neo4jModel:
             tx: The transaction object.
             name (str): Name of the node to delete.
         """
-        query = "MATCH (n {name: $name, _project:$project   }) DETACH DELETE n"
-        tx.run(query, name=name, project=self._project)
+        tx.run(self.queries.get("delete.node"), name=name, project=self._project)
+
+    def delete_nodes(
+        self,
+        names: List[str],
+        callback: Callable[[Dict[str, int]], None],
+        chunk_size: Optional[int] = None,
+    ) -> BulkDeleteWorker:
+        """
+        Delete many nodes and their relationships in chunked transactions.
+
+        Args:
+            names (list): Names of the nodes to delete.
+            callback (function): Function to call with the delete summary.
+            chunk_size (int, optional): Names per transaction. Defaults to
+                BATCH_CHUNK_SIZE.
+
+        Returns:
+            BulkDeleteWorker: A worker that will execute the delete.
+        """
+        if chunk_size is None:
+            chunk_size = self._config.get(
+                "BATCH_CHUNK_SIZE", BatchWorker.DEFAULT_CHUNK_SIZE
+            )
+        worker = BulkDeleteWorker(
+            self.driver,
+            self.queries.get("delete.nodes"),
+            self._project,
+            names,
+            chunk_size,
+        )
+        self._invalidate_on_write(worker, "delete_finished", self._cache_keys(names))
+        worker.delete_finished.connect(callback)
+        return worker
+
+    def collect_orphan_stumps(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        batch_size: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> StumpCollectorWorker:
+        """
+        Delete the STUMP nodes of the project that nothing is connected to.
+
+        Args:
+            callback (function): Function to call with the collection summary.
+            batch_size (int, optional): Orphans deleted per transaction.
+                Defaults to STUMP_GC_BATCH_SIZE.
+            dry_run (bool): Only count the orphans and list a sample of them.
+
+        Returns:
+            StumpCollectorWorker: A worker that will execute the collection.
+        """
+        if batch_size is None:
+            batch_size = self._config.get(
+                "STUMP_GC_BATCH_SIZE", StumpCollectorWorker.DEFAULT_BATCH_SIZE
+            )
+        worker = StumpCollectorWorker(
+            self.driver,
+            self.queries.get("gc.count_orphan_stumps"),
+            self.queries.get("gc.list_orphan_stumps"),
+            self.queries.get("gc.delete_orphan_stumps"),
+            self._project,
+            batch_size,
+            dry_run,
+        )
+        worker.collection_finished.connect(callback)
+        return worker
+
+    def execute_batch(
+        self,
+        operations: List[Tuple[str, Optional[Dict[str, Any]]]],
+        callback: Callable[[List[Dict[str, Any]]], None],
+        chunk_size: Optional[int] = None,
+    ) -> BatchWorker:
+        """
+        Execute many write operations as chunked UNWIND transactions.
+
+        Operations without a ``project`` parameter get the active project, as
+        in ``execute_read_query``.
+
+        Args:
+            operations: (query, params) pairs, e.g. one retag per node.
+            callback: Function to call with the per-chunk summaries.
+            chunk_size: Operations per transaction. Defaults to BATCH_CHUNK_SIZE.
+
+        Returns:
+            BatchWorker: A worker that will execute the batch.
+        """
+        if chunk_size is None:
+            chunk_size = self._config.get(
+                "BATCH_CHUNK_SIZE", BatchWorker.DEFAULT_CHUNK_SIZE
+            )
+        operations = [
+            (query, {"project": self._project, **(params or {})})
+            for query, params in operations
+        ]
+        worker = BatchWorker(self.driver, operations, chunk_size)
+        worker.batch_finished.connect(callback)
+        return worker
 
     #############################################
     # 3. Node Query Operations
@@ -451,41 +2037,32 @@ class Neo4jModel:
         Returns:
             QueryWorker: A worker that will execute the query.
         """
-        # Validate depth to ensure it's a positive integer
-        if not isinstance(depth, int) or depth < 1:
-            raise ValueError("Depth must be a positive integer (at least 1)")
-
-        # Safely insert the depth into the query string
-        query = f"""
-            MATCH path = (n)-[*1..{depth}]-(connected_node)
-            WHERE n.name = $name
-              AND ALL(r IN relationships(path) WHERE startNode(r) IS NOT NULL AND endNode(r) IS NOT NULL)
-              AND ALL(node IN nodes(path) WHERE node IS NOT NULL)
-              AND n._project = $project
-            WITH path, length(path) AS path_length
-            UNWIND range(1, path_length) AS idx
-            WITH
-                nodes(path)[idx] AS current_node,
-                relationships(path)[idx - 1] AS current_rel,
-                nodes(path)[idx - 1] AS parent_node,
-                idx AS depth
-            RETURN DISTINCT
-                current_node.name AS node_name,
-                labels(current_node) AS labels,
-                parent_node.name AS parent_name,
-                type(current_rel) AS rel_type,
-                CASE
-                    WHEN startNode(current_rel) = parent_node THEN '>' ELSE '<' END AS direction,
-                depth
-            ORDER BY depth ASC
-        """
         params = {"name": node_name, "project": self._project}
 
-        worker = QueryWorker(self._uri, self._auth, query, params)
+        worker = self._query_worker(self._relationships_query(depth), params)
         worker.query_finished.connect(callback)
 
         return worker
 
+    def _relationships_query(self, depth: int) -> str:
+        """
+        Get the relationship tree query for a given depth.
+
+        Args:
+            depth (int): The depth of relationships to retrieve.
+
+        Returns:
+            str: Query taking ``$name`` and ``$project`` parameters.
+
+        Raises:
+            ValueError: If depth is not a positive integer.
+        """
+        # Validate depth to ensure it's a positive integer
+        if not isinstance(depth, int) or depth < 1:
+            raise ValueError("Depth must be a positive integer (at least 1)")
+
+        return self.queries.get("relationships", depth=depth)
+
     def get_node_hierarchy(self) -> Dict[str, Any]:
         """
         Get the hierarchy of nodes grouped by their primary label.
@@ -495,15 +2072,7 @@ class Neo4jModel:
         """
         with self.get_session() as session:
             result = session.run(
-                """
-                MATCH (n)
-                WITH n, labels(n) AS labels
-                WHERE size(labels) > 1
-                AND n._project = $project
-                RETURN DISTINCT head(labels) as category, 
-                       collect(n.name) as nodes
-                ORDER BY category
-            """
+                self.queries.get("node.hierarchy"), project=self._project
             )
             return {record["category"]: record["nodes"] for record in result}
 
@@ -513,6 +2082,10 @@ class Neo4jModel:
         """
         Search for nodes whose names match a given prefix using a worker.
 
+        Uses the full-text index when it is available, ranking the names by
+        relevance and tolerating typos; otherwise names containing the prefix
+        are returned.
+
         Args:
             prefix (str): The search prefix.
             limit (int): Maximum number of results to return.
@@ -521,13 +2094,14 @@ class Neo4jModel:
         Returns:
             QueryWorker: A worker that will execute the query.
         """
-        query = (
-            "MATCH (n) WHERE toLower(n.name) CONTAINS toLower($prefix) "
-            "AND n._project = $project "
-            "RETURN n.name AS name LIMIT $limit"
-        )
         params = {"prefix": prefix, "limit": limit, "project": self._project}
-        worker = QueryWorker(self._uri, self._auth, query, params)
+        lucene_query = build_lucene_query(prefix, ("name",), fuzzy=True)
+        if self.fulltext_available and lucene_query:
+            query = self.queries.get("search.node_names_fulltext")
+            params.update(index=FULLTEXT_INDEX, query=lucene_query)
+        else:
+            query = self.queries.get("search.node_names")
+        worker = self._query_worker(query, params)
         worker.query_finished.connect(callback)
         return worker
 
@@ -545,7 +2119,7 @@ class Neo4jModel:
             suggestions_callback (callable): The function to call with the suggestions when ready.
             error_callback (callable): The function to call in case of errors.
         """
-        worker = SuggestionWorker(self._uri, self._auth, node_data, self._config)
+        worker = SuggestionWorker(self.driver, node_data, self._config)
         worker.suggestions_ready.connect(suggestions_callback)
         worker.error_occurred.connect(error_callback)
 
@@ -565,15 +2139,10 @@ class Neo4jModel:
         Returns:
             dict: The last modified node data or None if no nodes exist.
         """
-        query = """
-        MATCH (n)
-        WHERE n._project = $project
-        RETURN n.name AS name, n._modified AS modified
-        ORDER BY modified DESC
-        LIMIT 1
-        """
         with self.get_session() as session:
-            result = session.run(query, project=self._project)
+            result = session.run(
+                self.queries.get("node.last_modified"), project=self._project
+            )
             record = result.single()
             return dict(record) if record else None
 
@@ -586,15 +2155,9 @@ class Neo4jModel:
         Returns:
             QueryWorker instance
         """
-        query = """
-        MATCH (n) 
-        WHERE n.name IS NOT NULL
-        AND n._project = $project
-        RETURN n.name AS name
-        ORDER BY n.name
-        """
-
-        worker = QueryWorker(self._uri, self._auth, query, {"project": self._project})
+        worker = self._query_worker(
+            self.queries.get("all_node_names"), {"project": self._project}
+        )
         worker.query_finished.connect(
             lambda records: callback([r["name"] for r in records])
         )
@@ -602,15 +2165,9 @@ class Neo4jModel:
 
     def migrate_project_property(self) -> None:
         """Add _project property with 'default' value to nodes missing it."""
-        query = """
-        MATCH (n)
-        WHERE n._project IS NULL OR n._project = ''
-        SET n._project = "default"
-        RETURN count(n) as migrated
-        """
         try:
             with self.get_session() as session:
-                result = session.run(query)
+                result = session.run(self.queries.get("migrate.project"))
                 migrated = result.single()["migrated"]
                 if migrated > 0:
                     logger.info(
@@ -627,6 +2184,25 @@ class Neo4jModel:
                 error=str(e),
             )
 
+    def bootstrap_schema(self) -> None:
+        """
+        Label all managed nodes and create the lookup indexes and constraints.
+
+        Lookups match on the ``_Node`` label, so this runs before the model is
+        used. Failures are logged; the next start tries again.
+        """
+        try:
+            self.schema_report = SchemaManager(
+                self._driver, self._config.get("SCHEMA_MIGRATION_BATCH_SIZE", 10000)
+            ).bootstrap()
+        except Exception as e:
+            logger.error(
+                "Schema bootstrap failed",
+                module="Neo4jModel",
+                function="bootstrap_schema",
+                error=str(e),
+            )
+
     def execute_read_query(
         self, query: str, params: Optional[Dict[str, Any]] = None
     ) -> QueryWorker:
@@ -647,6 +2223,66 @@ class Neo4jModel:
         if "project" not in params:
             params["project"] = self._project
 
+        self._validate_read_query(query)
+
+        # Create worker with basic parameters
+        worker = self._query_worker(query, params or {})
+
+        logger.debug(
+            "query_worker_created",
+            has_signal=hasattr(worker, "query_finished"),
+        )
+
+        return worker
+
+    def execute_streaming_read_query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+    ) -> StreamingQueryWorker:
+        """
+        Execute a read-only Cypher query whose records are emitted in pages.
+
+        Args:
+            query: The Cypher query to execute. Must be a read-only query.
+            params: Optional parameters for the query
+            chunk_size: Records per ``records_chunk`` page. Defaults to the
+                STREAM_CHUNK_SIZE config value.
+            fetch_size: Records fetched from the server per round trip.
+                Defaults to the STREAM_FETCH_SIZE config value.
+
+        Returns:
+            StreamingQueryWorker: Worker that will stream the query result
+
+        Raises:
+            ValueError: If the query appears to be a write operation
+        """
+        params = dict(params or {})
+        params.setdefault("project", self._project)
+
+        self._validate_read_query(query)
+
+        return StreamingQueryWorker(
+            self.driver,
+            query,
+            params,
+            chunk_size=chunk_size or self._config.get("STREAM_CHUNK_SIZE", 200),
+            fetch_size=fetch_size or self._config.get("STREAM_FETCH_SIZE", 1000),
+        )
+
+    @staticmethod
+    def _validate_read_query(query: str) -> None:
+        """
+        Reject queries that look like write operations or unsafe procedure calls.
+
+        Args:
+            query: The Cypher query to check.
+
+        Raises:
+            ValueError: If the query appears to be a write operation
+        """
         # Convert query to uppercase for easier checking
         query_upper = query.upper().strip()
 
@@ -686,49 +2322,201 @@ class Neo4jModel:
                     f"Unsafe procedure call '{call}' not allowed in read-only query"
                 )
 
-        # Create worker with basic parameters
-        worker = QueryWorker(self._uri, self._auth, query, params or {})
+    def preview_rename(
+        self, old_name: str, new_name: str, callback: Callable
+    ) -> TransactionWorker:
+        """
+        Count what renaming a node would change, without changing anything.
 
-        logger.debug(
-            "query_worker_created",
-            has_signal=hasattr(worker, "query_finished"),
-        )
+        Args:
+            old_name (str): Current name of the node.
+            new_name (str): The new name.
+            callback (Callable): Function to call with the preview, a dict with
+                ``descriptions``, ``references``, ``map_lines``,
+                ``name_taken`` and ``full_scan``, which is True if the rename
+                has to search every description of the project because the
+                full-text index is unavailable.
 
+        Returns:
+            TransactionWorker: Worker that will compute the preview.
+        """
+        worker = TransactionWorker(
+            self.driver, self._rename_preview_transaction, old_name, new_name
+        )
+        worker.transaction_finished.connect(callback)
         return worker
 
+    def _rename_preview_transaction(
+        self, tx: Any, old_name: str, new_name: str
+    ) -> Dict[str, Any]:
+        """
+        Private transaction handler for preview_rename.
+
+        Args:
+            tx: The transaction object.
+            old_name (str): Current name of the node.
+            new_name (str): The new name.
+
+        Returns:
+            dict: The preview.
+        """
+        descriptions, branches = self._find_name_references(tx, old_name, new_name)
+        taken = tx.run(
+            self.queries.get("node.exists"), name=new_name, project=self._project
+        ).single()
+        return {
+            "descriptions": len(descriptions),
+            "references": sum(row["references"] for row in descriptions),
+            "map_lines": len(branches),
+            "name_taken": taken is not None and new_name != old_name,
+            "full_scan": not self.fulltext_available,
+        }
+
     def rename_node(
         self, element_id: str, new_name: str, callback: Callable
-    ) -> WriteWorker:
+    ) -> TransactionWorker:
         """
-        Rename a node using its element ID.
+        Rename a node using its element ID and update references to it.
+
+        Descriptions mentioning the old name and map line branches assigned to
+        the node are updated in the same transaction, so either everything is
+        renamed or nothing is. The references are written in statements of at
+        most RENAME_BATCH_SIZE rows.
 
         Args:
             element_id (str): The element ID of the node to rename
             new_name (str): The new name for the node
-            callback (Callable): Function to call when operation completes
+            callback (Callable): Function to call with the rename summary
 
         Returns:
-            WriteWorker: Worker that will execute the rename operation
+            TransactionWorker: Worker that will execute the rename operation
         """
-        query = """
-        MATCH (n)
-        WHERE elementId(n) = $element_id
-        AND n._project = $project
-        SET n.name = $new_name, 
-            n._modified = $timestamp
-        RETURN n
+        worker = TransactionWorker(
+            self.driver,
+            self._rename_node_transaction,
+            element_id,
+            new_name,
+            write=True,
+        )
+        # Descriptions of any node may mention the renamed one
+        self.node_cache.invalidate_project(self._project)
+        worker.transaction_finished.connect(
+            lambda _: self.node_cache.invalidate_project(self._project)
+        )
+        worker.transaction_finished.connect(callback)
+        return worker
+
+    def _rename_node_transaction(
+        self, tx: Any, element_id: str, new_name: str
+    ) -> Dict[str, Any]:
         """
+        Private transaction handler for rename_node.
 
-        params = {
-            "element_id": element_id,
+        Args:
+            tx: The transaction object.
+            element_id (str): The element ID of the node to rename.
+            new_name (str): The new name.
+
+        Returns:
+            dict: ``old_name``, ``new_name`` and the number of
+            ``descriptions``, ``references`` and ``map_lines`` updated.
+
+        Raises:
+            ValueError: If the node no longer exists.
+        """
+        now = datetime.now().isoformat()
+        record = tx.run(
+            self.queries.get("rename.node"),
+            element_id=element_id,
+            new_name=new_name,
+            timestamp=now,
+            project=self._project,
+        ).single()
+        if record is None:
+            raise ValueError("The node to rename no longer exists")
+        old_name = record["old_name"]
+
+        descriptions, branches = self._find_name_references(tx, old_name, new_name)
+        batch_size = self._config.get("RENAME_BATCH_SIZE", 500)
+        for rows in chunked(descriptions, batch_size):
+            tx.run(
+                self.queries.get("rename.set_descriptions"),
+                rows=rows,
+                timestamp=now,
+            )
+        for rows in chunked(branches, batch_size):
+            tx.run(self.queries.get("rename.set_branches"), rows=rows)
+
+        summary = {
+            "old_name": old_name,
             "new_name": new_name,
-            "timestamp": datetime.now().isoformat(),
-            "project": self._project,
+            "descriptions": len(descriptions),
+            "references": sum(row["references"] for row in descriptions),
+            "map_lines": len(branches),
         }
+        logger.info(
+            "Renamed node",
+            module="Neo4jModel",
+            function="_rename_node_transaction",
+            **summary,
+        )
+        return summary
 
-        worker = WriteWorker(
-            self._uri, self._auth, WriteWorker._run_transaction, query, params
+    def _find_name_references(
+        self, tx: Any, old_name: str, new_name: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Find the descriptions and map lines that reference a node by name.
+
+        Descriptions are looked up in the full-text index, so the cost depends
+        on the number of matching nodes; without the index every description
+        of the project is searched. Map lines are looked up by name in the
+        full-text index on their branch names; without it every branching
+        SHOWS relationship is read through the index on ``branch_count``.
+        Candidates from either index are checked for the exact name.
+
+        Args:
+            tx: The transaction object.
+            old_name (str): The name to look for.
+            new_name (str): The name replacing it.
+
+        Returns:
+            tuple: Description updates and branch updates, see
+            ``description_updates`` and ``branch_updates``.
+        """
+        phrase = old_name.replace("\\", "\\\\").replace('"', '\\"')
+        if self.fulltext_available:
+            candidates = tx.run(
+                self.queries.get("rename.description_refs_fulltext"),
+                index=FULLTEXT_INDEX,
+                query=f'description:"{phrase}"',
+                project=self._project,
+            )
+        else:
+            candidates = tx.run(
+                self.queries.get("rename.description_refs"),
+                old_name=old_name,
+                project=self._project,
+            )
+        descriptions = description_updates(
+            [dict(record) for record in candidates], old_name, new_name
         )
-        worker.write_finished.connect(callback)
 
-        return worker
+        if self.branch_index_available:
+            lines = tx.run(
+                self.queries.get("rename.branch_refs_fulltext"),
+                index=BRANCH_NAMES_INDEX,
+                query=f'"{phrase}"',
+                old_name=old_name,
+                prefix=BRANCH_PROPERTY_PREFIX,
+                project=self._project,
+            )
+        else:
+            lines = tx.run(
+                self.queries.get("rename.branch_refs"),
+                old_name=old_name,
+                prefix=BRANCH_PROPERTY_PREFIX,
+                project=self._project,
+            )
+        branches = branch_updates([dict(record) for record in lines], new_name)
+        return descriptions, branches
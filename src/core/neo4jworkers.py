@@ -3,76 +3,146 @@ This module provides worker classes for performing Neo4j database operations in
 It includes classes for querying, writing, deleting, and generating suggestions for nodes.
 """
 
+import re
+import threading
 import traceback
+import uuid
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import structlog
-from PyQt6.QtCore import QThread, pyqtSignal
-from neo4j import GraphDatabase
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from neo4j import READ_ACCESS, WRITE_ACCESS, Driver, Query
 
 from config.config import Config
+from core.node_diff import NodeVersionConflict
+from core.query_coalescer import QueryCoalescer
+from core.retry_policy import CircuitBreaker, RetryPolicy
+from core.schema_manager import visible_labels
+from core.worker_executor import CancellationToken, WorkerExecutor, WorkerPriority
 from utils.converters import DataFrameBuilder
 
 logger = structlog.get_logger()
 
 
-class BaseNeo4jWorker(QThread):
+class BaseNeo4jWorker(QObject):
     """
-    Base class for Neo4j worker threads.
+    Base class for Neo4j workers.
+
+    Workers do not own a driver or a thread. They borrow sessions from the
+    process-wide pooled driver owned by ``Neo4jModel`` and run on the bounded
+    ``WorkerExecutor`` thread pool.
+
+    Result and error signals are routed through the thread that owns the
+    worker and re-checked against the cancellation token there, so a worker
+    that was superseded after its query completed never reaches its callbacks.
 
     Args:
-        uri (str): The URI of the Neo4j database.
-        auth (tuple): A tuple containing the username and password for authentication.
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
     """
 
     error_occurred = pyqtSignal(str)
     progress_updated = pyqtSignal(int)
+    finished = pyqtSignal()
+    result_discarded = pyqtSignal(str)
+    _result_ready = pyqtSignal(str, object)
+
+    # Shared by all workers; set from config by Neo4jModel
+    retry_policy: Optional[RetryPolicy] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+
+    # Whether repeating the operation after an unknown outcome is safe
+    idempotent = True
 
-    def __init__(self, uri: str, auth: Tuple[str, str]) -> None:
+    def __init__(self, driver: Driver) -> None:
         """
-        Initialize the worker with Neo4j connection parameters.
+        Initialize the worker with the shared Neo4j driver.
 
         Args:
-            uri (str): The URI of the Neo4j database.
-            auth (tuple): A tuple containing the username and password for authentication.
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
         """
         super().__init__()
-        self._uri = uri
-        self._auth = auth
-        self._driver: Optional[GraphDatabase.driver] = None
-        self._is_cancelled = False
+        self._driver = driver
+        self.token = CancellationToken()
+        self.priority = WorkerPriority.INTERACTIVE
+        self._deferred = False
+        self._on_done: Optional[Callable[[], None]] = None
+        self._result_ready.connect(self._dispatch_result)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether this worker has been cancelled."""
+        return self.token.is_cancelled
 
-    def connect(self) -> None:
+    def cancel(self) -> None:
         """
-        Create Neo4j driver connection.
+        Cancel current operation without blocking the caller.
         """
-        if not self._driver:
-            self._driver = GraphDatabase.driver(self._uri, auth=self._auth)
+        self.token.cancel()
 
-    def cleanup(self) -> None:
+    def start(self, priority: Optional[int] = None) -> None:
         """
-        Clean up resources.
+        Queue the worker on the shared executor.
+
+        Args:
+            priority (int, optional): Queue priority. Defaults to ``self.priority``.
         """
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        WorkerExecutor.instance().submit(self, priority)
 
-    def cancel(self) -> None:
+    def _deliver(self, signal_name: str, *args: Any) -> None:
         """
-        Cancel current operation.
+        Hand a result over to the owning thread for emission.
+
+        Args:
+            signal_name (str): Name of the public signal to emit.
+            *args: Signal arguments.
+        """
+        self._result_ready.emit(signal_name, args)
+
+    def _resume(self, signal_name: str, *args: Any) -> None:
         """
-        self._is_cancelled = True
-        self.quit()  # Tell thread to quit
-        self.wait()
+        Complete a deferred worker with an outcome produced elsewhere.
+
+        Args:
+            signal_name (str): Name of the public signal to emit.
+            *args: Signal arguments.
+        """
+        self._deliver(signal_name, *args)
+        self.finished.emit()
+        if self._on_done is not None:
+            self._on_done()
+
+    @pyqtSlot(str, object)
+    def _dispatch_result(self, signal_name: str, args: Tuple[Any, ...]) -> None:
+        """
+        Emit a delivered result unless the worker has been cancelled meanwhile.
+
+        Args:
+            signal_name (str): Name of the public signal to emit.
+            args (tuple): Signal arguments.
+        """
+        if self.is_cancelled:
+            logger.debug(
+                "Discarded result of superseded worker",
+                module="BaseNeo4jWorker",
+                function="_dispatch_result",
+                worker=type(self).__name__,
+                signal=signal_name,
+            )
+            self.result_discarded.emit(signal_name)
+            return
+        getattr(self, signal_name).emit(*args)
 
     def run(self) -> None:
         """
         Base run implementation.
+
+        An operation that sets ``_deferred`` hands its completion over to
+        ``_resume`` and does not emit ``finished`` here.
         """
         try:
-            self.connect()
-            self.execute_operation()
+            if not self.is_cancelled:
+                self.execute_operation()
         except Exception as e:
             logger.error(
                 "Error occurred in BaseNeo4jWorker",
@@ -80,9 +150,10 @@ class BaseNeo4jWorker(QThread):
                 module="BaseNeo4jWorker",
                 function="run",
             )
-            self.error_occurred.emit(str(e))
+            self._deliver("error_occurred", str(e))
         finally:
-            self.cleanup()
+            if not self._deferred:
+                self.finished.emit()
 
     def execute_operation(self) -> None:
         """
@@ -90,24 +161,119 @@ class BaseNeo4jWorker(QThread):
         """
         raise NotImplementedError
 
+    def _call_with_retry(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a database operation under the shared retry policy and circuit breaker.
+
+        Args:
+            func (callable): The operation to call.
+            *args: Arguments for the operation.
+
+        Returns:
+            The operation's result.
+
+        Raises:
+            CircuitOpenError: If the server is known to be unavailable.
+            Exception: The last error once it is not retryable or attempts run out.
+        """
+        attempt = 1
+        while True:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.check()
+            try:
+                result = func(*args)
+            except Exception as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(e)
+                policy = self.retry_policy
+                if (
+                    policy is None
+                    or not self._can_retry()
+                    or attempt >= policy.max_attempts
+                    or not policy.is_retryable(e, self.idempotent)
+                ):
+                    raise
+                delay = policy.delay(attempt)
+                logger.warning(
+                    "Retrying Neo4j operation after transient error",
+                    module="BaseNeo4jWorker",
+                    function="_call_with_retry",
+                    worker=type(self).__name__,
+                    attempt=attempt,
+                    delay=round(delay, 3),
+                    error=str(e),
+                )
+                if self.token.wait(delay):
+                    raise
+                attempt += 1
+                continue
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            return result
+
+    @staticmethod
+    def _execute(session: Any, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a unit of work once in an explicit transaction and commit it.
+
+        Managed transactions (``execute_read``/``execute_write``) retry
+        transient errors inside the driver for up to its
+        ``max_transaction_retry_time``, unseen by the retry policy and the
+        circuit breaker. Workers call this under ``_call_with_retry``
+        instead, so the policy is the only retry layer.
+
+        Args:
+            session: The session to run the transaction in; its access mode
+                decides whether the transaction reads or writes.
+            func (callable): The unit of work, called with the transaction.
+            *args: Arguments for the unit of work.
+
+        Returns:
+            The unit of work's result.
+        """
+        with session.begin_transaction() as tx:
+            result = func(tx, *args)
+            tx.commit()
+        return result
+
+    def _can_retry(self) -> bool:
+        """
+        Check whether the operation may still be attempted again.
+
+        Returns:
+            bool: False once the worker has been cancelled.
+        """
+        return not self.is_cancelled
+
 
 class QueryWorker(BaseNeo4jWorker):
     """
     Worker for read operations.
 
+    Each query is tagged with transaction metadata so that, when the worker is
+    cancelled mid-flight, its server-side transaction can be looked up and
+    terminated instead of running to completion.
+
+    With a ``coalescer`` attached, a worker whose (query, params) pair is
+    already running waits for that query's result instead of running its own.
+
     Args:
-        uri (str): The URI of the Neo4j database.
-        auth (tuple): A tuple containing the username and password for authentication.
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
         query (str): The Cypher query to execute.
         params (dict, optional): Parameters for the query. Defaults to None.
     """
 
     query_finished = pyqtSignal(list)
 
+    # Set from the TERMINATE_CANCELLED_QUERIES config key by Neo4jModel
+    terminate_on_cancel = True
+
+    # Set per worker by Neo4jModel when read coalescing is enabled
+    coalescer: Optional[QueryCoalescer] = None
+
     def __init__(
         self,
-        uri: str,
-        auth: Tuple[str, str],
+        driver: Driver,
         query: str,
         params: Optional[Dict[str, Any]] = None,
     ) -> None:
@@ -115,28 +281,97 @@ class QueryWorker(BaseNeo4jWorker):
         Initialize the worker with query parameters.
 
         Args:
-            uri (str): The URI of the Neo4j database.
-            auth (tuple): A tuple containing the username and password for authentication.
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
             query (str): The Cypher query to execute.
             params (dict, optional): Parameters for the query. Defaults to None.
         """
-        super().__init__(uri, auth)
+        super().__init__(driver)
         self.query = query
         self.params = params or {}
+        self._tx_tag = uuid.uuid4().hex
+        self._in_flight = False
+        self._coalesce_key: Optional[str] = None
 
-    def execute_operation(self) -> None:
+    def cancel(self) -> None:
         """
-        Execute the read operation.
+        Cancel the query, terminating its server transaction if it is running.
+
+        A coalesced query is only terminated once every worker waiting on it
+        has been cancelled.
+        """
+        super().cancel()
+        if not self.terminate_on_cancel:
+            return
+        if self._coalesce_key is not None:
+            leader = self.coalescer.abandoned_leader(self._coalesce_key)
+        else:
+            leader = self
+        if leader is not None and leader._in_flight:
+            threading.Thread(
+                target=leader._terminate_server_transaction,
+                name="neo4j-terminate",
+                daemon=True,
+            ).start()
+
+    def _terminate_server_transaction(self) -> None:
+        """
+        Best-effort termination of this worker's transaction on the server.
+
+        Requires a server that supports ``SHOW/TERMINATE TRANSACTIONS``. Any
+        failure is logged and ignored; the result is discarded either way.
         """
         try:
             with self._driver.session() as session:
-                logger.debug(
-                    "Raw query about to execute", query=self.query, params=self.params
+                records = session.run(
+                    "SHOW TRANSACTIONS YIELD transactionId, metaData "
+                    "WHERE metaData.worker_tag = $tag "
+                    "RETURN transactionId",
+                    tag=self._tx_tag,
                 )
-                result = list(session.run(self.query, self.params))
-                logger.debug("Raw query result", result=result)
-                if not self._is_cancelled:
-                    self.query_finished.emit(result)
+                transaction_ids = [record["transactionId"] for record in records]
+                if transaction_ids:
+                    session.run(
+                        "TERMINATE TRANSACTIONS $ids", ids=transaction_ids
+                    ).consume()
+            logger.debug(
+                "Terminated cancelled query on server",
+                module="QueryWorker",
+                function="_terminate_server_transaction",
+                transaction_ids=transaction_ids,
+            )
+        except Exception as e:
+            logger.debug(
+                "Server-side query termination unavailable",
+                module="QueryWorker",
+                function="_terminate_server_transaction",
+                error=str(e),
+            )
+
+    def execute_operation(self) -> None:
+        """
+        Execute the read operation, or wait for an identical one in flight.
+        """
+        if self.coalescer is None:
+            self._execute_query()
+            return
+
+        self._coalesce_key = self.coalescer.fingerprint(self.query, self.params)
+        if not self.coalescer.join(self._coalesce_key, self):
+            self._deferred = True
+            return
+        outcome = self._execute_query()
+        self.coalescer.complete(self._coalesce_key, *outcome)
+
+    def _execute_query(self) -> Tuple[Any, ...]:
+        """
+        Run the query and deliver its result or error.
+
+        Returns:
+            tuple: The delivered signal name and arguments.
+        """
+        try:
+            result = self._call_with_retry(self._run_query)
+            outcome = ("query_finished", result)
         except Exception as e:
             error_message = "".join(
                 traceback.format_exception(type(e), e, e.__traceback__)
@@ -147,46 +382,206 @@ class QueryWorker(BaseNeo4jWorker):
                 module="QueryWorker",
                 function="execute_operation",
             )
-            self.error_occurred.emit(error_message)
+            outcome = ("error_occurred", error_message)
+        self._deliver(*outcome)
+        return outcome
+
+    def _run_query(self) -> List[Any]:
+        """
+        Run the query once in a fresh session.
+
+        Returns:
+            list: The result records.
+        """
+        with self._driver.session() as session:
+            logger.debug(
+                "Raw query about to execute", query=self.query, params=self.params
+            )
+            self._in_flight = True
+            try:
+                result = list(
+                    session.run(
+                        Query(self.query, metadata={"worker_tag": self._tx_tag}),
+                        self.params,
+                    )
+                )
+            finally:
+                self._in_flight = False
+            logger.debug("Raw query result", record_count=len(result))
+            return result
+
+
+class StreamingQueryWorker(QueryWorker):
+    """
+    Worker for read operations with large results.
+
+    Instead of materialising the whole result, records are pulled from the
+    server ``fetch_size`` at a time and emitted in pages of ``chunk_size``
+    through ``records_chunk``, so consumers can render incrementally.
+    ``stream_finished`` carries the total number of records once the result
+    is exhausted. Streaming queries are never coalesced, and a query is only
+    retried while no page has been emitted yet.
+
+    Args:
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
+        query (str): The Cypher query to execute.
+        params (dict, optional): Parameters for the query. Defaults to None.
+        chunk_size (int): Records per emitted page.
+        fetch_size (int): Records requested from the server per round trip.
+    """
+
+    records_chunk = pyqtSignal(list)
+    stream_finished = pyqtSignal(int)
+
+    def __init__(
+        self,
+        driver: Driver,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 200,
+        fetch_size: int = 1000,
+    ) -> None:
+        """
+        Initialize the worker with query parameters and page sizes.
+
+        Args:
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
+            query (str): The Cypher query to execute.
+            params (dict, optional): Parameters for the query. Defaults to None.
+            chunk_size (int): Records per emitted page.
+            fetch_size (int): Records requested from the server per round trip.
+        """
+        super().__init__(driver, query, params)
+        self.chunk_size = max(1, int(chunk_size))
+        self.fetch_size = max(1, int(fetch_size))
+        self._records_emitted = 0
+
+    def execute_operation(self) -> None:
+        """
+        Stream the query result page by page.
+        """
+        try:
+            total = self._call_with_retry(self._stream_records)
+            if not self.is_cancelled:
+                self._deliver("stream_finished", total)
+        except Exception as e:
+            error_message = "".join(
+                traceback.format_exception(type(e), e, e.__traceback__)
+            )
+            logger.error(
+                "Error occurred in StreamingQueryWorker",
+                exc_info=True,
+                module="StreamingQueryWorker",
+                function="execute_operation",
+                records_emitted=self._records_emitted,
+            )
+            self._deliver("error_occurred", error_message)
+
+    def _can_retry(self) -> bool:
+        """
+        Check whether the stream may be restarted.
+
+        Returns:
+            bool: False once a page has been emitted, since a restart would
+            deliver those records twice.
+        """
+        return super()._can_retry() and self._records_emitted == 0
+
+    def _stream_records(self) -> int:
+        """
+        Run the query once in a fresh session and emit its records in pages.
+
+        Stops pulling records as soon as the worker is cancelled; closing the
+        session discards the rest of the result on the server.
+
+        Returns:
+            int: Number of records emitted.
+        """
+        with self._driver.session(fetch_size=self.fetch_size) as session:
+            logger.debug(
+                "Streaming query about to execute",
+                query=self.query,
+                params=self.params,
+                fetch_size=self.fetch_size,
+            )
+            self._in_flight = True
+            try:
+                result = session.run(
+                    Query(self.query, metadata={"worker_tag": self._tx_tag}),
+                    self.params,
+                )
+                chunk: List[Any] = []
+                for record in result:
+                    if self.is_cancelled:
+                        break
+                    chunk.append(record)
+                    if len(chunk) >= self.chunk_size:
+                        self._emit_chunk(chunk)
+                        chunk = []
+                if chunk and not self.is_cancelled:
+                    self._emit_chunk(chunk)
+            finally:
+                self._in_flight = False
+        logger.debug("Streaming query finished", record_count=self._records_emitted)
+        return self._records_emitted
+
+    def _emit_chunk(self, chunk: List[Any]) -> None:
+        self._records_emitted += len(chunk)
+        self._deliver("records_chunk", chunk)
 
 
 class WriteWorker(BaseNeo4jWorker):
     """
     Worker for write operations.
 
+    ``write_finished`` carries the value returned by the write function. A
+    write rejected because the node changed since it was loaded emits
+    ``write_conflict`` with the NodeVersionConflict instead of an error.
+
     Args:
-        uri (str): The URI of the Neo4j database.
-        auth (tuple): A tuple containing the username and password for authentication.
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
         func (callable): The function to execute in the write transaction.
         *args: Arguments for the function.
     """
 
-    write_finished = pyqtSignal(bool)
+    write_finished = pyqtSignal(object)
+    write_conflict = pyqtSignal(object)
 
-    def __init__(
-        self, uri: str, auth: Tuple[str, str], func: Callable[..., Any], *args: Any
-    ) -> None:
+    def __init__(self, driver: Driver, func: Callable[..., Any], *args: Any) -> None:
         """
         Initialize the worker with write function and arguments.
 
         Args:
-            uri (str): The URI of the Neo4j database.
-            auth (tuple): A tuple containing the username and password for authentication.
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
             func (callable): The function to execute in the write transaction.
             *args: Arguments for the function.
         """
-        super().__init__(uri, auth)
+        super().__init__(driver)
         self.func = func
         self.args = args
 
+    idempotent = False
+
     def execute_operation(self) -> None:
         """
         Execute the write operation.
         """
+        try:
+            result = self._call_with_retry(self._write)
+        except NodeVersionConflict as conflict:
+            self._deliver("write_conflict", conflict)
+            return
+        self._deliver("write_finished", result)
+
+    def _write(self) -> Any:
+        """
+        Run the write function once in a write transaction.
+
+        Returns:
+            The write function's result.
+        """
         with self._driver.session() as session:
-            session.execute_write(self.func, *self.args)
-            if not self._is_cancelled:
-                self.write_finished.emit(True)
+            return self._execute(session, self.func, *self.args)
 
     @staticmethod
     def _run_transaction(tx: Any, query: str, params: Dict[str, Any]) -> Any:
@@ -204,43 +599,84 @@ class WriteWorker(BaseNeo4jWorker):
         return tx.run(query, params)
 
 
+class TransactionWorker(BaseNeo4jWorker):
+    """
+    Worker running a function in one transaction and emitting its
+    result, for operations that combine several statements with processing
+    in between.
+
+    Args:
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
+        func (callable): The function to execute in the transaction.
+        *args: Arguments for the function.
+        write (bool): Whether to run a write transaction. Read transactions
+            may be retried after transient errors.
+    """
+
+    transaction_finished = pyqtSignal(object)
+
+    def __init__(
+        self, driver: Driver, func: Callable[..., Any], *args: Any, write: bool = False
+    ) -> None:
+        super().__init__(driver)
+        self.func = func
+        self.args = args
+        self.write = write
+        self.idempotent = not write
+
+    def execute_operation(self) -> None:
+        """
+        Execute the function and deliver its result.
+        """
+        result = self._call_with_retry(self._run)
+        self._deliver("transaction_finished", result)
+
+    def _run(self) -> Any:
+        access_mode = WRITE_ACCESS if self.write else READ_ACCESS
+        with self._driver.session(default_access_mode=access_mode) as session:
+            return self._execute(session, self.func, *self.args)
+
+
 class DeleteWorker(BaseNeo4jWorker):
     """
     Worker for delete operations.
 
     Args:
-        uri (str): The URI of the Neo4j database.
-        auth (tuple): A tuple containing the username and password for authentication.
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
         func (callable): The function to execute in the delete transaction.
         *args: Arguments for the function.
     """
 
     delete_finished = pyqtSignal(bool)
 
-    def __init__(
-        self, uri: str, auth: Tuple[str, str], func: Callable[..., Any], *args: Any
-    ) -> None:
+    def __init__(self, driver: Driver, func: Callable[..., Any], *args: Any) -> None:
         """
         Initialize the worker with delete function and arguments.
 
         Args:
-            uri (str): The URI of the Neo4j database.
-            auth (tuple): A tuple containing the username and password for authentication.
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
             func (callable): The function to execute in the delete transaction.
             *args: Arguments for the function.
         """
-        super().__init__(uri, auth)
+        super().__init__(driver)
         self.func = func
         self.args = args
 
+    idempotent = False
+
     def execute_operation(self) -> None:
         """
         Execute the delete operation.
         """
+        self._call_with_retry(self._write)
+        self._deliver("delete_finished", True)
+
+    def _write(self) -> None:
+        """
+        Run the write function once in a write transaction.
+        """
         with self._driver.session() as session:
-            session.execute_write(self.func, *self.args)
-            if not self._is_cancelled:
-                self.delete_finished.emit(True)
+            self._execute(session, self.func, *self.args)
 
     @staticmethod
     def _run_transaction(tx: Any, query: str, params: Dict[str, Any]) -> Any:
@@ -260,49 +696,324 @@ class DeleteWorker(BaseNeo4jWorker):
 
 class BatchWorker(BaseNeo4jWorker):
     """
-    Worker for batch operations.
+    Worker for batched write operations.
+
+    Consecutive operations sharing the same query text are grouped and sent as
+    one ``UNWIND $batch AS row CALL { ... }`` statement per chunk, with each
+    ``$param`` of the original query rewritten to ``row.param``. Every chunk is
+    its own write transaction, so transient failures are retried for that
+    chunk alone. A chunk that still fails stops the batch; chunks that were
+    already committed stay committed.
 
     Args:
-        driver_config (dict): Configuration for the Neo4j driver.
-        operations (list): List of operations to execute.
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
+        operations (list): List of (query, params) operations to execute.
+        chunk_size (int): Maximum number of operations per transaction.
     """
 
     batch_progress = pyqtSignal(int, int)  # current, total
     batch_finished = pyqtSignal(list)
 
+    DEFAULT_CHUNK_SIZE = 500
+
+    idempotent = False
+
+    COUNTER_FIELDS = (
+        "nodes_created",
+        "nodes_deleted",
+        "relationships_created",
+        "relationships_deleted",
+        "properties_set",
+        "labels_added",
+        "labels_removed",
+    )
+
+    # Quoted strings and escaped names are kept as-is; $params become row fields
+    _PARAM_PATTERN = re.compile(
+        r"('(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"|`[^`]*`)|\$(\w+)"
+    )
+
     def __init__(
         self,
-        driver_config: Dict[str, Any],
+        driver: Driver,
         operations: List[Tuple[str, Optional[Dict[str, Any]]]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> None:
         """
         Initialize the worker with batch operations.
 
         Args:
-            driver_config (dict): Configuration for the Neo4j driver.
-            operations (list): List of operations to execute.
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
+            operations (list): List of (query, params) operations to execute.
+            chunk_size (int): Maximum number of operations per transaction.
         """
-        super().__init__(driver_config)
+        super().__init__(driver)
         self.operations = operations
+        self.chunk_size = max(1, int(chunk_size))
+
+    @classmethod
+    def to_unwind_query(cls, query: str) -> str:
+        """
+        Wrap a single-row query so it runs once per row of ``$batch``.
+
+        Args:
+            query (str): Query using ``$param`` placeholders.
+
+        Returns:
+            str: Query taking a ``$batch`` list of parameter maps.
+        """
+        body = cls._PARAM_PATTERN.sub(
+            lambda m: m.group(1) or f"row.{m.group(2)}", query
+        )
+        return (
+            "UNWIND $batch AS row\n"
+            "CALL {\n"
+            "    WITH row\n"
+            f"    {body.strip()}\n"
+            "}\n"
+            "RETURN count(*) AS processed"
+        )
+
+    def group_operations(self) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Split the operations into chunks of consecutive identical queries.
+
+        Order between different queries is preserved, so a node created by one
+        group is visible to the relationships created by the next.
+
+        Returns:
+            list: (unwind query, parameter rows) per chunk.
+        """
+        chunks: List[Tuple[str, List[Dict[str, Any]]]] = []
+        current_query: Optional[str] = None
+        rows: List[Dict[str, Any]] = []
+        for query, params in self.operations:
+            if query != current_query or len(rows) >= self.chunk_size:
+                if rows:
+                    chunks.append((self.to_unwind_query(current_query), rows))
+                current_query, rows = query, []
+            rows.append(params or {})
+        if rows:
+            chunks.append((self.to_unwind_query(current_query), rows))
+        return chunks
+
+    @classmethod
+    def _run_chunk(
+        cls, tx: Any, query: str, rows: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Run one chunk inside a write transaction.
+
+        Args:
+            tx: The transaction object.
+            query (str): The UNWIND query.
+            rows (list): Parameter maps, one per operation.
+
+        Returns:
+            dict: Update counters of the chunk.
+        """
+        counters = tx.run(query, batch=rows).consume().counters
+        return {field: getattr(counters, field) for field in cls.COUNTER_FIELDS}
 
     def execute_operation(self) -> None:
         """
-        Execute the batch operations.
+        Execute the batch operations chunk by chunk.
         """
-        results = []
+        summaries = []
         total = len(self.operations)
+        done = 0
 
         with self._driver.session() as session:
-            for i, (query, params) in enumerate(self.operations, 1):
-                if self._is_cancelled:
+            for query, rows in self.group_operations():
+                if self.is_cancelled:
                     break
 
-                result = session.run(query, params or {})
-                results.extend(list(result))
-                self.batch_progress.emit(i, total)
+                counters = self._call_with_retry(
+                    self._execute, session, self._run_chunk, query, rows
+                )
+                summaries.append({"operations": len(rows), **counters})
+                done += len(rows)
+                self._deliver("batch_progress", done, total)
+
+        logger.debug(
+            "Batch write finished",
+            module="BatchWorker",
+            function="execute_operation",
+            operations=done,
+            chunks=len(summaries),
+        )
+        self._deliver("batch_finished", summaries)
+
+
+class BulkDeleteWorker(BaseNeo4jWorker):
+    """
+    Worker deleting many nodes by name in chunked transactions.
+
+    Each chunk is its own write transaction, so a large delete never
+    holds one huge transaction and a transient failure only repeats one chunk.
+    Cancelling stops after the current chunk; chunks already committed stay
+    deleted.
 
-        if not self._is_cancelled:
-            self.batch_finished.emit(results)
+    Args:
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
+        query (str): Delete statement taking ``$names`` and ``$project`` and
+            returning the ``deleted`` count.
+        project (str): The active project.
+        names (list): Names of the nodes to delete.
+        chunk_size (int): Maximum number of names per transaction.
+    """
+
+    batch_progress = pyqtSignal(int, int)  # current, total
+    delete_finished = pyqtSignal(dict)
+
+    # Deleting the same names again is harmless
+    idempotent = True
+
+    def __init__(
+        self,
+        driver: Driver,
+        query: str,
+        project: str,
+        names: List[str],
+        chunk_size: int = BatchWorker.DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(driver)
+        self.query = query
+        self.project = project
+        self.names = list(dict.fromkeys(names))
+        self.chunk_size = max(1, int(chunk_size))
+
+    def _run_chunk(self, tx: Any, names: List[str]) -> int:
+        record = tx.run(self.query, names=names, project=self.project).single()
+        return record["deleted"] if record else 0
+
+    def execute_operation(self) -> None:
+        """
+        Execute the delete chunk by chunk.
+        """
+        total = len(self.names)
+        done = 0
+        deleted = 0
+
+        with self._driver.session() as session:
+            for start in range(0, total, self.chunk_size):
+                if self.is_cancelled:
+                    break
+                chunk = self.names[start : start + self.chunk_size]
+                deleted += self._call_with_retry(
+                    self._execute, session, self._run_chunk, chunk
+                )
+                done += len(chunk)
+                self._deliver("batch_progress", done, total)
+
+        logger.debug(
+            "Bulk delete finished",
+            module="BulkDeleteWorker",
+            function="execute_operation",
+            requested=total,
+            deleted=deleted,
+        )
+        self._deliver(
+            "delete_finished",
+            {"requested": total, "processed": done, "deleted": deleted},
+        )
+
+
+class StumpCollectorWorker(BaseNeo4jWorker):
+    """
+    Worker removing orphaned STUMP nodes of a project.
+
+    STUMP placeholders are created for missing relationship targets and
+    become garbage once nothing is connected to them any more. The orphans
+    are counted first, then deleted ``batch_size`` at a time, each batch in
+    its own transaction so a large cleanup never locks many nodes at once.
+    A dry run only counts the orphans and reports a sample of their names.
+
+    Args:
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
+        count_query (str): Query returning the ``orphans`` count.
+        list_query (str): Query returning orphan ``name`` rows, up to ``$limit``.
+        delete_query (str): Query deleting up to ``$batch_size`` orphans and
+            returning the ``deleted`` count.
+        project (str): The active project.
+        batch_size (int): Orphans deleted per transaction, at most
+            MAX_BATCH_SIZE.
+        dry_run (bool): Whether to only report what would be deleted.
+    """
+
+    batch_progress = pyqtSignal(int, int)  # current, total
+    collection_finished = pyqtSignal(dict)
+
+    DEFAULT_BATCH_SIZE = 1000
+    MAX_BATCH_SIZE = 10000
+    SAMPLE_SIZE = 50
+
+    # An orphan batch deleted twice simply finds fewer orphans
+    idempotent = True
+
+    def __init__(
+        self,
+        driver: Driver,
+        count_query: str,
+        list_query: str,
+        delete_query: str,
+        project: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> None:
+        super().__init__(driver)
+        self.count_query = count_query
+        self.list_query = list_query
+        self.delete_query = delete_query
+        self.project = project
+        self.batch_size = min(max(1, int(batch_size)), self.MAX_BATCH_SIZE)
+        self.dry_run = dry_run
+
+    def _count(self, tx: Any) -> int:
+        record = tx.run(self.count_query, project=self.project).single()
+        return record["orphans"] if record else 0
+
+    def _sample(self, tx: Any) -> List[str]:
+        result = tx.run(self.list_query, project=self.project, limit=self.SAMPLE_SIZE)
+        return [record["name"] for record in result]
+
+    def _delete_batch(self, tx: Any) -> int:
+        record = tx.run(
+            self.delete_query, project=self.project, batch_size=self.batch_size
+        ).single()
+        return record["deleted"] if record else 0
+
+    def execute_operation(self) -> None:
+        """
+        Count the orphans, then delete them batch by batch unless dry running.
+        """
+        summary = {"orphans": 0, "deleted": 0, "batches": 0, "dry_run": self.dry_run}
+
+        with self._driver.session() as session:
+            orphans = self._call_with_retry(self._execute, session, self._count)
+            summary["orphans"] = orphans
+            if self.dry_run:
+                summary["names"] = self._call_with_retry(
+                    self._execute, session, self._sample
+                )
+            else:
+                while summary["deleted"] < orphans and not self.is_cancelled:
+                    deleted = self._call_with_retry(
+                        self._execute, session, self._delete_batch
+                    )
+                    summary["batches"] += 1
+                    summary["deleted"] += deleted
+                    self._deliver("batch_progress", summary["deleted"], orphans)
+                    if deleted < self.batch_size:
+                        break
+
+        logger.info(
+            "STUMP collection finished",
+            module="StumpCollectorWorker",
+            function="execute_operation",
+            **{key: value for key, value in summary.items() if key != "names"},
+        )
+        self._deliver("collection_finished", summary)
 
 
 class SuggestionWorker(BaseNeo4jWorker):
@@ -310,25 +1021,23 @@ class SuggestionWorker(BaseNeo4jWorker):
     Worker for generating suggestions based on node data.
 
     Args:
-        uri (str): The URI of the Neo4j database.
-        auth (tuple): A tuple containing the username and password for authentication.
+        driver (Driver): The shared Neo4j driver to borrow sessions from.
         node_data (dict): The data of the node for which to generate suggestions.
     """
 
     suggestions_ready = pyqtSignal(dict)
 
     def __init__(
-        self, uri: str, auth: Tuple[str, str], node_data: Dict[str, Any], config: Config
+        self, driver: Driver, node_data: Dict[str, Any], config: Config
     ) -> None:
         """
         Initialize the worker with node data.
 
         Args:
-            uri (str): The URI of the Neo4j database.
-            auth (tuple): A tuple containing the username and password for authentication.
+            driver (Driver): The shared Neo4j driver to borrow sessions from.
             node_data (dict): The data of the node for which to generate suggestions.
         """
-        super().__init__(uri, auth)
+        super().__init__(driver)
         self.node_data = node_data
         self.config = config
         self._project = config.user.PROJECT
@@ -390,9 +1099,7 @@ class SuggestionWorker(BaseNeo4jWorker):
         """Fetch data for the active node from the database."""
         logger.debug("Fetching data for the active node from the database")
         query = """
-                MATCH (n)
-                WHERE n.name = $node_name
-                AND n._project = $project
+                MATCH (n:_Node {name: $node_name, _project: $project})
                 OPTIONAL MATCH (n)-[r]->(m)
                 OPTIONAL MATCH (n)<-[r_in]-(m_in)
                 RETURN n,
@@ -427,7 +1134,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                 node_data = {
                     "name": node["name"],
                     "tags": node.get("tags", []),
-                    "labels": list(node.labels),
+                    "labels": visible_labels(node.labels),
                     "properties": dict(node),
                     "relationships": relationships,
                 }
@@ -440,9 +1147,8 @@ class SuggestionWorker(BaseNeo4jWorker):
         logger.debug("Fetching data for nodes sharing the same label")
         labels = self.node_data["labels"]
         query = """
-                MATCH (n)
+                MATCH (n:_Node {_project: $project})
                 WHERE ANY(label IN $node_labels WHERE label IN labels(n))
-                AND n._project = $project
                 OPTIONAL MATCH (n)-[r]->(m)
                 OPTIONAL MATCH (n)<-[r_in]-(m_in)
                 RETURN n,
@@ -478,7 +1184,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                 node_data = {
                     "name": node["name"],
                     "tags": node.get("tags", []),
-                    "labels": list(node.labels),
+                    "labels": visible_labels(node.labels),
                     "properties": dict(node),
                     "relationships": relationships,
                 }
@@ -490,8 +1196,7 @@ class SuggestionWorker(BaseNeo4jWorker):
         """Fetch data for all nodes in the database."""
         logger.debug("Fetching data for all nodes in the database")
         query = """
-                MATCH (n)
-                WHERE n._project = $project
+                MATCH (n:_Node {_project: $project})
                 OPTIONAL MATCH (n)-[r]->(m)
                 OPTIONAL MATCH (n)<-[r_in]-(m_in)
                 RETURN n,
@@ -526,7 +1231,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                 node_data = {
                     "name": node["name"],
                     "tags": node.get("tags", []),
-                    "labels": list(node.labels),
+                    "labels": visible_labels(node.labels),
                     "properties": dict(node),
                     "relationships": relationships,
                 }
@@ -880,7 +1585,9 @@ class SuggestionWorker(BaseNeo4jWorker):
 
             # Fetch data
 
-            full_data_pd, label_based_pd, self_node_pd = self.fetch_data()
+            full_data_pd, label_based_pd, self_node_pd = self._call_with_retry(
+                self.fetch_data
+            )
 
             # Calculate cluster data
 
@@ -894,7 +1601,7 @@ class SuggestionWorker(BaseNeo4jWorker):
                     self_node_pd, label_based_pd, full_data_pd
                 ),
             }
-            self.suggestions_ready.emit(suggestions)
+            self._deliver("suggestions_ready", suggestions)
 
             logger.info(
                 "Suggestion generation completed successfully",
@@ -910,4 +1617,4 @@ class SuggestionWorker(BaseNeo4jWorker):
                 module="SuggestionWorker",
                 function="execute_operation",
             )
-            self.error_occurred.emit(error_message)
+            self._deliver("error_occurred", error_message)
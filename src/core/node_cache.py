@@ -0,0 +1,203 @@
+"""
+This module provides a bounded LRU cache of loaded node records. Navigating
+back to a node renders its cached record at once while the model checks in
+the background whether the node changed since it was loaded. Writes going
+through the model invalidate the records they affect.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from neo4j import Record
+
+CacheKey = Tuple[str, str]
+
+
+def _detach(value: Any) -> Any:
+    """
+    Copy the containers of a cached value so callers can modify it.
+
+    Nodes and other driver values are immutable and shared.
+    """
+    if isinstance(value, Record):
+        return Record(zip(value.keys(), map(_detach, value.values())))
+    if isinstance(value, dict):
+        return {key: _detach(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detach(item) for item in value]
+    return value
+
+
+def record_size(records: List[Any]) -> int:
+    """
+    Estimate the memory held by a list of records.
+
+    Args:
+        records (list): The records, e.g. the result of the load query.
+
+    Returns:
+        int: Approximate size in bytes of the serialised records.
+    """
+    return len(json.dumps(records, default=str).encode("utf-8"))
+
+
+def relationship_signature(relationships: Iterable[Dict[str, Any]]) -> str:
+    """
+    Digest a node's relationships, independent of their order.
+
+    Args:
+        relationships (iterable): Relationships as listed by the load query,
+            with ``type``, ``dir``, ``end`` and ``props``.
+
+    Returns:
+        str: Digest of the types, directions, endpoints and properties.
+    """
+    rows = sorted(
+        json.dumps(
+            [rel["type"], rel["dir"], rel["end"], rel["props"] or {}],
+            sort_keys=True,
+            default=str,
+        )
+        for rel in relationships
+    )
+    return hashlib.sha1("\n".join(rows).encode("utf-8")).hexdigest()
+
+
+class NodeCache:
+    """
+    Thread-safe LRU cache of node records keyed by (project, name).
+
+    Entries are evicted least recently used first once their estimated size
+    exceeds ``max_bytes``; a record larger than the whole budget is not
+    cached. Every invalidation advances a generation counter, so a load that
+    started before a write cannot store its stale result afterwards.
+
+    Args:
+        max_bytes (int): Size budget. 0 disables the cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def generation(self) -> int:
+        """Counter advanced by every invalidation; pass it to ``put``."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get a copy of a cached value and mark it as recently used.
+
+        Args:
+            key (tuple): (project, name).
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            value = entry[0]
+        return _detach(value)
+
+    def peek(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get a cached value without counting or reordering it.
+
+        Args:
+            key (tuple): (project, name).
+
+        Returns:
+            The cached value, or None. It must not be modified.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry else None
+
+    def put(self, key: CacheKey, value: Any, generation: int) -> bool:
+        """
+        Cache a copy of a loaded value, evicting least recently used entries
+        as needed.
+
+        Args:
+            key (tuple): (project, name).
+            value: The loaded value.
+            generation (int): ``generation`` read before the load started.
+
+        Returns:
+            bool: True if the value was cached.
+        """
+        size = record_size(value)
+        with self._lock:
+            if generation != self._generation or size > self.max_bytes:
+                return False
+            self._pop(key)
+            self._entries[key] = (_detach(value), size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._stats["evictions"] += 1
+        return True
+
+    def invalidate(self, keys: Iterable[CacheKey]) -> None:
+        """
+        Drop cached values, e.g. after a write.
+
+        Args:
+            keys (iterable): (project, name) pairs.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if self._pop(key):
+                    self._stats["invalidations"] += 1
+
+    def invalidate_project(self, project: str) -> None:
+        """
+        Drop every cached value of a project.
+
+        Args:
+            project (str): The project name.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[0] == project]:
+                self._pop(key)
+                self._stats["invalidations"] += 1
+
+    def _pop(self, key: CacheKey) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``evictions``, ``invalidations``, the
+            ``hit_rate``, the number of ``entries`` and their ``bytes``.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+            return stats
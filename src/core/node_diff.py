@@ -0,0 +1,227 @@
+"""
+This module computes the difference between two snapshots of a node's data,
+as collected by ``NodeOperationsService.collect_node_data``. Saving only the
+difference leaves untouched relationships and properties alone instead of
+deleting and recreating the node's whole neighbourhood.
+
+The same difference merges local edits into a copy of the node that someone
+else changed meanwhile, when a versioned save detects the conflict.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+RelationshipKey = Tuple[str, str, str]
+Relationship = Tuple[str, str, str, Dict[str, Any]]
+
+
+@dataclass
+class NodeDiff:
+    """
+    Changes between the loaded and the current data of one node.
+
+    Relationships are identified by (type, target, direction); a relationship
+    whose key is unchanged but whose properties differ counts as updated.
+    Removed properties are carried in ``properties`` with a value of None.
+    """
+
+    name: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+    labels_before: List[str] = field(default_factory=list)
+    labels_after: List[str] = field(default_factory=list)
+    relationships_added: List[Relationship] = field(default_factory=list)
+    relationships_updated: List[Relationship] = field(default_factory=list)
+    relationships_removed: List[RelationshipKey] = field(default_factory=list)
+
+    @property
+    def labels_changed(self) -> bool:
+        """Whether the node's label set changed."""
+        return set(self.labels_before) != set(self.labels_after)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether there is nothing to save."""
+        return not (
+            self.properties
+            or self.labels_changed
+            or self.relationships_added
+            or self.relationships_updated
+            or self.relationships_removed
+        )
+
+    @property
+    def relationships_written(self) -> List[Relationship]:
+        """Relationships to merge: the added ones followed by the updated ones."""
+        return self.relationships_added + self.relationships_updated
+
+    @property
+    def rows_touched(self) -> int:
+        """Node and relationship records the save writes to."""
+        return (
+            (1 if self.properties or self.labels_changed else 0)
+            + len(self.relationships_added)
+            + len(self.relationships_updated)
+            + len(self.relationships_removed)
+        )
+
+    @property
+    def bytes_written(self) -> int:
+        """Approximate size of the written payload in JSON encoding."""
+        payload = {
+            "properties": self.properties,
+            "labels": self.labels_after if self.labels_changed else [],
+            "relationships": self.relationships_written,
+            "removed": self.relationships_removed,
+        }
+        return len(json.dumps(payload, default=str).encode("utf-8"))
+
+
+def _relationship_map(
+    relationships: List[Relationship],
+) -> Dict[RelationshipKey, Dict[str, Any]]:
+    # Later duplicates win, like the MERGE ... SET of a full save
+    return {
+        (rel_type, target, direction): properties or {}
+        for rel_type, target, direction, properties in relationships
+    }
+
+
+def diff_node_data(
+    original: Dict[str, Any],
+    current: Dict[str, Any],
+    property_filter: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> NodeDiff:
+    """
+    Compute the changes between two snapshots of the same node.
+
+    Args:
+        original (dict): Node data as loaded.
+        current (dict): Node data to be saved.
+        property_filter (callable, optional): Reduces additional properties to
+            the writable ones, e.g. dropping system properties.
+
+    Returns:
+        NodeDiff: The changes to apply.
+    """
+    property_filter = property_filter or dict
+    diff = NodeDiff(
+        name=current["name"],
+        labels_before=list(original.get("labels", [])),
+        labels_after=list(current.get("labels", [])),
+    )
+
+    for key in ("description", "tags"):
+        if original.get(key) != current.get(key):
+            diff.properties[key] = current.get(key)
+
+    before = property_filter(original.get("additional_properties", {}))
+    after = property_filter(current.get("additional_properties", {}))
+    for key, value in after.items():
+        if before.get(key) != value:
+            diff.properties[key] = value
+    for key in before.keys() - after.keys():
+        diff.properties[key] = None
+
+    old_rels = _relationship_map(original.get("relationships", []))
+    new_rels = _relationship_map(current.get("relationships", []))
+    for key, properties in new_rels.items():
+        if key not in old_rels:
+            diff.relationships_added.append((*key, properties))
+        elif old_rels[key] != properties:
+            diff.relationships_updated.append((*key, properties))
+    diff.relationships_removed = [key for key in old_rels if key not in new_rels]
+    return diff
+
+
+class NodeVersionConflict(Exception):
+    """
+    Raised when a node changed in the database since it was loaded.
+
+    The save that detected the conflict wrote nothing. The exception carries
+    the server's copy of the node, read by the same statement, so the caller
+    can merge or overwrite without another round trip.
+
+    Args:
+        name (str): Name of the node.
+        expected_version (int): Version the node had when it was loaded.
+        server_version (int): Version currently stored in the database.
+        server_data (dict): The server's copy, in node data format.
+        local_data (dict): The node data that was to be saved.
+        original_data (dict, optional): The node data as loaded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        expected_version: int,
+        server_version: int,
+        server_data: Dict[str, Any],
+        local_data: Dict[str, Any],
+        original_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(
+            f"Node '{name}' was changed by someone else "
+            f"(version {server_version}, expected {expected_version})"
+        )
+        self.name = name
+        self.expected_version = expected_version
+        self.server_version = server_version
+        self.server_data = server_data
+        self.local_data = local_data
+        self.original_data = original_data
+
+
+def merge_node_data(
+    original: Optional[Dict[str, Any]],
+    current: Dict[str, Any],
+    server: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Apply the local changes made since loading to the server's copy of a node.
+
+    Where both sides changed the same property, label or relationship, the
+    local change wins. Without the loaded data the local data is returned, as
+    there is nothing to tell local changes from unchanged values.
+
+    Args:
+        original (dict, optional): Node data as loaded.
+        current (dict): Node data with the local changes.
+        server (dict): The server's copy of the node.
+
+    Returns:
+        dict: The merged node data, carrying the server's version.
+    """
+    if not original:
+        return {**current, "version": server.get("version")}
+
+    diff = diff_node_data(original, current)
+    merged = {
+        **server,
+        "name": current["name"],
+        "additional_properties": dict(server.get("additional_properties", {})),
+    }
+    for key, value in diff.properties.items():
+        if key in ("description", "tags"):
+            merged[key] = value
+        elif value is None:
+            merged["additional_properties"].pop(key, None)
+        else:
+            merged["additional_properties"][key] = value
+
+    removed_labels = set(diff.labels_before) - set(diff.labels_after)
+    labels = [
+        label for label in server.get("labels", []) if label not in removed_labels
+    ]
+    labels += [label for label in diff.labels_after if label not in labels]
+    merged["labels"] = labels
+
+    relationships = _relationship_map(server.get("relationships", []))
+    for key in diff.relationships_removed:
+        relationships.pop(key, None)
+    for rel_type, target, direction, properties in diff.relationships_written:
+        relationships[(rel_type, target, direction)] = properties
+    merged["relationships"] = [
+        (*key, properties) for key, properties in relationships.items()
+    ]
+    return merged
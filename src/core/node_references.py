@@ -0,0 +1,156 @@
+"""
+This module holds the helpers for finding and rewriting references to a node
+by name, used when a node is renamed. Descriptions mention other nodes by
+name, which the text editor turns into links, and branching map lines store
+the names of the nodes assigned to their branches in ``branch_*``
+relationship properties. Those names are also kept in one indexed property,
+so a rename finds the lines referencing a node without reading every line.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+# Prefix of the relationship properties holding branch assignments
+BRANCH_PROPERTY_PREFIX = "branch_"
+
+# Names assigned to the branches of a map line, one per line, kept in a single
+# string so the full-text index on it finds the lines referencing a node
+BRANCH_NAMES_PROPERTY = "_branch_names"
+BRANCH_NAMES_INDEX = "shows_branch_names"
+
+# Recomputes BRANCH_NAMES_PROPERTY of a written relationship ``r``; appended
+# to every statement that writes relationship properties
+SET_BRANCH_NAMES = """
+    SET r._branch_names = CASE WHEN r.branch_count IS NULL THEN null ELSE
+        reduce(names = '', key IN keys(r) |
+            CASE WHEN key STARTS WITH 'branch_' AND key <> 'branch_count'
+                THEN names + r[key] + '\\n' ELSE names END)
+    END
+"""
+
+
+def name_pattern(name: str) -> "re.Pattern[str]":
+    """
+    Build the pattern matching a node name as a whole word.
+
+    The text editor links node names with the same word boundaries.
+
+    Args:
+        name (str): The node name.
+
+    Returns:
+        Pattern: The compiled pattern.
+    """
+    return re.compile(r"\b" + re.escape(name) + r"\b")
+
+
+def replace_name_references(text: str, old_name: str, new_name: str) -> Tuple[str, int]:
+    """
+    Replace a node name in an HTML description.
+
+    Only text between tags and the targets of node links are changed, so a
+    name that also occurs in markup, e.g. a font name, is left alone.
+
+    Args:
+        text (str): The description, as HTML or plain text.
+        old_name (str): The name to replace.
+        new_name (str): The replacement.
+
+    Returns:
+        tuple: The new text and the number of replacements.
+    """
+    if not text or not old_name:
+        return text, 0
+
+    pattern = name_pattern(old_name)
+    old_href = f'href="{old_name}"'
+    count = 0
+    parts = []
+    for part in re.split(r"(<[^>]+>)", text):
+        if part.startswith("<"):
+            if old_href in part:
+                part = part.replace(old_href, f'href="{new_name}"')
+                count += 1
+        else:
+            part, replaced = pattern.subn(new_name, part)
+            count += replaced
+        parts.append(part)
+    return "".join(parts), count
+
+
+def visible_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop system properties, e.g. BRANCH_NAMES_PROPERTY, from relationship
+    properties before they are shown or compared.
+
+    Args:
+        properties (dict): Relationship properties.
+
+    Returns:
+        dict: The properties whose keys do not start with an underscore.
+    """
+    return {key: value for key, value in properties.items() if not key.startswith("_")}
+
+
+def description_updates(
+    records: List[Dict[str, Any]], old_name: str, new_name: str
+) -> List[Dict[str, Any]]:
+    """
+    Rewrite the descriptions that reference a node.
+
+    Args:
+        records (list): Candidate rows with ``id`` and ``description``.
+        old_name (str): The node's old name.
+        new_name (str): The node's new name.
+
+    Returns:
+        list: Rows with ``id``, the new ``description`` and the number of
+        ``references`` replaced, for the candidates that really reference the
+        node.
+    """
+    updates = []
+    for record in records:
+        description, count = replace_name_references(
+            record["description"], old_name, new_name
+        )
+        if count:
+            updates.append(
+                {"id": record["id"], "description": description, "references": count}
+            )
+    return updates
+
+
+def branch_updates(
+    records: List[Dict[str, Any]], new_name: str
+) -> List[Dict[str, Any]]:
+    """
+    Build the property updates of map lines whose branches reference a node.
+
+    Args:
+        records (list): Rows with the relationship ``id`` and the ``keys`` of
+            the branch properties holding the old name.
+        new_name (str): The node's new name.
+
+    Returns:
+        list: Rows with ``id`` and the ``properties`` to set.
+    """
+    return [
+        {"id": record["id"], "properties": dict.fromkeys(record["keys"], new_name)}
+        for record in records
+        if record["keys"]
+    ]
+
+
+def chunked(rows: List[Any], size: int) -> List[List[Any]]:
+    """
+    Split rows into chunks of at most ``size``.
+
+    Args:
+        rows (list): The rows.
+        size (int): Maximum chunk size.
+
+    Returns:
+        list: The chunks, in order.
+    """
+    size = max(1, int(size))
+    return [rows[start : start + size] for start in range(0, len(rows), size)]
@@ -0,0 +1,164 @@
+"""
+This module provides single-flight coalescing for identical read queries.
+When a (query, params) pair is already running, later workers for the same pair
+subscribe to it instead of issuing another round trip, and the first worker
+fans its result out to all of them.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class _InFlight:
+    """A running query and the workers waiting for its result."""
+
+    leader: Any
+    followers: List[Any] = field(default_factory=list)
+
+
+class QueryCoalescer:
+    """
+    Single-flight registry for read queries.
+
+    The first worker to run a given (query, params) pair becomes its leader and
+    executes it. Workers that start while it is in flight become followers: they
+    release their pool thread immediately and receive the leader's result or
+    error when it arrives. Counters are kept per query-text fingerprint.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        return re.sub(r"\s+", " ", query).strip()
+
+    @classmethod
+    def query_fingerprint(cls, query: str) -> str:
+        """
+        Fingerprint of the query text alone, used to group statistics.
+
+        Args:
+            query (str): The Cypher query.
+
+        Returns:
+            str: Short stable hash of the whitespace-normalised query.
+        """
+        return hashlib.sha1(cls._normalize(query).encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def fingerprint(cls, query: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        Fingerprint of a (query, params) pair, used to detect identical reads.
+
+        Args:
+            query (str): The Cypher query.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            str: Stable hash of the normalised query and its parameters.
+        """
+        payload = json.dumps(params or {}, sort_keys=True, default=str)
+        key = f"{cls._normalize(query)}\0{payload}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def join(self, key: str, worker: Any) -> bool:
+        """
+        Register a worker for a (query, params) pair.
+
+        Args:
+            key (str): Result of ``fingerprint``.
+            worker: The worker about to run the query.
+
+        Returns:
+            bool: True if the worker is the leader and must run the query,
+            False if it was attached as a follower of a running query.
+        """
+        stats_key = self.query_fingerprint(worker.query)
+        with self._lock:
+            stats = self._stats.setdefault(
+                stats_key,
+                {
+                    "query": self._normalize(worker.query)[:120],
+                    "executed": 0,
+                    "coalesced": 0,
+                },
+            )
+            entry = self._in_flight.get(key)
+            if entry is None:
+                self._in_flight[key] = _InFlight(leader=worker)
+                stats["executed"] += 1
+                return True
+            entry.followers.append(worker)
+            stats["coalesced"] += 1
+
+        logger.debug(
+            "Coalesced duplicate read query",
+            module="QueryCoalescer",
+            function="join",
+            fingerprint=stats_key,
+        )
+        return False
+
+    def complete(self, key: str, signal_name: str, *args: Any) -> None:
+        """
+        Finish a query and fan its outcome out to every follower.
+
+        Args:
+            key (str): Result of ``fingerprint``.
+            signal_name (str): Worker signal carrying the outcome.
+            *args: Signal arguments.
+        """
+        with self._lock:
+            entry = self._in_flight.pop(key, None)
+        if entry is None:
+            return
+        for follower in entry.followers:
+            follower._resume(signal_name, *args)
+
+    def abandoned_leader(self, key: str) -> Optional[Any]:
+        """
+        Get the leader of a query whose subscribers have all been cancelled.
+
+        Args:
+            key (str): Result of ``fingerprint``.
+
+        Returns:
+            The leader worker if nobody still wants the result, else None.
+        """
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is None:
+                return None
+            subscribers = [entry.leader, *entry.followers]
+            if all(worker.is_cancelled for worker in subscribers):
+                return entry.leader
+            return None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-fingerprint counters.
+
+        Returns:
+            dict: Fingerprint to ``query``, ``executed`` round trips and
+            ``coalesced`` requests that were served without one.
+        """
+        with self._lock:
+            return {key: dict(value) for key, value in self._stats.items()}
+
+    @property
+    def saved_round_trips(self) -> int:
+        """Total number of reads served by an already running query."""
+        with self._lock:
+            return sum(value["coalesced"] for value in self._stats.values())
@@ -0,0 +1,140 @@
+"""
+This module provides the QueryRegistry, the central catalogue of the Cypher
+statements sent by the models. Every statement has a fixed name and a single
+canonical text, so the server's query plan cache sees the same text for the
+same operation, and execution counts show which statements are hot.
+"""
+
+import textwrap
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Tuple, Union
+
+import structlog
+
+logger = structlog.get_logger()
+
+Identifier = Union[str, int]
+
+
+class QueryRegistry:
+    """
+    Registry of named, parameterised Cypher statements.
+
+    Cypher cannot take labels, relationship types or path lengths as
+    parameters. Statements that need one are registered as templates with
+    ``%(key)s`` placeholders and dispatched per value: each distinct value is
+    rendered once and the same text is returned from then on. Combinations are
+    never rendered into one text, so the number of distinct statements grows
+    with the number of labels and types, not with the label sets of nodes.
+
+    String identifiers are backtick-quoted; integers are inserted as-is.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._templates: Dict[str, str] = {}
+        self._rendered: Dict[Tuple[str, Tuple[Tuple[str, Identifier], ...]], str] = {}
+        self._executions: Counter = Counter()
+
+    @staticmethod
+    def quote_identifier(identifier: str) -> str:
+        """
+        Quote a label or relationship type for use in a statement.
+
+        Args:
+            identifier (str): The raw label or type.
+
+        Returns:
+            str: The identifier in backticks, with backticks inside it escaped.
+        """
+        return "`" + str(identifier).replace("`", "``") + "`"
+
+    def register(self, name: str, template: str) -> None:
+        """
+        Register a statement under a name.
+
+        Args:
+            name (str): Unique statement name, e.g. ``save.create``.
+            template (str): Statement text, with ``%(key)s`` placeholders for
+                identifiers that cannot be parameters.
+
+        Raises:
+            ValueError: If another statement is registered under the name.
+        """
+        text = textwrap.dedent(template).strip()
+        with self._lock:
+            if self._templates.get(name, text) != text:
+                raise ValueError(f"Query '{name}' is already registered")
+            self._templates[name] = text
+
+    def get(self, name: str, **identifiers: Identifier) -> str:
+        """
+        Get the canonical text of a statement and count its execution.
+
+        Args:
+            name (str): Registered statement name.
+            **identifiers: Values for the template's placeholders.
+
+        Returns:
+            str: The statement text.
+
+        Raises:
+            KeyError: If no statement is registered under the name.
+        """
+        key = (name, tuple(sorted(identifiers.items())))
+        with self._lock:
+            text = self._rendered.get(key)
+            if text is None:
+                text = self._render(self._templates[name], identifiers)
+                self._rendered[key] = text
+            self._executions[key] += 1
+        return text
+
+    def lookup(self, text: str) -> Tuple[str, Dict[str, Identifier]]:
+        """
+        Find the name and identifiers a statement text was rendered from.
+
+        Args:
+            text (str): A text returned by ``get``.
+
+        Returns:
+            tuple: The statement name and its identifiers.
+
+        Raises:
+            KeyError: If the text was not rendered by this registry.
+        """
+        with self._lock:
+            for (name, identifiers), rendered in self._rendered.items():
+                if rendered == text:
+                    return name, dict(identifiers)
+        raise KeyError(text)
+
+    def _render(self, template: str, identifiers: Dict[str, Identifier]) -> str:
+        if not identifiers:
+            return template
+        values = {
+            key: str(value) if isinstance(value, int) else self.quote_identifier(value)
+            for key, value in identifiers.items()
+        }
+        return template % values
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Execution counts per distinct statement text, most executed first.
+
+        Returns:
+            list: Dicts with ``name``, ``identifiers`` and ``executions``.
+        """
+        with self._lock:
+            counts = self._executions.most_common()
+        return [
+            {"name": name, "identifiers": dict(identifiers), "executions": count}
+            for (name, identifiers), count in counts
+        ]
+
+    @property
+    def distinct_statements(self) -> int:
+        """Number of distinct statement texts sent so far."""
+        with self._lock:
+            return len(self._rendered)
@@ -0,0 +1,245 @@
+"""
+This module provides the retry policy and circuit breaker shared by all Neo4j
+workers. Transient errors are retried with jittered exponential backoff, and the
+circuit breaker fails fast while the server is unavailable instead of letting
+every worker hammer it.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Optional
+
+import structlog
+from neo4j.exceptions import (
+    IncompleteCommit,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
+
+logger = structlog.get_logger()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting the server while the circuit is open."""
+
+
+def is_availability_error(error: BaseException) -> bool:
+    """
+    Check whether an error means the server could not be reached.
+
+    Args:
+        error: The raised exception.
+
+    Returns:
+        bool: True for connection-level failures.
+    """
+    return isinstance(error, (ServiceUnavailable, SessionExpired))
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, aware of operation idempotency.
+
+    Reads may be retried after any transient or connection failure. Writes are
+    only retried when the server guarantees the transaction was rolled back,
+    never after a commit whose outcome is unknown.
+
+    Args:
+        max_attempts (int): Total attempts including the first one.
+        initial_delay (float): Backoff ceiling in seconds for the first retry.
+        max_delay (float): Upper bound for any backoff in seconds.
+        multiplier (float): Growth factor of the backoff ceiling per attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_delay: float = 0.2,
+        max_delay: float = 5.0,
+        multiplier: float = 2.0,
+    ) -> None:
+        self.max_attempts = max(1, int(max_attempts))
+        self.initial_delay = float(initial_delay)
+        self.max_delay = float(max_delay)
+        self.multiplier = float(multiplier)
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RetryPolicy":
+        """
+        Build a policy from the RETRY_* config keys.
+
+        Args:
+            config: Configuration object.
+
+        Returns:
+            RetryPolicy: The configured policy.
+        """
+        return cls(
+            max_attempts=config.get("RETRY_MAX_ATTEMPTS", 3),
+            initial_delay=config.get("RETRY_INITIAL_DELAY", 0.2),
+            max_delay=config.get("RETRY_MAX_DELAY", 5.0),
+            multiplier=config.get("RETRY_BACKOFF_MULTIPLIER", 2.0),
+        )
+
+    def is_retryable(self, error: BaseException, idempotent: bool) -> bool:
+        """
+        Check whether an error may be retried.
+
+        Args:
+            error: The raised exception.
+            idempotent (bool): Whether repeating the operation is safe.
+
+        Returns:
+            bool: True if the operation may be attempted again.
+        """
+        if isinstance(error, (IncompleteCommit, CircuitOpenError)):
+            return False
+        if isinstance(error, TransientError):
+            return error.is_retryable()
+        if is_availability_error(error):
+            return idempotent
+        return False
+
+    def delay(self, attempt: int) -> float:
+        """
+        Backoff before the next attempt.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, from 1.
+
+        Returns:
+            float: Seconds to wait, drawn uniformly below the backoff ceiling.
+        """
+        ceiling = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for server availability.
+
+    After ``failure_threshold`` consecutive availability failures the circuit
+    opens and calls fail fast with ``CircuitOpenError``. Once ``reset_timeout``
+    has passed, one trial call is let through; its outcome closes the circuit
+    or opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds to stay open before a trial call.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "CircuitBreaker":
+        """
+        Build a circuit breaker from the CIRCUIT_* config keys.
+
+        Args:
+            config: Configuration object.
+
+        Returns:
+            CircuitBreaker: The configured circuit breaker.
+        """
+        return cls(
+            failure_threshold=config.get("CIRCUIT_FAILURE_THRESHOLD", 5),
+            reset_timeout=config.get("CIRCUIT_RESET_TIMEOUT", 30.0),
+        )
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            if (
+                self._state != self.CLOSED
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may contact the server.
+
+        Returns:
+            bool: False while the circuit is open.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # Let one trial call through; another follows if it never reports
+            self._state = self.HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def check(self) -> None:
+        """
+        Raise if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If calls are currently blocked.
+        """
+        if not self.allow():
+            raise CircuitOpenError(
+                "Database unavailable; waiting before reconnecting "
+                f"(up to {self.reset_timeout:.0f}s)."
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(
+                    "Circuit breaker closed",
+                    module="CircuitBreaker",
+                    function="record_success",
+                )
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """
+        Count a failed call. Only availability failures count; any other
+        error still proves the server is reachable.
+
+        Args:
+            error: The raised exception, if any.
+        """
+        if isinstance(error, CircuitOpenError):
+            return
+        if error is not None and not is_availability_error(error):
+            self.record_success()
+            return
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    logger.warning(
+                        "Circuit breaker opened",
+                        module="CircuitBreaker",
+                        function="record_failure",
+                        failures=self._failures,
+                        reset_timeout=self.reset_timeout,
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
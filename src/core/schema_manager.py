@@ -0,0 +1,240 @@
+"""
+This module provides the SchemaManager, which makes sure the indexes and
+constraints that the model's lookups rely on exist. Every node the application
+manages carries the ``_Node`` label, so lookups by (_project, name) can use an
+index instead of scanning all nodes.
+"""
+
+from typing import Any, Dict, List
+
+import structlog
+from neo4j import Driver
+from neo4j.exceptions import ClientError
+
+from core.fulltext import FULLTEXT_INDEX
+from core.node_references import BRANCH_NAMES_INDEX, SET_BRANCH_NAMES
+
+logger = structlog.get_logger()
+
+# Label carried by every node the application manages. Labels starting with an
+# underscore are system labels and are hidden from the user, like properties.
+NODE_LABEL = "_Node"
+
+
+def visible_labels(labels: List[str]) -> List[str]:
+    """
+    Drop system labels from a list of labels.
+
+    Args:
+        labels (list): Labels of a node.
+
+    Returns:
+        list: The labels a user may see and edit.
+    """
+    return [label for label in labels if not label.startswith("_")]
+
+
+class SchemaManager:
+    """
+    Creates, verifies and reports on the database schema at startup.
+
+    Nodes created before the schema label existed are labelled in batches of
+    ``batch_size``, each in its own transaction, so a large migration never
+    holds one huge transaction. Branching map lines saved before their branch
+    names were denormalised are migrated the same way.
+
+    Args:
+        driver (Driver): The shared Neo4j driver.
+        batch_size (int): Nodes labelled per migration transaction.
+    """
+
+    # Preferred: names are unique per project
+    NAME_CONSTRAINT = "node_project_name"
+    NAME_CONSTRAINT_QUERY = (
+        "CREATE CONSTRAINT node_project_name IF NOT EXISTS "
+        "FOR (n:_Node) REQUIRE (n._project, n.name) IS UNIQUE"
+    )
+
+    # Fallback if existing data already contains duplicate names
+    NAME_INDEX = "node_project_name_index"
+    NAME_INDEX_QUERY = (
+        "CREATE INDEX node_project_name_index IF NOT EXISTS "
+        "FOR (n:_Node) ON (n._project, n.name)"
+    )
+
+    INDEXES = {
+        "node_modified": (
+            "CREATE INDEX node_modified IF NOT EXISTS FOR (n:_Node) ON (n._modified)"
+        ),
+        "calendar_name": (
+            "CREATE INDEX calendar_name IF NOT EXISTS FOR (n:CALENDAR) ON (n.name)"
+        ),
+        "event_parsed_date_year": (
+            "CREATE INDEX event_parsed_date_year IF NOT EXISTS "
+            "FOR (n:EVENT) ON (n.parsed_date_year)"
+        ),
+        # Branching map lines, whose branch_* properties reference nodes
+        "shows_branch_count": (
+            "CREATE INDEX shows_branch_count IF NOT EXISTS "
+            "FOR ()-[r:SHOWS]-() ON (r.branch_count)"
+        ),
+        FULLTEXT_INDEX: (
+            f"CREATE FULLTEXT INDEX {FULLTEXT_INDEX} IF NOT EXISTS "
+            "FOR (n:_Node) ON EACH [n.name, n.description, n.tags]"
+        ),
+        # Names assigned to the branches of map lines, looked up on rename
+        BRANCH_NAMES_INDEX: (
+            f"CREATE FULLTEXT INDEX {BRANCH_NAMES_INDEX} IF NOT EXISTS "
+            "FOR ()-[r:SHOWS]-() ON EACH [r._branch_names]"
+        ),
+    }
+
+    MIGRATE_LABEL_QUERY = """
+        MATCH (n)
+        WHERE NOT n:_Node
+        WITH n LIMIT $batch_size
+        SET n:_Node
+        RETURN count(n) AS labelled
+    """
+
+    # Branching lines saved before their branch names were denormalised
+    MIGRATE_BRANCH_NAMES_QUERY = (
+        """
+        MATCH ()-[r:SHOWS]->()
+        WHERE r.branch_count IS NOT NULL AND r._branch_names IS NULL
+        WITH r LIMIT $batch_size
+    """
+        + SET_BRANCH_NAMES
+        + """
+        RETURN count(r) AS migrated
+    """
+    )
+
+    SHOW_INDEXES_QUERY = """
+        SHOW INDEXES
+        YIELD name, state, readCount
+        RETURN name, state, readCount
+    """
+
+    def __init__(self, driver: Driver, batch_size: int = 10000) -> None:
+        self._driver = driver
+        self.batch_size = max(1, int(batch_size))
+
+    def bootstrap(self) -> Dict[str, Any]:
+        """
+        Label existing nodes, create the schema and report on it.
+
+        Returns:
+            dict: ``labelled`` node count plus the result of ``check``.
+        """
+        labelled = self.migrate_labels()
+        self.ensure_schema()
+        self.migrate_branch_names()
+        report = {"labelled": labelled, **self.check()}
+        logger.info(
+            "Schema bootstrap finished",
+            module="SchemaManager",
+            function="bootstrap",
+            **report,
+        )
+        return report
+
+    def migrate_labels(self) -> int:
+        """
+        Add the schema label to all nodes that lack it, one batch at a time.
+
+        Returns:
+            int: Number of nodes labelled.
+        """
+        total = 0
+        with self._driver.session() as session:
+            while True:
+                labelled = session.execute_write(self._label_batch)
+                total += labelled
+                if labelled < self.batch_size:
+                    break
+                logger.debug(
+                    "Labelled node batch",
+                    module="SchemaManager",
+                    function="migrate_labels",
+                    labelled=total,
+                )
+        return total
+
+    def _label_batch(self, tx: Any) -> int:
+        record = tx.run(self.MIGRATE_LABEL_QUERY, batch_size=self.batch_size).single()
+        return record["labelled"] if record else 0
+
+    def migrate_branch_names(self) -> int:
+        """
+        Denormalise the branch names of branching map lines that lack them,
+        one batch at a time, so the branch names index covers them.
+
+        Returns:
+            int: Number of map lines migrated.
+        """
+        total = 0
+        with self._driver.session() as session:
+            while True:
+                migrated = session.execute_write(self._branch_names_batch)
+                total += migrated
+                if migrated < self.batch_size:
+                    break
+        return total
+
+    def _branch_names_batch(self, tx: Any) -> int:
+        record = tx.run(
+            self.MIGRATE_BRANCH_NAMES_QUERY, batch_size=self.batch_size
+        ).single()
+        return record["migrated"] if record else 0
+
+    def ensure_schema(self) -> None:
+        """
+        Create the name constraint and the lookup indexes if they are missing.
+
+        Falls back to a plain composite index when existing duplicate names
+        prevent the uniqueness constraint.
+        """
+        with self._driver.session() as session:
+            try:
+                session.run(self.NAME_CONSTRAINT_QUERY).consume()
+            except ClientError as e:
+                logger.warning(
+                    "Name uniqueness constraint not created, using an index instead",
+                    module="SchemaManager",
+                    function="ensure_schema",
+                    error=str(e),
+                )
+                session.run(self.NAME_INDEX_QUERY).consume()
+            for query in self.INDEXES.values():
+                session.run(query).consume()
+
+    def check(self) -> Dict[str, List[str]]:
+        """
+        Compare the expected indexes with those on the server.
+
+        Returns:
+            dict: ``missing`` expected indexes that do not exist or are not
+            online, and ``unused`` existing indexes that were never read.
+        """
+        with self._driver.session() as session:
+            records = list(session.run(self.SHOW_INDEXES_QUERY))
+
+        online = {record["name"] for record in records if record["state"] == "ONLINE"}
+        missing = [name for name in self.INDEXES if name not in online]
+        if not {self.NAME_CONSTRAINT, self.NAME_INDEX} & online:
+            missing.insert(0, self.NAME_CONSTRAINT)
+        unused = sorted(
+            record["name"]
+            for record in records
+            if record["state"] == "ONLINE" and not record["readCount"]
+        )
+
+        if missing:
+            logger.warning(
+                "Schema indexes missing",
+                module="SchemaManager",
+                function="check",
+                missing=missing,
+            )
+        return {"missing": missing, "unused": unused}
@@ -0,0 +1,193 @@
+"""
+This module provides a bounded thread-pool executor for Neo4j workers.
+It replaces one-QThread-per-query with a fixed set of pooled threads, priority
+ordering between interactive and background work, and cancellation tokens.
+"""
+
+import itertools
+import threading
+from enum import IntEnum
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import structlog
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal, pyqtSlot
+
+if TYPE_CHECKING:
+    from core.neo4jworkers import BaseNeo4jWorker
+
+logger = structlog.get_logger()
+
+
+class WorkerPriority(IntEnum):
+    """Queue priority of a worker. Higher values are started first."""
+
+    BACKGROUND = 0
+    NORMAL = 5
+    INTERACTIVE = 10
+
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag shared between the GUI thread and a worker.
+
+    Cancelling never blocks. The worker checks the token between steps and
+    stops as soon as it notices.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Sleep for up to ``timeout`` seconds, waking early on cancellation.
+
+        Args:
+            timeout (float): Maximum time to sleep in seconds.
+
+        Returns:
+            bool: True if the token was cancelled.
+        """
+        return self._event.wait(timeout)
+
+
+class WorkerExecutor(QObject):
+    """
+    Process-wide executor running workers on a fixed-size ``QThreadPool``.
+
+    Workers are queued by ``WorkerPriority`` so UI-interactive work is picked
+    up before background analytics. A worker that is cancelled while still
+    queued returns immediately when its turn comes.
+
+    The executor keeps a reference to every submitted worker until it has
+    finished, and drops it on the thread that owns the executor so worker
+    objects are never destroyed from a pool thread.
+
+    Args:
+        max_workers (int): Number of pooled threads.
+    """
+
+    _worker_done = pyqtSignal(object)
+
+    _instance: Optional["WorkerExecutor"] = None
+    _instance_lock = threading.Lock()
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Initialize the executor with its own thread pool.
+
+        Args:
+            max_workers (int): Number of pooled threads.
+        """
+        super().__init__()
+        self._pool = QThreadPool()
+        self._running: Dict[int, Any] = {}
+        self._keys = itertools.count()
+        self._worker_done.connect(self._release)
+        self.set_max_workers(max_workers)
+
+    @classmethod
+    def instance(cls) -> "WorkerExecutor":
+        """
+        Get the shared executor, creating it on first use.
+
+        Returns:
+            WorkerExecutor: The process-wide executor.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """
+        Set the number of pooled threads.
+
+        Args:
+            max_workers (int): Number of pooled threads, at least 1.
+        """
+        self._pool.setMaxThreadCount(max(1, int(max_workers)))
+        logger.debug(
+            "Worker pool size set",
+            module="WorkerExecutor",
+            function="set_max_workers",
+            max_workers=self._pool.maxThreadCount(),
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Number of pooled threads."""
+        return self._pool.maxThreadCount()
+
+    @property
+    def active_count(self) -> int:
+        """Number of pooled threads currently running a worker."""
+        return self._pool.activeThreadCount()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of submitted workers that have not finished yet."""
+        return len(self._running)
+
+    def submit(self, worker: "BaseNeo4jWorker", priority: Optional[int] = None) -> None:
+        """
+        Queue a worker for execution.
+
+        Args:
+            worker: The worker to run.
+            priority: Queue priority. Defaults to the worker's own priority.
+        """
+        if priority is None:
+            priority = worker.priority
+        key = next(self._keys)
+        self._running[key] = worker
+        worker._on_done = partial(self._worker_done.emit, key)
+
+        def run() -> None:
+            try:
+                worker.run()
+            finally:
+                # Deferred workers report completion themselves via _on_done
+                if not worker._deferred:
+                    self._worker_done.emit(key)
+
+        self._pool.start(run, int(priority))
+
+    @pyqtSlot(object)
+    def _release(self, key: int) -> None:
+        """Drop the reference to a finished worker."""
+        self._running.pop(key, None)
+
+    def shutdown(self, timeout_ms: int = 5000) -> bool:
+        """
+        Drop queued workers and wait for running ones to finish.
+
+        Args:
+            timeout_ms (int): Maximum time to wait in milliseconds.
+
+        Returns:
+            bool: True if all running workers finished in time.
+        """
+        self._pool.clear()
+        for worker in list(self._running.values()):
+            worker.cancel()
+        done = self._pool.waitForDone(timeout_ms)
+        if not done:
+            logger.warning(
+                "Worker pool did not drain before timeout",
+                module="WorkerExecutor",
+                function="shutdown",
+                timeout_ms=timeout_ms,
+            )
+        return done
@@ -32,6 +32,7 @@ from PyQt6.QtGui import (
 )
 from PyQt6.QtWidgets import (
     QApplication,
+    QLabel,
     QMessageBox,
     QMainWindow,
 )
@@ -46,6 +47,7 @@ except ImportError as e:
     print(f"Failed to import config: {e}")
     sys.exit(1)
 from core.neo4jmodel import Neo4jModel
+from core.worker_executor import WorkerExecutor
 from ui.controller import WorldBuildingController
 from ui.main_window import WorldBuildingUI
 from utils.crypto import SecurityUtility
@@ -430,6 +432,11 @@ class WorldBuildingApp(QMainWindow):
             # Create error handler first
             error_handler = ErrorHandler(ui_feedback_handler=self._show_error_dialog)
 
+            # Size the shared worker pool before any worker is queued
+            WorkerExecutor.instance().set_max_workers(
+                config.get("WORKER_POOL_SIZE", WorkerExecutor.DEFAULT_MAX_WORKERS)
+            )
+
             # Create worker manager with error handler
             worker_manager = WorkerManagerService(error_handler)
 
@@ -494,6 +501,9 @@ class WorldBuildingApp(QMainWindow):
             # Add Export menu to the main menu bar
             self._add_menu_bar()
 
+            # Show the database connection state in the status bar
+            self._add_status_bar()
+
             structlog.get_logger().info(
                 f"Window configured with size "
                 f"{self.components.config.WINDOW_WIDTH}x"
@@ -554,6 +564,56 @@ class WorldBuildingApp(QMainWindow):
         )
         settings_menue.addAction(open_style_settings_action)
 
+    def _add_status_bar(self) -> None:
+        """
+        Add the database connection and save queue indicators to the status bar.
+        """
+        save_queue = self.components.controller.save_queue
+        if save_queue is not None:
+            self.save_queue_label = QLabel()
+            self.save_queue_label.setObjectName("saveQueueLabel")
+            self.statusBar().addPermanentWidget(self.save_queue_label)
+
+            save_queue.depth_changed.connect(self._update_save_queue_status)
+            self._update_save_queue_status(save_queue.depth)
+
+        health_service = self.components.controller.connection_health_service
+        if health_service is None:
+            return
+
+        self.connection_status_label = QLabel()
+        self.connection_status_label.setObjectName("connectionStatusLabel")
+        self.statusBar().addPermanentWidget(self.connection_status_label)
+
+        health_service.health_changed.connect(self._update_connection_status)
+        self._update_connection_status(
+            health_service.is_healthy, health_service.status_message
+        )
+
+    def _update_save_queue_status(self, depth: int) -> None:
+        """
+        Show how many node saves are waiting to be written.
+
+        Args:
+            depth (int): Number of nodes with a save queued or in flight
+        """
+        self.save_queue_label.setText(
+            f"Saving {depth} node{'s' if depth != 1 else ''}..." if depth else ""
+        )
+
+    def _update_connection_status(self, healthy: bool, message: str) -> None:
+        """
+        Show the current database connection state.
+
+        Args:
+            healthy (bool): Whether the database is reachable
+            message (str): Status text to display
+        """
+        self.connection_status_label.setText(message)
+        self.connection_status_label.setStyleSheet(
+            "" if healthy else "color: #c0392b; font-weight: bold;"
+        )
+
     def _handle_initialization_error(self, error: Exception) -> None:
         """
         Handle initialization errors with cleanup.
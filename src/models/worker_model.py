@@ -1,15 +1,17 @@
 from dataclasses import dataclass
 from typing import Callable, Optional, Any
 
-from PyQt6.QtCore import QThread
+from core.neo4jworkers import BaseNeo4jWorker
+from core.worker_executor import WorkerPriority
 
 
 @dataclass
 class WorkerOperation:
     """Represents a worker operation configuration."""
 
-    worker: QThread
+    worker: BaseNeo4jWorker
     success_callback: Optional[Callable[[Any], None]] = None
     error_callback: Optional[Callable[[str], None]] = None
     finished_callback: Optional[Callable[[], None]] = None
     operation_name: str = "operation"
+    priority: WorkerPriority = WorkerPriority.INTERACTIVE
@@ -1,8 +1,26 @@
+import json
 import logging
-from typing import Optional, Dict, Any, Callable, List, Set, Tuple, Union, TypedDict
+import threading
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+    TypedDict,
+)
 import os
 from dotenv import load_dotenv
 import requests
+from PyQt6.QtCore import pyqtSignal
+from requests.adapters import HTTPAdapter
+
+from core.neo4jworkers import BaseNeo4jWorker
+from utils.html_text import html_to_text
 
 
 class NodeType(TypedDict, total=False):
@@ -58,6 +76,9 @@ class LLMService:
         self.base_url: str = os.getenv("OPENAI_BASE_URL")
 
         self.model: str = os.getenv("OPENAI_MODEL")
+        self._prompt_template_service = None
+        self._http_session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
         logging.debug(
             f"LLM Service initialized with URL: {self.base_url}, model: {self.model}"
         )
@@ -68,7 +89,7 @@ class LLMService:
         description: str,
         callback: Callable[[str, Optional[str]], None],
         depth: int = 0,
-    ) -> None:
+    ) -> "LLMStreamWorker":
         """Wrapper method that calls the template-based enhancement with default parameters.
 
         This method preserves backward compatibility while using the template system.
@@ -78,25 +99,31 @@ class LLMService:
             description (str): The current description of the node.
             callback (Callable[[str, Optional[str]], None]): A callback function.
             depth (int, optional): The number of levels of connected nodes to include as context.
+
+        Returns:
+            LLMStreamWorker: The worker that will run the enhancement.
         """
         # Use the quick template as default for quick enhancement
         template_id = "quick"
-        focus_type = "general"
         custom_instructions = ""
 
         # Delegate to the template-based method
-        self.enhance_description_with_template(
+        return self.enhance_description_with_template(
             node_name,
             description,
             template_id,
-            focus_type,
             depth,
             custom_instructions,
             callback,
         )
 
     def _get_node_context(self, node_name: str, depth: int) -> str:
-        """Recursively fetches and formats context information from connected nodes.
+        """Fetches and formats context information from connected nodes.
+
+        The neighbourhood is loaded up to the depth with one batched query per
+        level and formatted breadth-first, nearest nodes first. At most
+        LLM_CONTEXT_MAX_NODES nodes and LLM_CONTEXT_MAX_CHARS characters are
+        included.
 
         Args:
             node_name (str): The name of the starting node from which to gather context.
@@ -106,57 +133,26 @@ class LLMService:
             str: A formatted string containing information about the node and its
                 connected nodes, with HTML stripped from descriptions.
         """
-        visited: Set[str] = set()
+        max_nodes = int(self.config.get("LLM_CONTEXT_MAX_NODES", 50))
+        max_chars = int(self.config.get("LLM_CONTEXT_MAX_CHARS", 8000))
         context_parts: List[str] = []
+        length = 0
 
-        def strip_html(html_text: str) -> str:
-            """Extract clean text content from HTML using BeautifulSoup."""
-            if not html_text:
-                return ""
-
-            # Import conditionally to avoid startup overhead
-            from bs4 import BeautifulSoup
-
-            # Parse HTML and extract text
-            soup = BeautifulSoup(html_text, "html.parser")
-
-            # Remove script and style elements
-            for element in soup(["script", "style"]):
-                element.decompose()
-
-            # Get text and clean up whitespace
-            text = soup.get_text(separator=" ")
-            text = " ".join(text.split())
-
-            return text
-
-        def collect_node_info(
-            name: str, current_depth: int, rel_path: str = ""
-        ) -> None:
-            """Recursively collects and formats information about nodes and relationships.
-
-            Args:
-                name (str): Name of the current node being processed.
-                current_depth (int): Current depth in the traversal.
-                rel_path (str, optional): Relationship path string.
-            """
-            if current_depth < 0 or name in visited:
-                return
-
-            visited.add(name)
-
-            # Get node data
+        # Runs on the worker pool: errors go to the worker, not to a dialog
+        nodes = self.node_operations.get_context_subgraph(
+            node_name, depth, max_nodes, raise_errors=True
+        )
+        for node in nodes:
             try:
-                node = self.node_operations.get_node_by_name(name)
-                if not node:
-                    return
-
                 # Format node info
+                rel_path = " ".join(
+                    f"-[{rel_type}]{'->' if direction == 'OUTGOING' else '<-'}"
+                    for rel_type, direction in node["path"]
+                )
                 prefix = f"{rel_path} -> " if rel_path else ""
 
                 # Get a clean, HTML-stripped description
-                description = node.get("description", "")
-                clean_description = strip_html(description)
+                clean_description = html_to_text(node.get("description", ""))
 
                 node_info = [
                     f"{prefix}Node: {node['name']}",
@@ -168,33 +164,22 @@ class LLMService:
                     f"Tags: {', '.join(node['tags'])}" if node.get("tags") else "",
                     f"Brief: {clean_description}" if clean_description else "",
                 ]
-                context_parts.append("\n".join(filter(None, node_info)))
-
-                # Stop if we've reached max depth
-                if current_depth == 0:
-                    return
-
-                # Process relationships with the new format
-                for rel in node.get("relationships", []):
-                    target = rel.get("target")
-                    rel_type = rel.get("type")
-                    direction = rel.get("direction")
-
-                    if target and rel_type:
-                        arrow = "->" if direction == "OUTGOING" else "<-"
-                        new_path = (
-                            f"{rel_path} -[{rel_type}]{arrow}"
-                            if rel_path
-                            else f"-[{rel_type}]{arrow}"
-                        )
-                        collect_node_info(target, current_depth - 1, new_path)
-
+                part = "\n".join(filter(None, node_info))
             except Exception as e:
-                logging.error(f"Error processing node {name} for context: {e}")
+                logging.error(
+                    f"Error processing node {node.get('name')} for context: {e}"
+                )
                 # Continue with other nodes
+                continue
 
-        # Start collection from the root node
-        collect_node_info(node_name, depth)
+            # Stop once the context would exceed its size limit
+            length += len(part) + 2
+            if context_parts and length > max_chars:
+                logging.debug(
+                    f"Context limited to {len(context_parts)} of {len(nodes)} nodes"
+                )
+                break
+            context_parts.append(part)
 
         return "\n\n".join(context_parts)
 
@@ -225,87 +210,219 @@ class LLMService:
         context_depth: int,
         custom_instructions: str,
         callback: Callable[[str, Optional[str]], None],
-    ) -> None:
-        """Enhances a node's description using a template-based approach with focus."""
-        try:
-            # Validate that template service is available
-            if not self._prompt_template_service:
-                callback("", "Prompt template service not available")
-                return
+        chunk_callback: Optional[Callable[[str], None]] = None,
+    ) -> "LLMStreamWorker":
+        """Enhances a node's description using a template-based approach with focus.
 
-            # Get node context if depth > 0
-            context = ""
-            if context_depth > 0:
-                logging.debug(
-                    f"Gathering context with depth {context_depth} for node: {node_name}"
-                )
-                context = self._get_node_context(node_name, context_depth)
-                logging.debug(f"Context gathered, length: {len(context)}")
+        Context gathering and the LLM request run in the returned worker,
+        which the caller executes on the worker pool. The completion is
+        streamed, and each piece of text is passed to ``chunk_callback`` as
+        it arrives.
 
-            # Get node data for variable substitution
-            node = self.node_operations.get_node_by_name(node_name)
-            if not node:
-                callback("", f"Could not find node: {node_name}")
-                return
+        Args:
+            node_name (str): The name of the node whose description is enhanced.
+            description (str): The current description as plain text.
+            template_id (str): The prompt template to use.
+            context_depth (int): Levels of connected nodes to include as context.
+            custom_instructions (str): Extra instructions for the template.
+            callback (Callable[[str, Optional[str]], None]): Called with the
+                complete text, or with an empty text and an error message.
+            chunk_callback (Callable[[str], None], optional): Called with each
+                piece of streamed text.
+
+        Returns:
+            LLMStreamWorker: The worker that will run the enhancement.
+        """
+        worker = LLMStreamWorker(
+            self,
+            node_name,
+            description,
+            template_id,
+            context_depth,
+            custom_instructions,
+        )
+        worker.stream_finished.connect(lambda text: callback(text, None))
+        worker.error_occurred.connect(lambda error: callback("", error))
+        if chunk_callback:
+            worker.chunk_received.connect(chunk_callback)
+        return worker
+
+    def build_prompt(
+        self,
+        node_name: str,
+        description: str,
+        template_id: str,
+        context_depth: int,
+        custom_instructions: str,
+    ) -> str:
+        """Builds the prompt for a description enhancement.
 
-            # Strip HTML from the description for the node data
-            node["description"] = description
+        Args:
+            node_name (str): The name of the node whose description is enhanced.
+            description (str): The current description as plain text.
+            template_id (str): The prompt template to use.
+            context_depth (int): Levels of connected nodes to include as context.
+            custom_instructions (str): Extra instructions for the template.
+
+        Returns:
+            str: The formatted prompt.
 
-            # Prepare variables
-            variables = self._prompt_template_service.prepare_context_variables(
-                node_data=node, context=context, custom_instructions=custom_instructions
+        Raises:
+            ValueError: If no template or node is available.
+            Exception: Database errors, which the worker running the
+                enhancement reports through ``error_occurred``.
+        """
+        # Validate that template service is available
+        if not self._prompt_template_service:
+            raise ValueError("Prompt template service not available")
+
+        # Get node context if depth > 0
+        context = ""
+        if context_depth > 0:
+            logging.debug(
+                f"Gathering context with depth {context_depth} for node: {node_name}"
             )
+            context = self._get_node_context(node_name, context_depth)
+            logging.debug(f"Context gathered, length: {len(context)}")
 
-            # Format the template
-            template = self._get_appropriate_template(template_id)
-            if not template:
-                callback("", "No suitable template found")
-                return
+        # Get node data for variable substitution
+        node = self.node_operations.get_node_by_name(node_name, raise_errors=True)
+        if not node:
+            raise ValueError(f"Could not find node: {node_name}")
 
-            prompt = template.format(variables)
+        # Strip HTML from the description for the node data
+        node["description"] = description
 
-            # Send to LLM API (using existing API call mechanism)
-            headers = {"Content-Type": "application/json"}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
+        # Prepare variables
+        variables = self._prompt_template_service.prepare_context_variables(
+            node_data=node, context=context, custom_instructions=custom_instructions
+        )
 
-            payload = {
-                "model": self.model,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": float(os.getenv("OPENAI_TEMPERATURE", 0.7)),
-                "max_tokens": int(os.getenv("OPENAI_MAX_TOKENS", 1000)),
-            }
+        # Format the template
+        template = self._get_appropriate_template(template_id)
+        if not template:
+            raise ValueError("No suitable template found")
 
-            endpoint_url = self.base_url
+        logging.debug(f"Template used: {template.name}")
+        return template.format(variables)
 
-            logging.debug(f"Making enhanced LLM request to: {endpoint_url}")
-            logging.debug(f"Template used: {template.name}")
-            logging.debug(f"Payload: {payload}")
+    @property
+    def http_session(self) -> requests.Session:
+        """Gets the pooled HTTP session used for all LLM requests.
 
-            response = requests.post(
-                endpoint_url, headers=headers, json=payload, timeout=60
-            )
+        Connections to the API are kept alive and reused between requests.
 
-            response.raise_for_status()
-            result = response.json()
-            logging.debug(f"Enhanced LLM response: {result}")
-
-            # Process response
-            if "choices" in result and len(result["choices"]) > 0:
-                completion = result["choices"][0]["message"]["content"]
-            else:
-                # Try alternative formats
-                completion = result.get(
-                    "response",
-                    result.get("content", result.get("output", str(result))),
+        Returns:
+            requests.Session: The shared session.
+        """
+        with self._session_lock:
+            if self._http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_maxsize=int(self.config.get("LLM_POOL_SIZE", 4))
                 )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def close(self) -> None:
+        """Closes the pooled HTTP session."""
+        with self._session_lock:
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+
+    def stream_completion(
+        self, prompt: str, worker: Optional["LLMStreamWorker"] = None
+    ) -> Iterator[str]:
+        """Requests a completion and yields its text as it is generated.
+
+        The request asks for server-sent events. Servers that answer with a
+        plain JSON completion instead yield the whole text at once.
 
-            # Return enhanced text
-            callback(completion, None)
+        Args:
+            prompt (str): The prompt to send.
+            worker (LLMStreamWorker, optional): Worker that may cancel the
+                request by closing the response.
+
+        Yields:
+            str: Pieces of the completion text.
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": float(os.getenv("OPENAI_TEMPERATURE", 0.7)),
+            "max_tokens": int(os.getenv("OPENAI_MAX_TOKENS", 1000)),
+            "stream": True,
+        }
+
+        endpoint_url = self.base_url
+
+        logging.debug(f"Making enhanced LLM request to: {endpoint_url}")
+        logging.debug(f"Payload: {payload}")
+
+        response = self.http_session.post(
+            endpoint_url,
+            headers=headers,
+            json=payload,
+            stream=True,
+            timeout=(10, int(self.config.get("LLM_READ_TIMEOUT", 60))),
+        )
+        with response:
+            if worker is not None:
+                worker.attach_response(response)
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            if "text/event-stream" not in content_type:
+                result = response.json()
+                logging.debug(f"Enhanced LLM response: {result}")
+                yield self._parse_completion(result)
+                return
+            yield from self._iter_event_text(response.iter_lines(decode_unicode=True))
 
-        except Exception as e:
-            logging.error(f"Error in enhanced LLM request: {e}")
-            callback("", str(e))
+    @staticmethod
+    def _iter_event_text(lines: Iterable[str]) -> Iterator[str]:
+        """Extracts the completion text from server-sent event lines.
+
+        Args:
+            lines (Iterable[str]): Lines of the event stream.
+
+        Yields:
+            str: The text of each event that carries some.
+        """
+        for line in lines:
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                return
+            try:
+                event = json.loads(data)
+            except json.JSONDecodeError:
+                logging.warning(f"Skipping malformed LLM stream event: {data}")
+                continue
+            choices = event.get("choices") or [{}]
+            text = (choices[0].get("delta") or {}).get("content") or choices[0].get(
+                "text"
+            )
+            if text:
+                yield text
+
+    @staticmethod
+    def _parse_completion(result: Dict[str, Any]) -> str:
+        """Extracts the completion text from a JSON response."""
+        if "choices" in result and len(result["choices"]) > 0:
+            return result["choices"][0]["message"]["content"]
+        # Try alternative formats
+        return result.get(
+            "response",
+            result.get("content", result.get("output", str(result))),
+        )
 
     def _get_appropriate_template(self, template_id: str):
         """Get the appropriate template, falling back as needed."""
@@ -314,3 +431,89 @@ class LLMService:
             # Fall back to focus type if template not found
             template = self._prompt_template_service.get_template("general")
         return template
+
+
+class LLMStreamWorker(BaseNeo4jWorker):
+    """Worker running a description enhancement on the shared worker pool.
+
+    The prompt, including any graph context, is built and the completion is
+    requested off the GUI thread. Streamed text is emitted through
+    ``chunk_received`` as it arrives and the complete text through
+    ``stream_finished``. Cancelling the worker closes the response, which
+    ends a read that is waiting for the server.
+
+    Args:
+        service (LLMService): The service building prompts and sending requests.
+        node_name (str): The name of the node whose description is enhanced.
+        description (str): The current description as plain text.
+        template_id (str): The prompt template to use.
+        context_depth (int): Levels of connected nodes to include as context.
+        custom_instructions (str): Extra instructions for the template.
+    """
+
+    chunk_received = pyqtSignal(str)
+    stream_finished = pyqtSignal(str)
+
+    # A repeated request would generate and bill the completion again
+    idempotent = False
+
+    def __init__(
+        self,
+        service: LLMService,
+        node_name: str,
+        description: str,
+        template_id: str,
+        context_depth: int,
+        custom_instructions: str,
+    ) -> None:
+        super().__init__(None)
+        self.service = service
+        self.node_name = node_name
+        self.description = description
+        self.template_id = template_id
+        self.context_depth = context_depth
+        self.custom_instructions = custom_instructions
+        self._response: Optional[requests.Response] = None
+        self._response_lock = threading.Lock()
+
+    def attach_response(self, response: requests.Response) -> None:
+        """Registers the open response so that cancelling can close it.
+
+        Args:
+            response (requests.Response): The streamed response.
+        """
+        with self._response_lock:
+            self._response = response
+        if self.is_cancelled:
+            response.close()
+
+    def cancel(self) -> None:
+        """Cancel the enhancement and abort its request without blocking."""
+        super().cancel()
+        with self._response_lock:
+            response = self._response
+        if response is not None:
+            response.close()
+
+    def execute_operation(self) -> None:
+        """Build the prompt and stream the completion."""
+        prompt = self.service.build_prompt(
+            self.node_name,
+            self.description,
+            self.template_id,
+            self.context_depth,
+            self.custom_instructions,
+        )
+        parts: List[str] = []
+        try:
+            for chunk in self.service.stream_completion(prompt, self):
+                if self.is_cancelled:
+                    return
+                parts.append(chunk)
+                self._deliver("chunk_received", chunk)
+        except Exception:
+            if self.is_cancelled:
+                # Closing the response interrupted the read
+                return
+            raise
+        self._deliver("stream_finished", "".join(parts))
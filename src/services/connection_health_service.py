@@ -0,0 +1,92 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from structlog import get_logger
+
+from core.worker_executor import WorkerPriority
+from models.worker_model import WorkerOperation
+
+logger = get_logger(__name__)
+
+
+class ConnectionHealthService(QObject):
+    """
+    Service that tracks database liveness off the GUI thread.
+
+    A timer periodically runs a trivial query on the worker pool and caches
+    the outcome in the model, so synchronous sessions no longer verify
+    connectivity on every call. Changes are announced via ``health_changed``.
+    """
+
+    health_changed = pyqtSignal(bool, str)  # healthy, message
+
+    DEFAULT_INTERVAL_MS = 30000
+
+    def __init__(
+        self,
+        model: "Neo4jModel",
+        worker_manager: "WorkerManagerService",
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+    ) -> None:
+        super().__init__()
+        self.model = model
+        self.worker_manager = worker_manager
+        self._healthy = model.connection_healthy
+        self.check_timer = QTimer(self)
+        self.check_timer.setInterval(interval_ms)
+        self.check_timer.timeout.connect(self.check_now)
+
+    @property
+    def is_healthy(self) -> bool:
+        """Last known connection state."""
+        return self._healthy
+
+    @property
+    def status_message(self) -> str:
+        """Human-readable description of the last known state."""
+        return "Database connected" if self._healthy else "Database unavailable"
+
+    def start_monitoring(self) -> None:
+        """Start periodic liveness checks and announce the current state."""
+        self.check_timer.start()
+        self._announce()
+        logger.debug(
+            "connection_monitoring_started", interval_ms=self.check_timer.interval()
+        )
+
+    def stop_monitoring(self) -> None:
+        """Stop periodic liveness checks."""
+        self.check_timer.stop()
+        logger.debug("connection_monitoring_stopped")
+
+    def check_now(self) -> None:
+        """Queue a liveness check on the worker pool."""
+        try:
+            worker = self.model.check_connection()
+        except Exception as e:
+            # No driver and reconnecting failed
+            self._update(False, str(e))
+            return
+        worker.query_finished.connect(lambda _: self._update(True))
+        operation = WorkerOperation(
+            worker=worker,
+            error_callback=lambda msg: self._update(False, msg),
+            operation_name="connection_health_check",
+            priority=WorkerPriority.NORMAL,
+        )
+        self.worker_manager.execute_worker("health", operation)
+
+    def _update(self, healthy: bool, error: str = "") -> None:
+        """Cache the outcome of a check and announce changes."""
+        self.model.set_connection_health(healthy)
+        if healthy == self._healthy:
+            return
+        self._healthy = healthy
+        if healthy:
+            logger.info("database_connection_restored")
+        else:
+            logger.warning(
+                "database_connection_lost", error=error.strip().splitlines()[-1:]
+            )
+        self._announce()
+
+    def _announce(self) -> None:
+        self.health_changed.emit(self._healthy, self.status_message)
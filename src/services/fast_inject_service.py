@@ -1,13 +1,21 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Set, Union, List
+from typing import Dict, Any, Optional, Set, Tuple, Union, List
 
 from PyQt6.QtWidgets import QTableWidgetItem
 
 
 class FastInjectService:
-    """Service for loading and applying Fast Inject templates."""
+    """Service for loading and applying Fast Inject templates.
+
+    Besides the labels, tags and properties applied to the current node, a
+    template may describe a whole subgraph in ``content.nodes`` and
+    ``content.links``. ``{name}`` in any node or link name is replaced by the
+    name of the current node, e.g. ``"{name} Blacksmith"``.
+    """
+
+    ROOT_PLACEHOLDER = "{name}"
 
     def __init__(self) -> None:
         """Initialize the Fast Inject service."""
@@ -60,6 +68,69 @@ class FastInjectService:
         if not isinstance(template["content"]["properties"], dict):
             raise ValueError("Properties must be a dictionary")
 
+        nodes = template["content"].get("nodes", [])
+        if not isinstance(nodes, list) or not all(
+            isinstance(node, dict) and node.get("name") and node.get("labels")
+            for node in nodes
+        ):
+            raise ValueError("Nodes must be a list of objects with name and labels")
+
+        links = template["content"].get("links", [])
+        if not isinstance(links, list) or not all(
+            isinstance(link, dict) and {"source", "type", "target"} <= link.keys()
+            for link in links
+        ):
+            raise ValueError("Links must be a list of objects with source, type and target")
+
+    def has_subgraph(self, template: Dict[str, Any]) -> bool:
+        """Check whether a template creates nodes besides the current one."""
+        return bool(template["content"].get("nodes"))
+
+    def build_subgraph(
+        self, template: Dict[str, Any], root_name: str
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, str, Dict[str, Any]]]]:
+        """Build the node data and links of a template's subgraph.
+
+        Args:
+            template: Template data with ``content.nodes`` and ``content.links``
+            root_name: Name of the current node, replacing ``{name}``
+
+        Returns:
+            Tuple of node data dicts and (source, type, target, properties) links,
+            ready for ``NodeOperationsService.save_nodes``
+
+        Raises:
+            ValueError: If the template refers to the current node but it has no name
+        """
+        content = template["content"]
+
+        def resolve(name: str) -> str:
+            if self.ROOT_PLACEHOLDER in name and not root_name.strip():
+                raise ValueError("Enter a node name before creating this template's nodes")
+            return name.replace(self.ROOT_PLACEHOLDER, root_name.strip()).strip()
+
+        nodes = [
+            {
+                "name": resolve(node["name"]),
+                "description": node.get("description", ""),
+                "tags": list(node.get("tags", [])),
+                "labels": list(node["labels"]),
+                "relationships": [],
+                "additional_properties": dict(node.get("properties", {})),
+            }
+            for node in content.get("nodes", [])
+        ]
+        links = [
+            (
+                resolve(link["source"]),
+                link["type"],
+                resolve(link["target"]),
+                dict(link.get("properties", {})),
+            )
+            for link in content.get("links", [])
+        ]
+        return nodes, links
+
     def apply_template(
         self,
         ui: "WorldBuildingUI",
@@ -2,14 +2,18 @@ from PyQt6.QtGui import QStandardItemModel
 from PyQt6.QtWidgets import QAbstractItemView
 from structlog import get_logger
 
+from core.async_neo4jmodel import AsyncNeo4jModel
 from models.completer_model import AutoCompletionUIHandler
 from models.suggestion_model import SuggestionUIHandler
 from services.autocompletion_service import AutoCompletionService
+from services.connection_health_service import ConnectionHealthService
 from services.fast_inject_service import FastInjectService
 from services.image_service import ImageService
+from services.node_cleanup_service import NodeCleanupService
 from services.node_operation_service import NodeOperationsService
 from services.property_service import PropertyService
 from services.relationship_tree_service import RelationshipTreeService
+from services.save_queue_service import SaveQueueService
 from services.save_service import SaveService
 from services.search_analysis_service.search_analysis_service import (
     SearchAnalysisService,
@@ -66,6 +70,8 @@ class InitializationService:
         self._initialize_completers()
         self._connect_signals()
         self._initialize_save_service()
+        self._initialize_connection_health_service()
+        self._initialize_node_cleanup_service()
         self._setup_search_handlers()
         self._load_default_state()
 
@@ -93,6 +99,7 @@ class InitializationService:
 
         # 2. Core services that others depend on
         self.worker_manager = WorkerManagerService(self.error_handler)
+        self.async_model = AsyncNeo4jModel(self.model)
 
         # 3. Feature services
         self.fast_inject_service = FastInjectService()
@@ -153,12 +160,46 @@ class InitializationService:
         self.save_service = SaveService(self.node_operations, self.error_handler)
         self.controller.save_service = self.save_service
 
+        self.save_queue = SaveQueueService(
+            self.node_operations,
+            self.error_handler,
+            self.config.get("SAVE_DEBOUNCE_MS", SaveQueueService.DEFAULT_DEBOUNCE_MS),
+        )
+        self.controller.save_queue = self.save_queue
+
         # Start periodic checking only after everything is properly initialized
         self.save_service.start_periodic_check(
             get_current_data=self.controller._get_current_node_data,
             on_state_changed=self.controller._handle_save_state_changed,
         )
 
+    def _initialize_connection_health_service(self) -> None:
+        """Initialize and start background monitoring of the database connection."""
+        self.connection_health_service = ConnectionHealthService(
+            self.model,
+            self.worker_manager,
+            self.config.get(
+                "HEALTH_CHECK_INTERVAL_MS", ConnectionHealthService.DEFAULT_INTERVAL_MS
+            ),
+        )
+        self.controller.connection_health_service = self.connection_health_service
+        self.connection_health_service.start_monitoring()
+
+    def _initialize_node_cleanup_service(self) -> None:
+        """Initialize bulk deletes and the background STUMP collector."""
+        self.node_cleanup_service = NodeCleanupService(
+            self.model,
+            self.worker_manager,
+            self.error_handler,
+            self.search_service,
+            self.config.get(
+                "STUMP_GC_INTERVAL_MS",
+                NodeCleanupService.DEFAULT_COLLECTOR_INTERVAL_MS,
+            ),
+        )
+        self.controller.node_cleanup_service = self.node_cleanup_service
+        self.node_cleanup_service.start_collector()
+
     def _initialize_ui_components(self) -> None:
         """Initialize UI components."""
         self.ui.controller = self.controller
@@ -168,6 +209,7 @@ class InitializationService:
         self.controller.property_service = self.property_service
         self.controller.image_service = self.image_service
         self.controller.worker_manager = self.worker_manager
+        self.controller.async_model = self.async_model
         self.controller.fast_inject_service = self.fast_inject_service
         self.controller.exporter = self.exporter
         self.controller.auto_completion_service = self.auto_completion_service
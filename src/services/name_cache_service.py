@@ -2,6 +2,7 @@ from typing import Set, List, Callable
 
 from structlog import get_logger
 
+from core.worker_executor import WorkerPriority
 from models.worker_model import WorkerOperation
 
 logger = get_logger(__name__)
@@ -39,6 +40,7 @@ class NameCacheService:
                 f"Error rebuilding name cache: {msg}"
             ),
             operation_name="rebuild_name_cache",
+            priority=WorkerPriority.BACKGROUND,
         )
         self.worker_manager.execute_worker("name_cache", operation)
 
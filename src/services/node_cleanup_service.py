@@ -0,0 +1,170 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from structlog import get_logger
+
+from core.worker_executor import WorkerPriority
+from models.worker_model import WorkerOperation
+from services.search_analysis_service.search_analysis_service import (
+    SearchAnalysisService,
+    SearchCriteria,
+)
+from utils.error_handler import ErrorHandler
+
+logger = get_logger(__name__)
+
+
+class NodeCleanupService(QObject):
+    """
+    Service for bulk deletes and the garbage collection of STUMP nodes.
+
+    Bulk deletes take a list of names or search criteria and run in chunked
+    transactions. Deleting nodes can leave the STUMP placeholders they pointed
+    to without any relationship, so by default every bulk delete is followed
+    by a collection of orphaned STUMPs. The collector also runs periodically
+    in the background while ``start_collector`` is active.
+    """
+
+    progress_updated = pyqtSignal(str, int, int)  # operation, current, total
+    stumps_collected = pyqtSignal(dict)
+
+    DEFAULT_COLLECTOR_INTERVAL_MS = 3600000
+
+    def __init__(
+        self,
+        model: "Neo4jModel",
+        worker_manager: "WorkerManagerService",
+        error_handler: ErrorHandler,
+        search_service: Optional[SearchAnalysisService] = None,
+        collector_interval_ms: int = DEFAULT_COLLECTOR_INTERVAL_MS,
+    ) -> None:
+        super().__init__()
+        self.model = model
+        self.worker_manager = worker_manager
+        self.error_handler = error_handler
+        self.search_service = search_service
+
+        self.collector_timer = QTimer(self)
+        self.collector_timer.setInterval(collector_interval_ms)
+        self.collector_timer.timeout.connect(self.collect_stumps)
+
+    def start_collector(self) -> None:
+        """Start collecting orphaned STUMP nodes periodically."""
+        if self.collector_timer.interval() <= 0:
+            logger.debug("stump_collector_disabled")
+            return
+        self.collector_timer.start()
+        logger.debug(
+            "stump_collector_started", interval_ms=self.collector_timer.interval()
+        )
+
+    def stop_collector(self) -> None:
+        """Stop the periodic collection."""
+        self.collector_timer.stop()
+
+    def delete_nodes(
+        self,
+        names: List[str],
+        callback: Callable[[Dict[str, int]], None],
+        cascade: bool = True,
+    ) -> None:
+        """
+        Delete nodes by name in chunked transactions.
+
+        Args:
+            names: Names of the nodes to delete
+            callback: Callback with the ``requested``, ``processed`` and
+                ``deleted`` counts
+            cascade: Whether to collect STUMPs orphaned by the delete
+        """
+        names = [name.strip() for name in names if name and name.strip()]
+        if not names:
+            callback({"requested": 0, "processed": 0, "deleted": 0})
+            return
+
+        def handle_finished(summary: Dict[str, int]) -> None:
+            logger.info("bulk_delete_finished", **summary)
+            if self.search_service:
+                self.search_service.clear_cache()
+            callback(summary)
+            if cascade and summary["deleted"]:
+                self.collect_stumps()
+
+        worker = self.model.delete_nodes(names, handle_finished)
+        worker.batch_progress.connect(
+            lambda done, total: self.progress_updated.emit("delete", done, total)
+        )
+
+        operation = WorkerOperation(
+            worker=worker,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error deleting nodes: {msg}"
+            ),
+            operation_name="bulk_delete",
+        )
+        self.worker_manager.execute_worker("bulk_delete", operation)
+
+    def delete_matching(
+        self,
+        criteria: SearchCriteria,
+        callback: Callable[[Dict[str, int]], None],
+        cascade: bool = True,
+    ) -> None:
+        """
+        Delete every node found by a search.
+
+        The search is limited by ``criteria.limit`` like any other search.
+
+        Args:
+            criteria: Search criteria selecting the nodes
+            callback: Callback with the delete summary
+            cascade: Whether to collect STUMPs orphaned by the delete
+        """
+        if self.search_service is None:
+            raise RuntimeError("Deleting by search criteria needs a search service")
+
+        def handle_results(results: List[Dict[str, Any]]) -> None:
+            self.delete_nodes([r["name"] for r in results], callback, cascade)
+
+        self.search_service.search_nodes(
+            criteria,
+            handle_results,
+            lambda msg: self.error_handler.handle_error(
+                f"Error finding nodes to delete: {msg}"
+            ),
+        )
+
+    def collect_stumps(
+        self,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        dry_run: bool = False,
+    ) -> None:
+        """
+        Delete the orphaned STUMP nodes of the active project in batches.
+
+        Args:
+            callback: Optional callback with the collection summary
+            dry_run: Only count the orphans and list a sample of their names
+        """
+
+        def handle_finished(summary: Dict[str, Any]) -> None:
+            if summary["deleted"] and self.search_service:
+                self.search_service.clear_cache()
+            self.stumps_collected.emit(summary)
+            if callback:
+                callback(summary)
+
+        worker = self.model.collect_orphan_stumps(handle_finished, dry_run=dry_run)
+        worker.batch_progress.connect(
+            lambda done, total: self.progress_updated.emit("stumps", done, total)
+        )
+
+        operation = WorkerOperation(
+            worker=worker,
+            error_callback=lambda msg: logger.error(
+                "stump_collection_failed", error=msg
+            ),
+            operation_name="stump_collection",
+            priority=WorkerPriority.BACKGROUND,
+        )
+        self.worker_manager.execute_worker("stump_gc", operation)
@@ -7,6 +7,8 @@ from structlog import get_logger
 
 from config.config import Config
 from core.neo4jmodel import Neo4jModel
+from core.node_diff import NodeVersionConflict
+from core.worker_executor import WorkerPriority
 from models.property_model import PropertyItem
 from models.worker_model import WorkerOperation
 from services.property_service import PropertyService
@@ -65,26 +67,80 @@ class NodeOperationsService:
         self.error_handler = error_handler
 
     def save_node(
-        self, node_data: Dict[str, Any], success_callback: Callable[[Any], None]
+        self,
+        node_data: Dict[str, Any],
+        success_callback: Callable[[Any], None],
+        original_data: Optional[Dict[str, Any]] = None,
+        error_callback: Optional[Callable[[str], None]] = None,
+        worker_id: str = "save",
+        conflict_callback: Optional[Callable[[NodeVersionConflict], None]] = None,
     ) -> None:
         """Save node with worker thread management.
 
+        With the node data as it was loaded, only the changes are written.
+
         Args:
             node_data: Complete node data to save
             success_callback: Callback for successful save
+            original_data: Optional node data as loaded, for an incremental save
+            error_callback: Optional callback for a failed save
+            worker_id: Worker ID; a running save with the same ID is cancelled
+            conflict_callback: Optional callback for a save rejected because
+                the node was changed by someone else since it was loaded
         """
-        worker = self.model.save_node(node_data, success_callback)
+        if original_data and original_data.get("name") == node_data["name"]:
+            worker = self.model.save_node_changes(
+                original_data, node_data, success_callback, conflict_callback
+            )
+        else:
+            worker = self.model.save_node(
+                node_data, success_callback, conflict_callback
+            )
 
         operation = WorkerOperation(
             worker=worker,
             success_callback=success_callback,
-            error_callback=lambda msg: self.error_handler.handle_error(
-                f"Error saving node: {msg}"
+            error_callback=error_callback
+            or (
+                lambda msg: self.error_handler.handle_error(f"Error saving node: {msg}")
             ),
             operation_name="save_node",
         )
 
-        self.worker_manager.execute_worker("save", operation)
+        self.worker_manager.execute_worker(worker_id, operation)
+
+    def save_nodes(
+        self,
+        nodes: List[Dict[str, Any]],
+        links: List[Tuple[str, str, str, Dict[str, Any]]],
+        success_callback: Callable[[Any], None],
+        error_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Create many nodes and the links between them in one transaction.
+
+        Nodes that already exist are left unchanged.
+
+        Args:
+            nodes: Complete node data of every node to create
+            links: (source, type, target, properties) relationships to add
+            success_callback: Callback with the ``created`` and ``existing`` names
+            error_callback: Optional callback for a failed save
+        """
+        worker = self.model.save_nodes(nodes, links, success_callback)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=success_callback,
+            error_callback=error_callback
+            or (
+                lambda msg: self.error_handler.handle_error(
+                    f"Error saving nodes: {msg}"
+                )
+            ),
+            operation_name="save_nodes",
+        )
+
+        self.worker_manager.execute_worker("save_nodes", operation)
 
     def load_node(
         self,
@@ -116,6 +172,38 @@ class NodeOperationsService:
 
         self.worker_manager.execute_worker("load", operation)
 
+    def prefetch_neighbours(self, name: str) -> None:
+        """Load the neighbours of a node into the node cache in the background.
+
+        At most PREFETCH_NEIGHBOURS neighbours are loaded, those reached
+        through the relationship types in PREFETCH_TYPE_PRIORITY first. A
+        newer prefetch replaces one still running.
+
+        Args:
+            name: Name of the loaded node
+        """
+        if not name.strip():
+            return
+
+        worker = self.model.prefetch_neighbours(
+            name,
+            self.config.get("PREFETCH_NEIGHBOURS", 10),
+            self.config.get("PREFETCH_TYPE_PRIORITY", []),
+        )
+        if worker is None:
+            return
+
+        operation = WorkerOperation(
+            worker=worker,
+            error_callback=lambda msg: logger.warning(
+                "neighbour_prefetch_failed", node=name, error=msg
+            ),
+            operation_name="prefetch_neighbours",
+            priority=WorkerPriority.BACKGROUND,
+        )
+
+        self.worker_manager.execute_worker("prefetch", operation)
+
     def delete_node(self, name: str, success_callback: Callable[[Any], None]) -> None:
         """Delete node using worker thread.
 
@@ -188,6 +276,8 @@ class NodeOperationsService:
                 "labels": [label.strip() for label in parse_comma_separated(labels)],
                 "relationships": self._format_relationships(relationships),
                 "additional_properties": properties,
+                # Version of the loaded node, checked when saving
+                "version": all_props.get("_version", 0) if all_props else None,
             }
 
         except Exception as e:
@@ -255,12 +345,18 @@ class NodeOperationsService:
 
         return formatted_relationships
 
-    def get_node_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+    def get_node_by_name(
+        self, name: str, raise_errors: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Get node by name synchronously with relationship data.
 
+        The node is served from the model's node cache when possible.
+
         Args:
             name: Name of the node to retrieve
+            raise_errors: Raise database errors instead of reporting them,
+                for callers off the GUI thread
 
         Returns:
             Dict containing node data or None if not found
@@ -269,41 +365,63 @@ class NodeOperationsService:
             return None
 
         try:
-            with self.model.get_session() as session:
-                result = session.run(
-                    """
-                    MATCH (n {name: $name, _project: $project})
-                    WITH n, labels(n) AS labels,
-                         [(n)-[r]->(m) | {target: m.name, type: type(r), direction: 'OUTGOING'}] AS out_rels,
-                         [(n)<-[r2]-(o) | {target: o.name, type: type(r2), direction: 'INCOMING'}] AS in_rels,
-                         properties(n) AS all_props
-                    RETURN n,
-                           out_rels + in_rels AS relationships,
-                           labels,
-                           all_props
-                    LIMIT 1
-                    """,
-                    name=name,
-                    project=self.model._project,
+            records = self.model.get_node_records(name)
+            if records:
+                record = records[0]
+                # Convert Neo4j node to dict and ensure 'name' is included
+                node_data = dict(record["n"])  # This preserves all node properties
+
+                # Make sure these fields are available at the top level
+                node_data.update(
+                    {
+                        "name": name,
+                        "labels": record["labels"],
+                        "all_props": record["all_props"],
+                        "relationships": [
+                            {
+                                "target": rel["end"],
+                                "type": rel["type"],
+                                "direction": (
+                                    "OUTGOING" if rel["dir"] == ">" else "INCOMING"
+                                ),
+                            }
+                            for rel in record["relationships"]
+                        ],
+                    }
                 )
-                record = result.single()
-                if record:
-                    # Convert Neo4j node to dict and ensure 'name' is included
-                    node_data = dict(record["n"])  # This preserves all node properties
-
-                    # Make sure these fields are available at the top level
-                    node_data.update(
-                        {
-                            "name": name,
-                            "labels": record["labels"],
-                            "all_props": record["all_props"],
-                            "relationships": record["relationships"],
-                        }
-                    )
-                    # Remove reserved properties
-                    logger.debug(f"Node data from get_node_by_name:" f" {node_data}")
-                    return node_data
-                return None
+                # Remove reserved properties
+                logger.debug(f"Node data from get_node_by_name:" f" {node_data}")
+                return node_data
+            return None
         except Exception as e:
+            if raise_errors:
+                raise
             self.error_handler.handle_error(f"Error getting node: {str(e)}")
             return None
+
+    def get_context_subgraph(
+        self, name: str, depth: int, max_nodes: int, raise_errors: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the neighbourhood of a node up to a depth synchronously.
+
+        Args:
+            name: Name of the node to start from
+            depth: Maximum number of relationship hops
+            max_nodes: Maximum number of nodes to load
+            raise_errors: Raise database errors instead of reporting them,
+                for callers off the GUI thread
+
+        Returns:
+            Nodes in breadth-first order, empty if the node was not found
+        """
+        if not name or not name.strip():
+            return []
+
+        try:
+            return self.model.get_context_subgraph(name, depth, max_nodes)
+        except Exception as e:
+            if raise_errors:
+                raise
+            self.error_handler.handle_error(f"Error getting node context: {str(e)}")
+            return []
@@ -0,0 +1,213 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, QTimer, pyqtSignal
+from structlog import get_logger
+
+from core.node_diff import NodeVersionConflict
+from services.node_operation_service import NodeOperationsService
+from utils.error_handler import ErrorHandler
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PendingSave:
+    """A save waiting in the queue, merged from one or more requests."""
+
+    node_data: Dict[str, Any]
+    original_data: Optional[Dict[str, Any]]
+    callback: Callable[[Any], None]
+    conflict_callback: Optional[Callable[[NodeVersionConflict], None]] = None
+    merged: int = 0
+
+
+class SaveQueueService(QObject):
+    """
+    Write-behind queue for node saves.
+
+    Save requests are held for a short debounce period. Requests for a node
+    that is already waiting are merged: the newest data replaces the queued
+    data, while the data the node was loaded with is kept as the base of an
+    incremental save, so a burst of saves costs one write. Only the newest
+    request's callback is called.
+
+    Nodes are written in the order they were first queued, and only one write
+    per node is in flight at a time. A save requested while the node is being
+    written waits for that write and then uses the written data, and the
+    version that write left on the node, as its base.
+    """
+
+    depth_changed = pyqtSignal(int)  # saves queued or in flight
+
+    DEFAULT_DEBOUNCE_MS = 300
+
+    def __init__(
+        self,
+        node_operations: NodeOperationsService,
+        error_handler: ErrorHandler,
+        debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+    ) -> None:
+        super().__init__()
+        self.node_operations = node_operations
+        self.error_handler = error_handler
+        self._pending: "OrderedDict[str, PendingSave]" = OrderedDict()
+        self._in_flight: Dict[str, Dict[str, Any]] = {}
+        self._waiters: Dict[str, List[Callable[[bool], None]]] = {}
+        self.saves_requested = 0
+        self.writes_issued = 0
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(debounce_ms)
+        self.flush_timer.timeout.connect(self.flush)
+
+    @property
+    def depth(self) -> int:
+        """Number of nodes with a save queued or in flight."""
+        return len(self._pending.keys() | self._in_flight.keys())
+
+    def enqueue(
+        self,
+        node_data: Dict[str, Any],
+        callback: Callable[[Any], None],
+        original_data: Optional[Dict[str, Any]] = None,
+        conflict_callback: Optional[Callable[[NodeVersionConflict], None]] = None,
+    ) -> None:
+        """
+        Queue a node save, merging it with a save already queued for the node.
+
+        Args:
+            node_data: Complete node data to save
+            callback: Callback for a successful save
+            original_data: Optional node data as loaded, for an incremental save
+            conflict_callback: Optional callback for a save rejected because the
+                node was changed by someone else since it was loaded
+        """
+        name = node_data["name"]
+        self.saves_requested += 1
+
+        if pending := self._pending.get(name):
+            pending.node_data = node_data
+            pending.callback = callback
+            pending.conflict_callback = conflict_callback
+            pending.merged += 1
+            logger.debug("save_merged", node=name, merged=pending.merged)
+        else:
+            self._pending[name] = PendingSave(
+                node_data, original_data, callback, conflict_callback
+            )
+            logger.debug("save_queued", node=name)
+
+        self.flush_timer.start()
+        self._announce()
+
+    def when_saved(self, name: str, callback: Callable[[bool], None]) -> None:
+        """
+        Call back once the saves of a node queued so far are written.
+
+        The callback gets True when the node has no save queued or in flight
+        any more, or False as soon as one of its writes fails or conflicts.
+        It is called at once if nothing is queued for the node.
+
+        Args:
+            name: Name of the node
+            callback: Callback with whether the saves were written
+        """
+        if name not in self._pending and name not in self._in_flight:
+            callback(True)
+            return
+        self._waiters.setdefault(name, []).append(callback)
+
+    def flush(self) -> None:
+        """Write every queued node that is not already being written."""
+        self.flush_timer.stop()
+        for name in list(self._pending):
+            if name not in self._in_flight:
+                self._dispatch(name, self._pending.pop(name))
+        self._announce()
+
+    def drain(self, timeout_ms: int = 5000) -> None:
+        """
+        Write all queued saves and wait for them to finish, e.g. on shutdown.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        self.flush()
+        while self.depth and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            self.flush()
+            QThread.msleep(10)
+
+        logger.info(
+            "save_queue_drained",
+            remaining=self.depth,
+            saves_requested=self.saves_requested,
+            writes_issued=self.writes_issued,
+        )
+
+    def _dispatch(self, name: str, pending: PendingSave) -> None:
+        """Start the write of one merged save."""
+        self._in_flight[name] = pending.node_data
+        self.writes_issued += 1
+
+        def handle_success(result: Any) -> None:
+            # The save's result is the version it left on the node
+            self._finish(name, pending.node_data, result)
+            pending.callback(result)
+            if name not in self._pending and name not in self._in_flight:
+                self._notify(name, True)
+
+        def handle_error(message: str) -> None:
+            self._finish(name, None)
+            self._notify(name, False)
+            self.error_handler.handle_error(f"Error saving node: {message}")
+
+        def handle_conflict(conflict: NodeVersionConflict) -> None:
+            self._finish(name, None)
+            self._notify(name, False)
+            if pending.conflict_callback:
+                pending.conflict_callback(conflict)
+            else:
+                self.error_handler.handle_error(str(conflict))
+
+        try:
+            self.node_operations.save_node(
+                pending.node_data,
+                handle_success,
+                original_data=pending.original_data,
+                error_callback=handle_error,
+                worker_id=f"save:{name}",
+                conflict_callback=handle_conflict,
+            )
+        except Exception as e:
+            handle_error(str(e))
+
+    def _finish(
+        self,
+        name: str,
+        saved_data: Optional[Dict[str, Any]],
+        version: Optional[int] = None,
+    ) -> None:
+        """Release a node after its write and schedule any save that waited."""
+        self._in_flight.pop(name, None)
+        if pending := self._pending.get(name):
+            if saved_data is not None:
+                pending.original_data = saved_data
+                # Checked against the version the write left, if it was checked
+                if saved_data.get("version") is not None:
+                    pending.node_data = {**pending.node_data, "version": version}
+            self.flush_timer.start()
+        self._announce()
+
+    def _notify(self, name: str, saved: bool) -> None:
+        """Call the callbacks waiting for the saves of a node."""
+        for callback in self._waiters.pop(name, []):
+            callback(saved)
+
+    def _announce(self) -> None:
+        self.depth_changed.emit(self.depth)
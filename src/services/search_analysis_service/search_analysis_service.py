@@ -6,8 +6,15 @@ from typing import Optional, List, Dict, Any, Callable, Tuple
 
 from structlog import get_logger
 
+from core.fulltext import (
+    FULLTEXT_INDEX,
+    build_lucene_query,
+    highlight_snippet,
+    search_terms,
+)
 from models.worker_model import WorkerOperation
 from services.worker_manager_service import WorkerManagerService
+from utils.html_text import html_to_text
 
 logger = get_logger(__name__)
 
@@ -61,6 +68,7 @@ class SearchCriteria:
 
     # Search options
     case_sensitive: bool = False
+    fuzzy: bool = False
     limit: Optional[int] = None
 
 
@@ -162,14 +170,20 @@ class SearchAnalysisService:
         criteria: SearchCriteria,
         result_callback: Callable[[List[Dict[str, Any]]], None],
         error_callback: Optional[Callable[[str], None]] = None,
+        chunk_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
     ) -> None:
         """
         Search for nodes based on enhanced search criteria.
 
+        With a chunk callback the query is streamed: each page of processed
+        results is passed to ``chunk_callback`` as it arrives, and
+        ``result_callback`` receives the complete list at the end.
+
         Args:
             criteria: SearchCriteria configuration with field searches and filters
             result_callback: Callback for search results
             error_callback: Optional error callback
+            chunk_callback: Optional callback for incremental result pages
         """
         logger.debug(
             "initiating_search",
@@ -190,26 +204,56 @@ class SearchAnalysisService:
         ):
             if cached_results := self._get_from_cache(cache_key):
                 logger.debug("cache_hit", field_searches=criteria.field_searches)
+                if chunk_callback:
+                    chunk_callback(cached_results)
                 result_callback(cached_results)
                 return
 
-        # Build query using QueryBuilder
+        # Build query using QueryBuilder, preferring the full-text index
+        full_text = self._use_full_text(criteria)
         try:
-            query, params = self._build_search_query(criteria)
+            query, params = self._build_search_query(criteria, full_text)
         except ValueError as e:
             logger.error("query_build_error", error=str(e))
             if error_callback:
                 error_callback(str(e))
             return
 
+        cacheable = not criteria.label_filters and not criteria.required_properties
+        highlight_terms = None
+        query_error_callback = error_callback or self.error_handler
+        if full_text:
+            highlight_terms = [
+                term
+                for fs in criteria.field_searches
+                for term in search_terms(fs.text or "")
+            ]
+            query_error_callback = self._full_text_fallback(
+                criteria, result_callback, error_callback, chunk_callback
+            )
+
+        if chunk_callback:
+            self._stream_search(
+                query,
+                params,
+                cache_key if cacheable else None,
+                chunk_callback,
+                result_callback,
+                query_error_callback,
+                highlight_terms,
+            )
+            return
+
         def handle_results(results: List[Dict[str, Any]]) -> None:
             """Process and cache search results."""
             logger.debug("search_results_received", count=len(results))
             try:
-                processed_results = self._process_search_results(results)
+                processed_results = self._process_search_results(
+                    results, highlight_terms
+                )
 
                 # Cache simple search results
-                if not criteria.label_filters and not criteria.required_properties:
+                if cacheable:
                     self._cache_results(cache_key, processed_results)
 
                 result_callback(processed_results)
@@ -225,16 +269,95 @@ class SearchAnalysisService:
         operation = WorkerOperation(
             worker=worker,
             success_callback=handle_results,
-            error_callback=error_callback or self.error_handler,
+            error_callback=query_error_callback,
+            operation_name="node_search",
+        )
+
+        self.worker_manager.execute_worker("search", operation)
+
+    def _use_full_text(self, criteria: SearchCriteria) -> bool:
+        """Whether the search can be answered from the full-text index."""
+        return self.model.fulltext_available and FullTextSearchQueryBuilder.supports(
+            criteria
+        )
+
+    def _full_text_fallback(
+        self,
+        criteria: SearchCriteria,
+        result_callback: Callable[[List[Dict[str, Any]]], None],
+        error_callback: Optional[Callable[[str], None]],
+        chunk_callback: Optional[Callable[[List[Dict[str, Any]]], None]],
+    ) -> Callable[[str], None]:
+        """
+        Create an error callback for a full-text search that repeats the
+        search as a substring search if the full-text index is missing.
+        """
+
+        def handle_error(message: str) -> None:
+            if FULLTEXT_INDEX in message or "fulltext" in message.lower():
+                logger.warning("fulltext_search_failed", error=message)
+                self.model.mark_fulltext_unavailable()
+                self.search_nodes(
+                    criteria, result_callback, error_callback, chunk_callback
+                )
+                return
+            (error_callback or self.error_handler)(message)
+
+        return handle_error
+
+    def _stream_search(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        cache_key: Optional[str],
+        chunk_callback: Callable[[List[Dict[str, Any]]], None],
+        result_callback: Callable[[List[Dict[str, Any]]], None],
+        error_callback: Callable[[str], None],
+        highlight_terms: Optional[List[str]] = None,
+    ) -> None:
+        """Run a search query as a stream, processing results page by page."""
+        processed_results: List[Dict[str, Any]] = []
+
+        def handle_chunk(records: List[Any]) -> None:
+            """Process one page of search results."""
+            try:
+                processed_chunk = self._process_search_results(records, highlight_terms)
+            except Exception as e:
+                logger.error("search_processing_error", error=str(e))
+                return
+            processed_results.extend(processed_chunk)
+            chunk_callback(processed_chunk)
+
+        def handle_finished(total: int) -> None:
+            """Cache and report the complete search results."""
+            logger.debug(
+                "search_stream_finished",
+                count=total,
+                processed=len(processed_results),
+            )
+            if cache_key is not None:
+                self._cache_results(cache_key, processed_results)
+            result_callback(processed_results)
+
+        worker = self.model.execute_streaming_read_query(query, params)
+        worker.records_chunk.connect(handle_chunk)
+        worker.stream_finished.connect(handle_finished)
+
+        operation = WorkerOperation(
+            worker=worker,
+            error_callback=error_callback,
             operation_name="node_search",
         )
 
         self.worker_manager.execute_worker("search", operation)
 
     def _build_search_query(
-        self, criteria: SearchCriteria
+        self, criteria: SearchCriteria, full_text: bool = False
     ) -> tuple[str, Dict[str, Any]]:
         """Build enhanced search query using SearchQueryBuilder."""
+        if full_text:
+            return FullTextSearchQueryBuilder().build_search_query(criteria)
+
         # Check if property discovery needs to be refreshed (once per day)
         if (
             datetime.now() - self._property_discovery_timestamp
@@ -248,9 +371,16 @@ class SearchAnalysisService:
         return builder.build_search_query(criteria)
 
     def _process_search_results(
-        self, results: List[Dict[str, Any]]
+        self,
+        results: List[Dict[str, Any]],
+        highlight_terms: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Process raw search results with enhanced property and relationship handling."""
+        """
+        Process raw search results with enhanced property and relationship handling.
+
+        Full-text results carry a relevance ``score`` and a highlighted
+        ``snippet`` and are ordered by score; other results by name.
+        """
         processed_results = []
 
         for result in results:
@@ -280,6 +410,13 @@ class SearchAnalysisService:
                     "properties": filtered_props,
                 }
 
+                score = result.get("score")
+                if score is not None:
+                    processed_result["score"] = score
+                    processed_result["snippet"] = self._build_snippet(
+                        node_props, highlight_terms or []
+                    )
+
                 # Validate required fields
                 if not processed_result["name"]:
                     logger.warning("missing_node_name", original_props=node_props)
@@ -292,9 +429,22 @@ class SearchAnalysisService:
                 continue
 
         # Sort results for consistency
-        processed_results.sort(key=lambda x: x["name"])
+        processed_results.sort(key=lambda x: (-x.get("score", 0), x["name"]))
         return processed_results
 
+    @staticmethod
+    def _build_snippet(properties: Dict[str, Any], terms: List[str]) -> Optional[str]:
+        """Highlight the search terms in the first text field containing one."""
+        for key in FullTextSearchQueryBuilder.TEXT_FIELDS.values():
+            value = properties.get(key)
+            if isinstance(value, list):
+                value = ", ".join(str(item) for item in value)
+            elif key == "description":
+                value = html_to_text(value)
+            if snippet := highlight_snippet(value, terms):
+                return snippet
+        return None
+
     def _filter_system_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Filter out system properties and format values."""
         # Safe fallback for missing config attribute
@@ -321,6 +471,9 @@ class SearchAnalysisService:
                 f"{fs.field.value}:{fs.text}:{fs.exact_match}:{fs.case_sensitive}"
             )
 
+        if criteria.fuzzy:
+            components.append("fuzzy")
+
         # Add filters to key
         if criteria.label_filters:
             components.append(f"labels:{','.join(sorted(criteria.label_filters))}")
@@ -522,7 +675,6 @@ class FilterClauseBuilder(ClauseBuilder):
         self.criteria = criteria
 
     def build(self) -> QueryComponent:
-
         clauses = []
 
         if self.criteria.exclude_labels:
@@ -570,7 +722,7 @@ class ReturnClauseBuilder(ClauseBuilder):
             "\n".join(
                 [
                     "RETURN n,",
-                    "labels(n) as n_labels,",
+                    "[label IN labels(n) WHERE NOT label STARTS WITH '_'] as n_labels,",
                     "properties(n) as n_props",
                     "ORDER BY n.name",
                     f"LIMIT {self.limit or 1000}",
@@ -635,3 +787,101 @@ class SearchQueryBuilder:
         query_parts.append(return_component.text)
 
         return "\n".join(query_parts), parameters
+
+
+class FullTextSearchQueryBuilder:
+    """
+    Composes a search query that finds nodes through the full-text index.
+
+    Name, description and tag searches become a Lucene query, ranked by
+    relevance. Labels are not indexed: label searches match the label names
+    from the label catalogue and return the nodes carrying them. Exact and
+    case-sensitive searches and property searches are not supported and use
+    SearchQueryBuilder instead.
+    """
+
+    TEXT_FIELDS = {
+        SearchField.NAME: "name",
+        SearchField.DESCRIPTION: "description",
+        SearchField.TAGS: "tags",
+    }
+
+    @classmethod
+    def supports(cls, criteria: SearchCriteria) -> bool:
+        """Whether all field searches of the criteria can use the index."""
+        searches = [fs for fs in criteria.field_searches if fs.text]
+        return all(
+            not fs.exact_match
+            and not fs.case_sensitive
+            and (fs.field in cls.TEXT_FIELDS or fs.field == SearchField.LABELS)
+            for fs in searches
+        ) and any(
+            fs.field in cls.TEXT_FIELDS and search_terms(fs.text) for fs in searches
+        )
+
+    def build_search_query(
+        self, criteria: SearchCriteria
+    ) -> Tuple[str, Dict[str, Any]]:
+        fields_by_text: Dict[str, List[str]] = {}
+        label_texts = []
+        for fs in criteria.field_searches:
+            if not fs.text:
+                continue
+            if fs.field == SearchField.LABELS:
+                label_texts.append(fs.text)
+            else:
+                fields_by_text.setdefault(fs.text, []).append(
+                    self.TEXT_FIELDS[fs.field]
+                )
+
+        clauses = [
+            build_lucene_query(text, fields, criteria.fuzzy)
+            for text, fields in fields_by_text.items()
+        ]
+        parameters: Dict[str, Any] = {
+            "fulltext_index": FULLTEXT_INDEX,
+            "fulltext_query": " OR ".join(f"({c})" for c in clauses if c),
+        }
+
+        candidates = [
+            "CALL db.index.fulltext.queryNodes($fulltext_index, $fulltext_query)",
+            "YIELD node, score",
+            "RETURN node AS n, score",
+        ]
+        if label_texts:
+            parameters["label_texts"] = label_texts
+            candidates.extend(
+                [
+                    "UNION ALL",
+                    "CALL db.labels() YIELD label",
+                    "WITH label WHERE NOT label STARTS WITH '_'",
+                    "AND ANY(text IN $label_texts"
+                    " WHERE toLower(label) CONTAINS toLower(text))",
+                    "MATCH (n:_Node) WHERE label IN labels(n)",
+                    "RETURN n, 0.0 AS score",
+                ]
+            )
+
+        where_conditions = ["n._project = $project"]
+        match_component = MatchClauseBuilder(criteria.label_filters).build()
+        if match_component.parameters.get("label_clause"):
+            where_conditions.append(match_component.parameters["label_clause"])
+        filter_component = FilterClauseBuilder(criteria).build()
+        if filter_component.text:
+            where_conditions.append(filter_component.text)
+            parameters.update(filter_component.parameters)
+
+        query_parts = [
+            "CALL {",
+            *candidates,
+            "}",
+            "WITH n, max(score) AS score",
+            "WHERE " + " AND ".join(where_conditions),
+            "RETURN n,",
+            "[label IN labels(n) WHERE NOT label STARTS WITH '_'] as n_labels,",
+            "properties(n) as n_props,",
+            "score",
+            "ORDER BY score DESC, n.name",
+            f"LIMIT {criteria.limit or 1000}",
+        ]
+        return "\n".join(query_parts), parameters
@@ -6,6 +6,7 @@ from structlog import get_logger
 from config.config import Config
 from core.neo4jmodel import Neo4jModel
 from core.neo4jworkers import SuggestionWorker
+from core.worker_executor import WorkerPriority
 from models.suggestion_model import SuggestionUIHandler
 from models.worker_model import WorkerOperation
 from services.worker_manager_service import WorkerManagerService
@@ -47,9 +48,7 @@ class SuggestionService(QObject):
             return
 
         self.ui_handler.show_loading(True)
-        worker = SuggestionWorker(
-            self.model._uri, self.model._auth, node_data, self.config
-        )
+        worker = SuggestionWorker(self.model.driver, node_data, self.config)
 
         # Use operation's success_callback directly
         operation = WorkerOperation(
@@ -58,6 +57,7 @@ class SuggestionService(QObject):
             error_callback=self._handle_error,
             finished_callback=lambda: self.ui_handler.show_loading(False),
             operation_name="suggestions",
+            priority=WorkerPriority.BACKGROUND,
         )
 
         # Connect the signal to the operation's success callback
@@ -1,22 +1,31 @@
 from typing import Dict
 
 from PyQt6.QtCore import QObject
+from structlog import get_logger
 
+from core.worker_executor import WorkerExecutor
 from models.worker_model import WorkerOperation
 
+logger = get_logger(__name__)
+
 
 class WorkerManagerService(QObject):
-    """Service for managing background worker threads."""
+    """Service for managing background workers on the shared thread pool."""
 
     def __init__(self, error_handler) -> None:
         super().__init__()
         self.error_handler = error_handler
         self._active_workers: Dict[str, WorkerOperation] = {}
+        self._discarded_results: Dict[str, int] = {}
 
     def execute_worker(self, worker_id: str, operation: WorkerOperation) -> None:
         """
         Execute a worker with proper cleanup and error handling.
 
+        Any worker already running under the same ID is cancelled without
+        waiting for it. Its results are discarded when they arrive and counted
+        in ``discarded_result_counts``.
+
         Args:
             worker_id: Unique identifier for this worker operation
             operation: Worker operation configuration
@@ -31,36 +40,73 @@ class WorkerManagerService(QObject):
         operation.worker.error_occurred.connect(
             lambda err: self._handle_worker_error(worker_id, err, operation)
         )
+        operation.worker.finished.connect(
+            lambda: self._handle_worker_finished(worker_id, operation)
+        )
+        operation.worker.result_discarded.connect(
+            lambda signal_name: self._record_discarded_result(worker_id, signal_name)
+        )
 
-        if operation.finished_callback:
-            operation.worker.finished.connect(
-                lambda: self._handle_worker_finished(worker_id, operation)
-            )
-
-        # Start the worker
-        operation.worker.start()
+        # Queue the worker on the shared pool
+        WorkerExecutor.instance().submit(operation.worker, operation.priority)
 
     def cancel_worker(self, worker_id: str) -> None:
         """
-        Cancel and clean up a specific worker.
+        Cancel and forget a specific worker without blocking.
 
         Args:
             worker_id: ID of the worker to cancel
         """
-        if operation := self._active_workers.get(worker_id):
+        if operation := self._active_workers.pop(worker_id, None):
             operation.worker.cancel()
-            operation.worker.wait()
-            del self._active_workers[worker_id]
 
     def cancel_all_workers(self) -> None:
         """Cancel and clean up all active workers."""
         for worker_id in list(self._active_workers.keys()):
             self.cancel_worker(worker_id)
 
+    def shutdown(self, timeout_ms: int = 5000) -> None:
+        """
+        Cancel all workers and wait for the shared pool to drain.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds
+        """
+        self.cancel_all_workers()
+        WorkerExecutor.instance().shutdown(timeout_ms)
+
+    @property
+    def discarded_result_count(self) -> int:
+        """Total number of superseded results that were discarded."""
+        return sum(self._discarded_results.values())
+
+    @property
+    def discarded_result_counts(self) -> Dict[str, int]:
+        """Number of discarded superseded results per worker ID."""
+        return dict(self._discarded_results)
+
+    def _record_discarded_result(self, worker_id: str, signal_name: str) -> None:
+        """Count a result that arrived after its worker was superseded."""
+        self._discarded_results[worker_id] = (
+            self._discarded_results.get(worker_id, 0) + 1
+        )
+        logger.debug(
+            "superseded_result_discarded",
+            worker_id=worker_id,
+            signal=signal_name,
+            discarded_total=self.discarded_result_count,
+        )
+
+    def _is_current(self, worker_id: str, operation: WorkerOperation) -> bool:
+        """Check whether an operation is still the active one for its ID."""
+        return self._active_workers.get(worker_id) is operation
+
     def _handle_worker_error(
         self, worker_id: str, error: str, operation: WorkerOperation
     ) -> None:
         """Handle worker error with cleanup."""
+        if not self._is_current(worker_id, operation):
+            return
         if operation.error_callback:
             operation.error_callback(error)
         else:
@@ -73,6 +119,8 @@ class WorkerManagerService(QObject):
         self, worker_id: str, operation: WorkerOperation
     ) -> None:
         """Handle worker completion with cleanup."""
+        if not self._is_current(worker_id, operation):
+            return
         if operation.finished_callback:
             operation.finished_callback()
-        self.cancel_worker(worker_id)
+        self._active_workers.pop(worker_id, None)
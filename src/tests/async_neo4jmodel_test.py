@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.async_neo4jmodel import AsyncNeo4jModel
+
+
+class AsyncTransaction:
+    """Async view of a FakeTransaction, as the async driver passes it."""
+
+    def __init__(self, tx):
+        self.tx = tx
+
+    async def run(self, statement, **params):
+        result = self.tx.run(statement, **params)
+        single = AsyncMock(return_value=result.single())
+        return MagicMock(single=single)
+
+
+def async_driver(tx):
+    async def execute_write(func, *args):
+        return await func(AsyncTransaction(tx), *args)
+
+    session = MagicMock(execute_write=execute_write)
+    driver = MagicMock()
+    driver.session.return_value.__aenter__ = AsyncMock(return_value=session)
+    driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
+    return driver
+
+
+# Fixture for an AsyncNeo4jModel without a database behind it
+@pytest.fixture
+def async_model(qapp):
+    model = AsyncNeo4jModel(MagicMock(_project="test"))
+    yield model
+    model.close()
+
+
+def wait_until(qapp, condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+class TestAsyncNeo4jModel:
+    def test_result_is_delivered_on_qt_thread(self, qapp, async_model):
+        received = []
+
+        async def compute():
+            await asyncio.sleep(0)
+            return 42
+
+        async_model.submit(compute(), callback=received.append)
+
+        assert wait_until(qapp, lambda: received)
+        assert received == [42]
+
+    def test_error_is_delivered_to_error_callback(self, qapp, async_model):
+        errors = []
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async_model.submit(fail(), error_callback=errors.append)
+
+        assert wait_until(qapp, lambda: errors)
+        assert errors == ["boom"]
+
+    def test_write_query_is_rejected(self, qapp, async_model):
+        errors = []
+
+        async_model.submit(
+            async_model.execute_read_query("MATCH (n) DETACH DELETE n"),
+            error_callback=errors.append,
+        )
+
+        assert wait_until(qapp, lambda: errors)
+        assert "DELETE" in errors[0]
+
+    def test_save_invalidates_cached_nodes_and_returns_version(
+        self, qapp, model, tx, monkeypatch
+    ):
+        tx.answers["save.upsert"] = [
+            {"written": True, "version": 4, "labels_to_add": [], "labels_to_remove": []}
+        ]
+        for name in ("Hero", "Sidekick"):
+            records = [{"n": {"name": name}, "relationships": []}]
+            model.node_cache.put(("test", name), records, model.node_cache.generation)
+        async_model = AsyncNeo4jModel(model)
+        driver = async_driver(tx)
+
+        async def get_driver():
+            return driver
+
+        monkeypatch.setattr(async_model, "_get_driver", get_driver)
+        node_data = {
+            "name": "Hero",
+            "description": "",
+            "tags": [],
+            "labels": ["Person"],
+            "additional_properties": {},
+            "relationships": [("KNOWS", "Sidekick", ">", {})],
+            "version": 3,
+        }
+        try:
+            version = async_model.submit(async_model.save_node(node_data)).result(2)
+        finally:
+            async_model.close()
+
+        assert version == 4
+        assert tx.ran("save.upsert")[0]["version"] == 3
+        assert tx.ran("save.merge_outgoing_batch")[0]["rel_type"] == "KNOWS"
+        assert model.node_cache.peek(("test", "Hero")) is None
+        assert model.node_cache.peek(("test", "Sidekick")) is None
+
+    def test_gathered_queries_fail_independently(self, qapp, async_model):
+        async def run_read(query, params):
+            await asyncio.sleep(0)
+            return [{"query": query, "element_id": params["element_id"]}]
+
+        async_model._run_read = run_read
+        params = {"element_id": "4:1"}
+
+        results = async_model.submit(
+            async_model.gather_read_queries(
+                {
+                    "calendar": ("MATCH (c:CALENDAR) RETURN c", params),
+                    "events": ("MATCH (e:EVENT) DETACH DELETE e", params),
+                }
+            )
+        ).result(2)
+
+        assert results["calendar"] == [
+            {"query": "MATCH (c:CALENDAR) RETURN c", "element_id": "4:1"}
+        ]
+        assert isinstance(results["events"], ValueError)
@@ -0,0 +1,44 @@
+from core.neo4jworkers import BatchWorker
+
+RETAG = "MATCH (n {name: $name, _project: $project}) SET n.tags = $tags"
+
+
+class TestBatchWorker:
+    def test_params_are_rewritten_to_row_fields(self):
+        query = BatchWorker.to_unwind_query(RETAG)
+        assert query.startswith("UNWIND $batch AS row")
+        assert "{name: row.name, _project: row.project}" in query
+        assert "SET n.tags = row.tags" in query
+
+    def test_quoted_dollar_signs_are_untouched(self):
+        query = BatchWorker.to_unwind_query(
+            "MATCH (n) WHERE n.price = '$cost' AND n.`$key` = $value RETURN n"
+        )
+        assert "'$cost'" in query
+        assert "n.`$key`" in query
+        assert "= row.value" in query
+
+    def test_consecutive_identical_queries_are_chunked(self):
+        operations = [(RETAG, {"name": f"Node {i}", "tags": ["x"]}) for i in range(5)]
+        worker = BatchWorker(None, operations, chunk_size=2)
+
+        chunks = worker.group_operations()
+
+        assert [len(rows) for _, rows in chunks] == [2, 2, 1]
+        assert chunks[0][1][0] == {"name": "Node 0", "tags": ["x"]}
+
+    def test_query_order_is_preserved(self):
+        create = "CREATE (n {name: $name})"
+        link = "MATCH (a {name: $a}), (b {name: $b}) MERGE (a)-[:SHOWS]->(b)"
+        operations = [
+            (create, {"name": "A"}),
+            (create, {"name": "B"}),
+            (link, {"a": "A", "b": "B"}),
+            (create, {"name": "C"}),
+        ]
+        worker = BatchWorker(None, operations, chunk_size=100)
+
+        chunks = worker.group_operations()
+
+        assert [len(rows) for _, rows in chunks] == [2, 1, 1]
+        assert "MERGE" in chunks[1][0]
@@ -0,0 +1,116 @@
+"""
+Shared fixtures for the model tests: a Neo4jModel built by its own
+constructor on a mock driver, and a transaction double that answers the
+model's statements by their registry name.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from core.neo4jmodel import Neo4jModel
+from core.neo4jworkers import BaseNeo4jWorker, QueryWorker
+from core.query_registry import QueryRegistry
+
+Answer = Union[Iterable[Any], Callable[..., Iterable[Any]]]
+
+
+class FakeResult:
+    """Result of a ``FakeTransaction`` statement."""
+
+    def __init__(self, records: Iterable[Any]) -> None:
+        self._records = list(records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def single(self) -> Any:
+        return self._records[0] if self._records else None
+
+    def consume(self) -> None:
+        return None
+
+
+class FakeTransaction:
+    """
+    Transaction answering the statements of a query registry.
+
+    ``answers`` maps a statement name to its records, or to a function that
+    is called with the statement's identifiers and parameters and returns
+    them. Statements without an answer return no records.
+
+    Args:
+        queries (QueryRegistry): The registry the statements come from.
+        answers (dict): Records per statement name.
+    """
+
+    def __init__(
+        self, queries: QueryRegistry, answers: Dict[str, Answer] = None
+    ) -> None:
+        self._queries = queries
+        self.answers = dict(answers or {})
+        self.statements: List[Tuple[str, Dict[str, Any]]] = []
+
+    def run(self, statement: str, parameters: Dict = None, **params: Any) -> Any:
+        name, identifiers = self._queries.lookup(statement)
+        params = {**identifiers, **(parameters or {}), **params}
+        self.statements.append((name, params))
+        answer = self.answers.get(name, [])
+        return FakeResult(answer(**params) if callable(answer) else answer)
+
+    def ran(self, name: str) -> List[Dict[str, Any]]:
+        """Identifiers and parameters of every run of a statement, in order."""
+        return [params for ran, params in self.statements if ran == name]
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def settings() -> Dict[str, Any]:
+    """Config values; settings missing here take the model's defaults."""
+    return {}
+
+
+@pytest.fixture
+def config(settings):
+    config = MagicMock()
+    config.user.PROJECT = "test"
+    config.get.side_effect = lambda key, default=None: settings.get(key, default)
+    return config
+
+
+@pytest.fixture
+def model(config, monkeypatch):
+    """
+    Neo4jModel on a mock driver, as if the schema bootstrap found every index.
+    """
+    # The constructor configures the worker classes; undo that afterwards
+    for attribute in ("retry_policy", "circuit_breaker"):
+        monkeypatch.setattr(
+            BaseNeo4jWorker, attribute, getattr(BaseNeo4jWorker, attribute)
+        )
+    monkeypatch.setattr(
+        QueryWorker, "terminate_on_cancel", QueryWorker.terminate_on_cancel
+    )
+    monkeypatch.setattr(
+        "core.neo4jmodel.GraphDatabase.driver", lambda *args, **kwargs: MagicMock()
+    )
+    monkeypatch.setattr(Neo4jModel, "migrate_project_property", lambda self: None)
+    monkeypatch.setattr(
+        Neo4jModel,
+        "bootstrap_schema",
+        lambda self: setattr(
+            self, "schema_report", {"labelled": 0, "missing": [], "unused": []}
+        ),
+    )
+    return Neo4jModel("bolt://localhost:7687", "neo4j", "secret", config)
+
+
+@pytest.fixture
+def tx(model):
+    return FakeTransaction(model.queries)
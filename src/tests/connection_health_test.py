@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from services.connection_health_service import ConnectionHealthService
+
+
+@pytest.fixture
+def settings():
+    return {"CIRCUIT_FAILURE_THRESHOLD": 1, "CIRCUIT_RESET_TIMEOUT": 60}
+
+
+class TestCachedConnectionHealth:
+    def test_healthy_session_skips_verification(self, model):
+        model.driver.reset_mock()
+        model.get_session()
+        model.get_session()
+        model.driver.verify_connectivity.assert_not_called()
+        assert model.driver.session.call_count == 2
+
+    def test_unhealthy_session_verifies_once(self, model):
+        model.driver.reset_mock()
+        model.set_connection_health(False)
+        model.get_session()
+        model.get_session()
+        model.driver.verify_connectivity.assert_called_once()
+        assert model.connection_healthy
+
+    def test_open_circuit_is_unhealthy(self, model):
+        model.circuit_breaker.record_failure(ServiceUnavailable("down"))
+        assert not model.connection_healthy
+
+
+class TestConnectionHealthService:
+    def test_emits_only_on_change(self, qapp, model):
+        service = ConnectionHealthService(model, MagicMock(), interval_ms=1000)
+        changes = []
+        service.health_changed.connect(lambda healthy, _: changes.append(healthy))
+
+        service._update(True)
+        service._update(False, "Traceback\nServiceUnavailable: down")
+        service._update(False, "still down")
+        service._update(True)
+
+        assert changes == [False, True]
+        assert model.connection_healthy
+
+    def test_failed_check_marks_model_unhealthy(self, qapp, model):
+        service = ConnectionHealthService(model, MagicMock())
+        service._update(False, "down")
+        assert not model.connection_healthy
+        assert service.status_message == "Database unavailable"
+
+    def test_timer_is_stopped(self, qapp, model):
+        service = ConnectionHealthService(model, MagicMock(), interval_ms=1000)
+        service.start_monitoring()
+        assert service.check_timer.isActive()
+        service.stop_monitoring()
+        assert not service.check_timer.isActive()
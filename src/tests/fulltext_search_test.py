@@ -0,0 +1,127 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.fulltext import FULLTEXT_INDEX, build_lucene_query, highlight_snippet
+from services.search_analysis_service.search_analysis_service import (
+    FieldSearch,
+    FullTextSearchQueryBuilder,
+    SearchAnalysisService,
+    SearchCriteria,
+    SearchField,
+)
+
+
+def quick_search(text, fuzzy=False):
+    return SearchCriteria(
+        field_searches=[
+            FieldSearch(field=field, text=text)
+            for field in SearchField
+            if field != SearchField.PROPERTIES
+        ],
+        fuzzy=fuzzy,
+    )
+
+
+@pytest.fixture
+def service():
+    service = SearchAnalysisService.__new__(SearchAnalysisService)
+    service.model = MagicMock()
+    service.model.fulltext_available = True
+    service.config = MagicMock()
+    service.worker_manager = MagicMock()
+    service.error_handler = MagicMock()
+    service._search_cache = {}
+    service._cache_timestamps = {}
+    service.array_properties = ["tags"]
+    service.scalar_properties = ["name", "description"]
+    service._property_discovery_timestamp = datetime.now()
+    return service
+
+
+class TestLuceneQuery:
+    def test_terms_match_whole_words_or_prefixes(self):
+        query = build_lucene_query("Red Dragon", ("name",))
+        assert query == (
+            "(name:red^2 OR name:red*) AND (name:dragon^2 OR name:dragon*)"
+        )
+
+    def test_fuzzy_adds_edit_distance_variant(self):
+        assert "name:drgon~" in build_lucene_query("drgon", ("name",), fuzzy=True)
+
+    def test_query_syntax_is_escaped(self):
+        assert build_lucene_query("a:b(", ("name",)).startswith("(name:a\\:b\\(^2")
+
+    def test_snippet_highlights_and_escapes(self):
+        snippet = highlight_snippet("The <red> dragon sleeps", ["dragon"])
+        assert snippet == "The &lt;red&gt; <b>dragon</b> sleeps"
+        assert highlight_snippet("Nothing here", ["dragon"]) is None
+
+
+class TestFullTextSearch:
+    def test_exact_and_property_searches_use_substring_query(self):
+        exact = SearchCriteria(
+            field_searches=[
+                FieldSearch(field=SearchField.NAME, text="x", exact_match=True)
+            ]
+        )
+        properties = SearchCriteria(
+            field_searches=[FieldSearch(field=SearchField.PROPERTIES, text="x")]
+        )
+        assert FullTextSearchQueryBuilder.supports(quick_search("dragon"))
+        assert not FullTextSearchQueryBuilder.supports(exact)
+        assert not FullTextSearchQueryBuilder.supports(properties)
+
+    def test_quick_search_is_ranked_and_matches_labels(self):
+        query, params = FullTextSearchQueryBuilder().build_search_query(
+            quick_search("dragon")
+        )
+        assert "db.index.fulltext.queryNodes" in query
+        assert "ORDER BY score DESC" in query
+        assert params["fulltext_index"] == FULLTEXT_INDEX
+        assert "name:dragon*" in params["fulltext_query"]
+        assert params["label_texts"] == ["dragon"]
+
+    def test_results_carry_score_and_snippet(self, service):
+        results = service._process_search_results(
+            [
+                {
+                    "n_props": {"name": "Cave", "description": "A dragon lair"},
+                    "n_labels": ["PLACE"],
+                    "score": 1.0,
+                },
+                {"n_props": {"name": "Dragon"}, "n_labels": ["BEAST"], "score": 3.0},
+            ],
+            ["dragon"],
+        )
+        assert [r["name"] for r in results] == ["Dragon", "Cave"]
+        assert results[1]["snippet"] == "A <b>dragon</b> lair"
+
+    def test_missing_index_falls_back_to_substring_search(self, service):
+        service.search_nodes(quick_search("dragon"), MagicMock())
+        first_query = service.model.execute_read_query.call_args[0][0]
+        operation = service.worker_manager.execute_worker.call_args[0][1]
+
+        service.model.fulltext_available = False
+        operation.error_callback(
+            f"There is no such fulltext schema index: {FULLTEXT_INDEX}"
+        )
+
+        service.model.mark_fulltext_unavailable.assert_called_once()
+        fallback_query = service.model.execute_read_query.call_args[0][0]
+        assert "db.index.fulltext" in first_query
+        assert "CONTAINS" in fallback_query
+        service.error_handler.assert_not_called()
+
+
+class TestNodeNameCompletion:
+    def test_names_use_index_when_online(self, model):
+        worker = model.fetch_matching_node_names("drag", 10, MagicMock())
+        assert model.queries.lookup(worker.query)[0] == "search.node_names_fulltext"
+        assert worker.params["index"] == FULLTEXT_INDEX
+
+    def test_names_fall_back_when_index_missing(self, model):
+        model.schema_report = {"missing": [FULLTEXT_INDEX]}
+        worker = model.fetch_matching_node_names("drag", 10, MagicMock())
+        assert model.queries.lookup(worker.query)[0] == "search.node_names"
@@ -0,0 +1,39 @@
+from utils.html_text import PlainTextExtractor
+
+QT_HTML = (
+    '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" '
+    '"http://www.w3.org/TR/REC-html40/strict.dtd">\n'
+    '<html><head><meta name="qrichtext" content="1" /><style type="text/css">\n'
+    "p, li { white-space: pre-wrap; }\n"
+    "</style></head><body style=\" font-family:'Segoe UI';\">\n"
+    '<p style=" margin-top:0px;">Oakvale lies by the <b>river</b>.</p>\n'
+    '<p style=" margin-top:0px;">Mills &amp; barns<br />line its banks.</p>'
+    "</body></html>"
+)
+
+
+class TestPlainTextExtractor:
+    def test_qt_rich_text_is_converted(self):
+        extractor = PlainTextExtractor()
+        assert extractor.to_text(QT_HTML) == (
+            "Oakvale lies by the river. Mills & barns line its banks."
+        )
+        assert extractor.to_text(QT_HTML, keep_lines=True) == (
+            "Oakvale lies by the river.\nMills & barns\nline its banks."
+        )
+
+    def test_conversions_are_cached_by_content(self):
+        extractor = PlainTextExtractor(max_entries=1)
+        extractor.to_text(QT_HTML)
+        extractor.to_text(str(QT_HTML))
+        assert extractor.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+        extractor.to_text("<p>Other</p>")
+        extractor.to_text(QT_HTML)
+        assert extractor.stats()["misses"] == 3
+
+    def test_plain_text_skips_the_parser(self):
+        extractor = PlainTextExtractor()
+        assert extractor.to_text("  plain\n  text ") == "plain text"
+        assert extractor.to_text(None) == ""
+        assert extractor.stats()["misses"] == 0
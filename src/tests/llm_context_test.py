@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from services.LLMService import LLMService
+from tests.conftest import FakeTransaction
+
+GRAPH = {
+    "Oakvale": [("LIVES_IN", "Ada", "INCOMING"), ("LIVES_IN", "Bo", "INCOMING")],
+    "Ada": [("LIVES_IN", "Oakvale", "OUTGOING"), ("KNOWS", "Cy", "OUTGOING")],
+    "Bo": [("LIVES_IN", "Oakvale", "OUTGOING")],
+    "Cy": [("KNOWS", "Ada", "INCOMING")],
+}
+
+
+def graph_tx(model):
+    """Transaction answering context.level queries from GRAPH."""
+
+    def level(names, project, expand):
+        return [
+            {
+                "name": name,
+                "labels": ["Person"],
+                "tags": None,
+                "description": None,
+                "relationships": [
+                    {"type": rel_type, "target": target, "direction": direction}
+                    for rel_type, target, direction in GRAPH[name]
+                ]
+                if expand
+                else [],
+            }
+            for name in names
+            if name in GRAPH
+        ]
+
+    return FakeTransaction(model.queries, {"context.level": level})
+
+
+class TestContextSubgraph:
+    def test_one_query_per_level(self, model):
+        tx = graph_tx(model)
+
+        nodes = model._context_subgraph_transaction(tx, "Oakvale", 2, 50)
+
+        assert [node["name"] for node in nodes] == ["Oakvale", "Ada", "Bo", "Cy"]
+        assert [params["names"] for params in tx.ran("context.level")] == [
+            ["Oakvale"],
+            ["Ada", "Bo"],
+            ["Cy"],
+        ]
+        assert nodes[-1]["relationships"] == []
+        assert nodes[-1]["path"] == [("LIVES_IN", "INCOMING"), ("KNOWS", "OUTGOING")]
+
+    def test_node_cap_stops_the_walk(self, model):
+        nodes = model._context_subgraph_transaction(graph_tx(model), "Oakvale", 3, 2)
+        assert [node["name"] for node in nodes] == ["Oakvale", "Ada"]
+
+
+class TestLLMContext:
+    def make_service(self, model, max_chars=8000):
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: (
+            max_chars if key == "LLM_CONTEXT_MAX_CHARS" else default
+        )
+        node_operations = MagicMock()
+        node_operations.get_context_subgraph.side_effect = (
+            lambda name, depth, max_nodes, **_: model._context_subgraph_transaction(
+                graph_tx(model), name, depth, max_nodes
+            )
+        )
+        return LLMService(config, node_operations)
+
+    def test_context_lists_paths_breadth_first(self, model):
+        context = self.make_service(model)._get_node_context("Oakvale", 2)
+        assert context.split("\n\n") == [
+            "Node: Oakvale\nLabels: Person",
+            "-[LIVES_IN]<- -> Node: Ada\nLabels: Person",
+            "-[LIVES_IN]<- -> Node: Bo\nLabels: Person",
+            "-[LIVES_IN]<- -[KNOWS]-> -> Node: Cy\nLabels: Person",
+        ]
+
+    def test_context_is_capped_in_characters(self, model):
+        context = self.make_service(model, max_chars=60)._get_node_context("Oakvale", 2)
+        assert len(context) <= 60
+        assert context.startswith("Node: Oakvale")
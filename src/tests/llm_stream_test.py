@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from services.LLMService import LLMService
+from services.node_operation_service import NodeOperationsService
+from utils.llm_stub_server import start_stub_server
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def make_service(server):
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: default
+    service = LLMService(config, MagicMock())
+    service.base_url = server.url
+    service.build_prompt = MagicMock(return_value="Describe Oakvale")
+    return service
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**kwargs):
+        server = start_stub_server(reply="Mills line the river.", **kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestStreamCompletion:
+    def test_events_are_yielded_as_they_arrive(self, stub):
+        server = stub()
+        service = make_service(server)
+
+        chunks = list(service.stream_completion("Describe Oakvale"))
+
+        assert chunks == ["Mills ", "line ", "the ", "river."]
+        assert server.requests[0]["stream"] is True
+        assert service.http_session is service.http_session
+        service.close()
+
+    def test_plain_json_answer_is_yielded_whole(self, stub):
+        service = make_service(stub(stream=False))
+        assert list(service.stream_completion("Describe Oakvale")) == [
+            "Mills line the river."
+        ]
+
+
+class TestLLMStreamWorker:
+    def test_chunks_and_result_are_delivered(self, stub, qapp):
+        service = make_service(stub())
+        callback, chunks = MagicMock(), []
+
+        worker = service.enhance_description_with_template(
+            "Oakvale", "", "general", 0, "", callback, chunks.append
+        )
+        worker.execute_operation()
+
+        assert "".join(chunks) == "Mills line the river."
+        callback.assert_called_once_with("Mills line the river.", None)
+
+    def test_cancel_aborts_the_stream(self, stub, qapp):
+        service = make_service(stub(chunk_delay=0.2))
+        callback, chunks = MagicMock(), []
+        worker = service.enhance_description_with_template(
+            "Oakvale", "", "general", 0, "", callback
+        )
+        worker.chunk_received.connect(chunks.append)
+        worker.chunk_received.connect(lambda _: worker.cancel())
+
+        worker.execute_operation()
+
+        assert chunks == ["Mills "]
+        callback.assert_not_called()
+
+    def test_missing_node_is_reported(self, stub, qapp):
+        service = make_service(stub())
+        service.build_prompt.side_effect = ValueError("Could not find node: X")
+        callback = MagicMock()
+        worker = service.enhance_description_with_template(
+            "X", "", "general", 0, "", callback
+        )
+
+        worker.run()
+
+        callback.assert_called_once_with("", "Could not find node: X")
+
+    def test_database_errors_reach_the_worker_not_a_dialog(self, stub, qapp):
+        server = stub()
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: default
+        model, error_handler = MagicMock(), MagicMock()
+        model.get_node_records.side_effect = RuntimeError("connection lost")
+        node_operations = NodeOperationsService(
+            model, config, MagicMock(), MagicMock(), error_handler
+        )
+        service = LLMService(config, node_operations)
+        service.base_url = server.url
+        service.prompt_template_service = MagicMock()
+        callback = MagicMock()
+        worker = service.enhance_description_with_template(
+            "Oakvale", "", "general", 0, "", callback
+        )
+
+        worker.run()
+
+        callback.assert_called_once_with("", "connection lost")
+        error_handler.handle_error.assert_not_called()
+        assert not server.requests
@@ -0,0 +1,171 @@
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j import Record
+
+from core.neo4jworkers import QueryWorker, TransactionWorker
+from core.node_cache import NodeCache, record_size
+from tests.conftest import FakeTransaction
+
+
+def relationships(ends, props=None):
+    return [
+        {"end": end, "type": "KNOWS", "dir": ">", "props": dict(props or {})}
+        for end in ends
+    ]
+
+
+def node_records(name, modified="t1", ends=(), version=1):
+    return [
+        Record(
+            {
+                "n": {"name": name},
+                "relationships": relationships(ends),
+                "labels": ["Person"],
+                "all_props": {
+                    "name": name,
+                    "_modified": modified,
+                    "_version": version,
+                },
+            }
+        )
+    ]
+
+
+class TestNodeCache:
+    def test_least_recently_used_entries_are_evicted_by_size(self):
+        size = record_size(node_records("A"))
+        cache = NodeCache(size * 2)
+        for name in ("A", "B"):
+            cache.put(("p", name), node_records(name), cache.generation)
+        cache.get(("p", "A"))
+
+        cache.put(("p", "C"), node_records("C"), cache.generation)
+
+        assert cache.peek(("p", "B")) is None
+        assert cache.peek(("p", "A")) is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= size * 2
+
+    def test_load_started_before_write_is_not_cached(self):
+        cache = NodeCache(1024 * 1024)
+        generation = cache.generation
+        cache.invalidate([("p", "A")])
+
+        assert not cache.put(("p", "A"), node_records("A"), generation)
+        assert cache.get(("p", "A")) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_callers_get_copies(self):
+        cache = NodeCache(1024 * 1024)
+        cache.put(("p", "A"), node_records("A"), cache.generation)
+
+        cache.get(("p", "A"))[0]["all_props"]["imagepath"] = "x.png"
+
+        assert "imagepath" not in cache.get(("p", "A"))[0]["all_props"]
+        assert cache.stats()["hit_rate"] == 1.0
+
+
+class TestModelCache:
+    def test_miss_loads_and_caches(self, model, qapp):
+        callback = MagicMock()
+        worker = model.load_node("A", callback)
+        assert isinstance(worker, QueryWorker)
+
+        worker.query_finished.emit(node_records("A"))
+
+        callback.assert_called_once()
+        assert model.node_cache.peek(("test", "A")) is not None
+
+    def test_hit_renders_at_once_and_revalidates(self, model, qapp):
+        model.node_cache.put(("test", "A"), node_records("A"), 0)
+        callback = MagicMock()
+
+        worker = model.load_node("A", callback)
+
+        assert isinstance(worker, TransactionWorker)
+        callback.assert_called_once()
+        worker.transaction_finished.emit(None)
+        callback.assert_called_once()
+        worker.transaction_finished.emit(node_records("A", modified="t2"))
+        assert callback.call_count == 2
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"version": 2},
+            {"relationships": relationships(["B", "C"], {"since": 3})},
+            {"relationships": relationships(["B", "D"])},
+            {"relationships": relationships(["B"])},
+        ],
+    )
+    def test_revalidation_only_reloads_changed_nodes(self, model, changed):
+        revision = model._node_revision(node_records("A", ends=["B", "C"]))
+        unchanged = {
+            "version": 1,
+            "modified": "t1",
+            "relationships": relationships(["C", "B"]),
+        }
+        tx = FakeTransaction(
+            model.queries,
+            {
+                "node.revision": [unchanged],
+                "load_node": node_records("A", modified="t2"),
+            },
+        )
+
+        assert model._revalidate_node_transaction(tx, "A", revision) is None
+        assert not tx.ran("load_node")
+
+        tx.answers["node.revision"] = [{**unchanged, **changed}]
+        assert model._revalidate_node_transaction(tx, "A", revision) == node_records(
+            "A", modified="t2"
+        )
+
+    def test_save_invalidates_node_and_neighbours(self, model, qapp):
+        cache = model.node_cache
+        cache.put(("test", "A"), node_records("A", ends=["B"]), 0)
+        for name in ("B", "C", "D"):
+            cache.put(("test", name), node_records(name), cache.generation)
+
+        model.save_node(
+            {
+                "name": "A",
+                "labels": ["Person"],
+                "relationships": [("KNOWS", "C", ">", {})],
+            },
+            MagicMock(),
+        )
+
+        assert [name for name in "ABCD" if cache.peek(("test", name))] == ["D"]
+
+
+class TestNeighbourPrefetch:
+    def test_uncached_neighbours_are_loaded_in_one_query(self, model, qapp):
+        cache = model.node_cache
+        cache.put(("test", "A"), node_records("A", ends=["B", "C", "A"]), 0)
+        cache.put(("test", "B"), node_records("B"), 0)
+
+        worker = model.prefetch_neighbours("A", 5, ["LIVES_IN"])
+
+        assert worker.params["skip"] == ["B"]
+        assert worker.params["type_priority"] == ["LIVES_IN"]
+        assert worker.params["limit"] == 5
+        worker.query_finished.emit(node_records("C") + node_records("D"))
+        assert cache.peek(("test", "C")) and cache.peek(("test", "D"))
+
+    def test_nothing_is_loaded_when_neighbours_are_cached(self, model):
+        cache = model.node_cache
+        cache.put(("test", "A"), node_records("A", ends=["B"]), 0)
+        cache.put(("test", "B"), node_records("B"), 0)
+
+        assert model.prefetch_neighbours("A", 5) is None
+        assert model.prefetch_neighbours("B", 0) is None
+
+    def test_prefetch_started_before_write_is_dropped(self, model):
+        generation = model.node_cache.generation
+        model.node_cache.invalidate([("test", "C")])
+
+        assert model._cache_prefetched("A", node_records("C"), generation) == 0
@@ -0,0 +1,127 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from core.neo4jmodel import Neo4jModel
+from core.neo4jworkers import BulkDeleteWorker, StumpCollectorWorker
+from services.node_cleanup_service import NodeCleanupService
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def driver_for(tx):
+    driver = MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    session.begin_transaction.return_value.__enter__.return_value = tx
+    return driver, session
+
+
+def deletes(tx):
+    """Number of delete statements run in the transactions."""
+    return sum(call.args[0] == "DELETE" for call in tx.run.call_args_list)
+
+
+class TestBulkDeleteWorker:
+    def test_names_are_deleted_in_chunks(self, qapp):
+        tx = MagicMock()
+        tx.run.return_value.single.side_effect = lambda: {
+            "deleted": len(tx.run.call_args.kwargs["names"])
+        }
+        driver, session = driver_for(tx)
+        names = [f"Node {i}" for i in range(5)] + ["Node 0"]
+        worker = BulkDeleteWorker(driver, "DELETE", "test", names, chunk_size=2)
+        progress, summaries = [], []
+        worker.batch_progress.connect(lambda done, total: progress.append(done))
+        worker.delete_finished.connect(summaries.append)
+
+        worker.execute_operation()
+
+        assert deletes(tx) == 3
+        assert progress == [2, 4, 5]
+        assert summaries == [{"requested": 5, "processed": 5, "deleted": 5}]
+
+
+class TestStumpCollectorWorker:
+    def make_worker(self, tx, **kwargs):
+        driver, session = driver_for(tx)
+        worker = StumpCollectorWorker(
+            driver, "COUNT", "LIST", "DELETE", "test", **kwargs
+        )
+        summaries = []
+        worker.collection_finished.connect(summaries.append)
+        return worker, session, summaries
+
+    def test_orphans_are_deleted_in_capped_batches(self, qapp):
+        tx = MagicMock()
+        tx.run.return_value.single.side_effect = [
+            {"orphans": 5},
+            {"deleted": 2},
+            {"deleted": 2},
+            {"deleted": 1},
+        ]
+        worker, session, summaries = self.make_worker(tx, batch_size=2)
+
+        worker.execute_operation()
+
+        assert deletes(tx) == 3
+        assert summaries[0]["deleted"] == 5
+        assert summaries[0]["batches"] == 3
+        big = StumpCollectorWorker(None, "", "", "", "test", batch_size=10**9)
+        assert big.batch_size == StumpCollectorWorker.MAX_BATCH_SIZE
+
+    def test_dry_run_deletes_nothing(self, qapp):
+        tx = MagicMock()
+        tx.run.return_value.single.return_value = {"orphans": 2}
+        tx.run.return_value.__iter__.return_value = [{"name": "A"}, {"name": "B"}]
+        worker, session, summaries = self.make_worker(tx, dry_run=True)
+
+        worker.execute_operation()
+
+        assert deletes(tx) == 0
+        assert summaries[0]["orphans"] == 2
+        assert summaries[0]["names"] == ["A", "B"]
+        assert summaries[0]["deleted"] == 0
+
+
+class TestNodeCleanupService:
+    @pytest.fixture
+    def service(self, qapp):
+        return NodeCleanupService(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(), collector_interval_ms=0
+        )
+
+    def test_delete_cascades_to_stump_collection(self, service):
+        callback = MagicMock()
+        service.delete_nodes(["A", " ", "B"], callback)
+
+        names, handle_finished = service.model.delete_nodes.call_args[0]
+        assert names == ["A", "B"]
+
+        handle_finished({"requested": 2, "processed": 2, "deleted": 2})
+
+        callback.assert_called_once()
+        service.search_service.clear_cache.assert_called_once()
+        service.model.collect_orphan_stumps.assert_called_once()
+
+    def test_delete_matching_deletes_search_results(self, service):
+        service.delete_matching(MagicMock(), MagicMock(), cascade=False)
+        handle_results = service.search_service.search_nodes.call_args[0][1]
+
+        handle_results([{"name": "A"}, {"name": "B"}])
+
+        assert service.model.delete_nodes.call_args[0][0] == ["A", "B"]
+
+    def test_disabled_collector_does_not_start(self, service):
+        service.start_collector()
+        assert not service.collector_timer.isActive()
+
+    def test_orphan_queries_only_match_unconnected_stumps(self):
+        for name in ("gc.count_orphan_stumps", "gc.delete_orphan_stumps"):
+            query = Neo4jModel.QUERIES[name]
+            assert "STUMP:_Node {_project: $project}" in query
+            assert "NOT (n)--()" in query
+        assert "LIMIT $batch_size" in Neo4jModel.QUERIES["gc.delete_orphan_stumps"]
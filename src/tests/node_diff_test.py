@@ -0,0 +1,143 @@
+import pytest
+
+from core.neo4jmodel import Neo4jModel
+from core.node_diff import NodeVersionConflict, diff_node_data, merge_node_data
+
+
+def node(**overrides):
+    data = {
+        "name": "Hero",
+        "description": "Brave",
+        "tags": ["main"],
+        "labels": ["Person"],
+        "additional_properties": {"rank": "captain", "_created": "then"},
+        "relationships": [
+            ("KNOWS", "Sidekick", ">", {"since": 1}),
+            ("OWNS", "Sword", ">", {}),
+        ],
+    }
+    data.update(overrides)
+    return data
+
+
+class TestNodeDiff:
+    def test_identical_data_has_no_changes(self):
+        diff = diff_node_data(node(), node(), Neo4jModel._filter_additional_properties)
+        assert diff.is_empty
+        assert diff.rows_touched == 0
+
+    def test_property_changes_and_removals(self):
+        current = node(description="Braver", additional_properties={"age": 30})
+        diff = diff_node_data(node(), current, Neo4jModel._filter_additional_properties)
+        assert diff.properties == {"description": "Braver", "age": 30, "rank": None}
+
+    def test_relationships_are_added_updated_and_removed(self):
+        current = node(
+            relationships=[
+                ("KNOWS", "Sidekick", ">", {"since": 2}),
+                ("FOUGHT", "Dragon", "<", {}),
+            ]
+        )
+        diff = diff_node_data(node(), current)
+        assert diff.relationships_added == [("FOUGHT", "Dragon", "<", {})]
+        assert diff.relationships_updated == [("KNOWS", "Sidekick", ">", {"since": 2})]
+        assert diff.relationships_removed == [("OWNS", "Sword", ">")]
+        assert diff.rows_touched == 3
+        assert diff.bytes_written > 0
+
+
+class TestIncrementalSave:
+    def test_unchanged_relationships_are_not_rewritten(self, model, tx):
+        tx.answers["save.update_node"] = [
+            {"written": True, "version": 2, "server": None}
+        ]
+        current = node(
+            relationships=node()["relationships"] + [("FOUGHT", "Dragon", "<", {})]
+        )
+
+        version = model._save_node_changes_transaction(tx, node(), current)
+
+        assert version == 2
+        assert not tx.ran("save.delete_outgoing_batch")
+        assert not tx.ran("save.delete_incoming_batch")
+        assert not tx.ran("save.merge_outgoing_batch")
+        (merge,) = tx.ran("save.merge_incoming_batch")
+        assert merge["rel_type"] == "FOUGHT"
+        assert merge["rels"] == [{"target": "Dragon", "properties": {}}]
+        assert model.last_save_statistics["incremental"]
+
+    def test_missing_node_falls_back_to_full_save(self, model, tx):
+        model._save_node_changes_transaction(tx, node(), node(description="New"))
+
+        (upsert,) = tx.ran("save.upsert")
+        assert upsert["properties"]["description"] == "New"
+        assert not model.last_save_statistics["incremental"]
+
+    def test_empty_diff_sends_nothing(self, model, tx):
+        version = model._save_node_changes_transaction(
+            tx, node(version=3), node(version=3)
+        )
+        assert tx.statements == []
+        # Nothing was written, so the node keeps the version it was loaded with
+        assert version == 3
+
+
+class TestVersionConflict:
+    def server_record(self):
+        return {
+            "written": False,
+            "version": 4,
+            "server": {
+                "properties": {
+                    "name": "Hero",
+                    "description": "Braver",
+                    "tags": ["main"],
+                    "rank": "captain",
+                    "_version": 4,
+                },
+                "labels": ["Person"],
+                "relationships": [
+                    {"end": "Sidekick", "type": "KNOWS", "dir": ">", "props": {}},
+                ],
+            },
+        }
+
+    def test_stale_version_raises_with_server_copy(self, model, tx):
+        tx.answers["save.update_node"] = [self.server_record()]
+        current = node(version=3, additional_properties={"rank": "general"})
+
+        with pytest.raises(NodeVersionConflict) as error:
+            model._save_node_changes_transaction(tx, node(version=3), current)
+
+        conflict = error.value
+        assert conflict.server_version == 4
+        assert conflict.server_data["description"] == "Braver"
+        assert conflict.server_data["additional_properties"] == {"rank": "captain"}
+        assert [name for name, _ in tx.statements] == ["save.update_node"]
+        assert tx.ran("save.update_node")[0]["version"] == 3
+
+    def test_merge_applies_local_changes_to_server_copy(self):
+        original = node()
+        local = node(
+            additional_properties={"rank": "general", "_created": "then"},
+            relationships=[("OWNS", "Sword", ">", {})],
+        )
+        server = node(
+            description="Braver",
+            relationships=[
+                ("KNOWS", "Sidekick", ">", {"since": 1}),
+                ("OWNS", "Sword", ">", {}),
+                ("FOUGHT", "Dragon", "<", {}),
+            ],
+            version=4,
+        )
+
+        merged = merge_node_data(original, local, server)
+
+        assert merged["description"] == "Braver"
+        assert merged["additional_properties"]["rank"] == "general"
+        assert merged["relationships"] == [
+            ("OWNS", "Sword", ">", {}),
+            ("FOUGHT", "Dragon", "<", {}),
+        ]
+        assert merged["version"] == 4
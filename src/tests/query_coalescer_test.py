@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+from unittest.mock import MagicMock
+
+from core.neo4jworkers import QueryWorker
+from core.query_coalescer import QueryCoalescer
+from core.worker_executor import WorkerExecutor
+
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def wait_until(qapp, condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    qapp.processEvents()
+    return condition()
+
+
+def gated_driver(gate, rows):
+    """Driver whose queries block on ``gate`` and count their round trips."""
+    driver = MagicMock()
+    driver.round_trips = 0
+
+    def run(query, params):
+        driver.round_trips += 1
+        gate.wait(2)
+        return list(rows)
+
+    session = driver.session.return_value.__enter__.return_value
+    session.run.side_effect = run
+    return driver
+
+
+class TestQueryCoalescer:
+    def test_fingerprint_ignores_whitespace_and_param_order(self):
+        first = QueryCoalescer.fingerprint("MATCH (n)\n  RETURN n", {"a": 1, "b": 2})
+        second = QueryCoalescer.fingerprint("MATCH (n) RETURN n", {"b": 2, "a": 1})
+        assert first == second
+
+    def test_fingerprint_differs_by_params(self):
+        assert QueryCoalescer.fingerprint("RETURN $x", {"x": 1}) != (
+            QueryCoalescer.fingerprint("RETURN $x", {"x": 2})
+        )
+
+    def test_abandoned_only_when_all_subscribers_cancelled(self):
+        coalescer = QueryCoalescer()
+        leader = MagicMock(query="RETURN 1", is_cancelled=False)
+        follower = MagicMock(query="RETURN 1", is_cancelled=False)
+        key = coalescer.fingerprint("RETURN 1", {})
+        assert coalescer.join(key, leader)
+        assert not coalescer.join(key, follower)
+
+        leader.is_cancelled = True
+        assert coalescer.abandoned_leader(key) is None
+        follower.is_cancelled = True
+        assert coalescer.abandoned_leader(key) is leader
+
+    def test_identical_reads_share_one_round_trip(self, qapp):
+        executor = WorkerExecutor(max_workers=3)
+        coalescer = QueryCoalescer()
+        gate = threading.Event()
+        driver = gated_driver(gate, [{"name": "Alice"}])
+        received = []
+        finished = []
+
+        workers = []
+        for _ in range(3):
+            worker = QueryWorker(driver, "MATCH (n) RETURN n", {"name": "Alice"})
+            worker.coalescer = coalescer
+            worker.query_finished.connect(received.append)
+            worker.finished.connect(lambda: finished.append(True))
+            workers.append(worker)
+            executor.submit(worker)
+
+        assert wait_until(qapp, lambda: coalescer.saved_round_trips == 2)
+        assert finished == []
+        gate.set()
+
+        assert wait_until(qapp, lambda: len(finished) == 3)
+        assert driver.round_trips == 1
+        assert received == [[{"name": "Alice"}]] * 3
+        (stats,) = coalescer.stats().values()
+        assert stats["executed"] == 1
+        assert stats["coalesced"] == 2
@@ -0,0 +1,87 @@
+import pytest
+
+from core.query_registry import QueryRegistry
+from tests.conftest import FakeTransaction
+
+
+class TestQueryRegistry:
+    def test_identifiers_are_quoted(self):
+        registry = QueryRegistry()
+        registry.register("add", "MATCH (n) SET n:%(label)s")
+        assert (
+            registry.get("add", label="Dark `Elf`") == "MATCH (n) SET n:`Dark ``Elf```"
+        )
+
+    def test_same_identifier_returns_same_text(self):
+        registry = QueryRegistry()
+        registry.register("add", "MATCH (n) SET n:%(label)s")
+        assert registry.get("add", label="Elf") is registry.get("add", label="Elf")
+        assert registry.distinct_statements == 1
+
+    def test_conflicting_registration_is_rejected(self):
+        registry = QueryRegistry()
+        registry.register("q", "RETURN 1")
+        registry.register("q", "  RETURN 1  ")
+        with pytest.raises(ValueError):
+            registry.register("q", "RETURN 2")
+
+    def test_stats_are_sorted_by_executions(self):
+        registry = QueryRegistry()
+        registry.register("a", "RETURN 1")
+        registry.register("b", "RETURN 2")
+        registry.get("a")
+        registry.get("b")
+        registry.get("b")
+        assert [entry["name"] for entry in registry.stats()] == ["b", "a"]
+        assert registry.stats()[0]["executions"] == 2
+
+    def test_rendered_text_is_looked_up_by_name(self):
+        registry = QueryRegistry()
+        registry.register("add", "MATCH (n) SET n:%(label)s")
+        text = registry.get("add", label="Elf")
+        assert registry.lookup(text) == ("add", {"label": "Elf"})
+        with pytest.raises(KeyError):
+            registry.lookup("RETURN 1")
+
+
+class TestModelStatements:
+    def test_label_sets_do_not_multiply_statements(self, model):
+        model._label_change_queries([], ["Elf", "Mage"])
+        model._label_change_queries([], ["Mage", "Elf"])
+        model._label_change_queries(["Elf"], ["Mage"])
+        assert model.queries.distinct_statements == 3
+
+    def test_relationship_statements_are_dispatched_per_type(self, model):
+        outgoing = model._relationship_query("KNOWS", ">")
+        incoming = model._relationship_query("KNOWS", "<")
+        assert "-[r:`KNOWS`]->" in outgoing
+        assert "<-[r:`KNOWS`]-" in incoming
+        assert model._relationship_query("KNOWS", ">") is outgoing
+
+    def test_relationship_depth_is_validated(self, model):
+        assert "[*1..3]" in model._relationships_query(3)
+        with pytest.raises(ValueError):
+            model._relationships_query(0)
+
+    def test_project_wide_reads_are_scoped_to_the_project(self, model):
+        tx = FakeTransaction(
+            model.queries,
+            {
+                "node.hierarchy": lambda project: [
+                    {"category": "Person", "nodes": [f"{project} hero"]}
+                ],
+                "node.last_modified": lambda project: [
+                    {"name": f"{project} hero", "modified": "t1"}
+                ],
+            },
+        )
+        model.driver.session.return_value.__enter__.return_value = tx
+
+        assert model.get_node_hierarchy() == {"Person": ["test hero"]}
+        assert model.get_last_modified_node() == {"name": "test hero", "modified": "t1"}
+
+    def test_single_node_delete_is_a_registered_statement(self, model, tx):
+        model._delete_node_transaction(tx, "Oakvale")
+        assert tx.statements == [
+            ("delete.node", {"name": "Oakvale", "project": "test"})
+        ]
@@ -0,0 +1,125 @@
+import pytest
+
+from core.node_references import branch_updates, replace_name_references
+from tests.conftest import FakeTransaction
+
+
+@pytest.fixture
+def settings():
+    return {"RENAME_BATCH_SIZE": 2}
+
+
+def fake_tx(model, descriptions, branches, old_name="Oakvale"):
+    """Transaction answering the rename statements."""
+    return FakeTransaction(
+        model.queries,
+        {
+            "rename.node": [{"old_name": old_name}],
+            "rename.description_refs_fulltext": descriptions,
+            "rename.description_refs": descriptions,
+            "rename.branch_refs_fulltext": branches,
+            "rename.branch_refs": branches,
+        },
+    )
+
+
+class TestNameReferences:
+    def test_only_whole_words_in_text_are_replaced(self):
+        text = (
+            '<p style="font-family:Oak">Oak and Oakvale near <a href="Oak">Oak</a></p>'
+        )
+        new_text, count = replace_name_references(text, "Oak", "Elm")
+        assert new_text == (
+            '<p style="font-family:Oak">Elm and Oakvale near <a href="Elm">Elm</a></p>'
+        )
+        assert count == 3
+
+    def test_branch_keys_get_new_name(self):
+        updates = branch_updates(
+            [{"id": "r1", "keys": ["branch_main_stem", "branch_branch_2"]}], "Elm"
+        )
+        assert updates == [
+            {
+                "id": "r1",
+                "properties": {"branch_main_stem": "Elm", "branch_branch_2": "Elm"},
+            }
+        ]
+
+
+class TestRenameTransaction:
+    def test_references_are_updated_in_bounded_batches(self, model):
+        descriptions = [
+            {"id": f"n{i}", "description": f"Born in Oakvale, node {i}"}
+            for i in range(5)
+        ] + [{"id": "x", "description": "Oakvaleverse is unrelated"}]
+        branches = [{"id": "r1", "keys": ["branch_main_stem"]}]
+        tx = fake_tx(model, descriptions, branches)
+
+        summary = model._rename_node_transaction(tx, "4:abc:1", "Elmvale")
+
+        assert summary["descriptions"] == 5
+        assert summary["map_lines"] == 1
+        batches = [params["rows"] for params in tx.ran("rename.set_descriptions")]
+        assert [len(rows) for rows in batches] == [2, 2, 1]
+        assert batches[0][0]["description"] == "Born in Elmvale, node 0"
+        assert {row["id"] for rows in batches for row in rows} == {
+            f"n{i}" for i in range(5)
+        }
+        (branch_rows,) = [params["rows"] for params in tx.ran("rename.set_branches")]
+        assert branch_rows == [
+            {"id": "r1", "properties": {"branch_main_stem": "Elmvale"}}
+        ]
+
+    def test_description_lookup_uses_index_when_available(self, model):
+        tx = fake_tx(model, [{"id": "n1", "description": 'The "Old" Mill'}], [])
+        descriptions, _ = model._find_name_references(tx, 'The "Old" Mill', "Mill")
+        assert descriptions[0]["description"] == "Mill"
+        (lookup,) = tx.ran("rename.description_refs_fulltext")
+        assert lookup["query"] == 'description:"The \\"Old\\" Mill"'
+
+        model.schema_report = {"missing": ["node_search"]}
+        tx = fake_tx(model, [{"id": "n1", "description": "Mill"}], [])
+        descriptions, _ = model._find_name_references(tx, "Mill", "Old Mill")
+        assert descriptions[0]["description"] == "Old Mill"
+        assert not tx.ran("rename.description_refs_fulltext")
+
+    def test_map_lines_are_looked_up_by_name(self, model):
+        branches = [{"id": "r1", "keys": ["branch_main_stem"]}]
+        tx = fake_tx(model, [], branches)
+        _, updates = model._find_name_references(tx, 'The "Old" Mill', "Mill")
+        assert updates == [{"id": "r1", "properties": {"branch_main_stem": "Mill"}}]
+        (lookup,) = tx.ran("rename.branch_refs_fulltext")
+        assert lookup["index"] == "shows_branch_names"
+        assert lookup["query"] == '"The \\"Old\\" Mill"'
+        assert not tx.ran("rename.branch_refs")
+
+        model.schema_report = {"missing": ["shows_branch_names"]}
+        tx = fake_tx(model, [], branches)
+        _, updates = model._find_name_references(tx, "Mill", "Old Mill")
+        assert updates == [{"id": "r1", "properties": {"branch_main_stem": "Old Mill"}}]
+        assert not tx.ran("rename.branch_refs_fulltext")
+        assert "r.branch_count IS NOT NULL" in model.queries.get("rename.branch_refs")
+
+    def test_preview_reports_full_description_scan(self, model):
+        model.schema_report = {"missing": ["node_search"]}
+        tx = fake_tx(model, [], [])
+        preview = model._rename_preview_transaction(tx, "Oakvale", "Elmvale")
+        assert preview["full_scan"]
+
+    def test_missing_node_aborts_rename(self, model):
+        tx = FakeTransaction(model.queries)
+        with pytest.raises(ValueError):
+            model._rename_node_transaction(tx, "4:abc:1", "Elmvale")
+
+    def test_preview_counts_without_writing(self, model):
+        tx = fake_tx(model, [{"id": "n1", "description": "Oakvale and Oakvale"}], [])
+        preview = model._rename_preview_transaction(tx, "Oakvale", "Elmvale")
+        assert preview == {
+            "descriptions": 1,
+            "references": 2,
+            "map_lines": 0,
+            "name_taken": False,
+            "full_scan": False,
+        }
+        assert not tx.ran("rename.set_descriptions")
+        assert not tx.ran("rename.set_branches")
@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock
+
+import pytest
+from neo4j import READ_ACCESS
+from neo4j.exceptions import (
+    ClientError,
+    IncompleteCommit,
+    ServiceUnavailable,
+    TransientError,
+)
+
+from core.neo4jworkers import BaseNeo4jWorker, TransactionWorker
+from core.retry_policy import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class FlakyWorker(BaseNeo4jWorker):
+    def __init__(self, failures, idempotent=True):
+        super().__init__(driver=None)
+        self.failures = list(failures)
+        self.calls = 0
+        self.idempotent = idempotent
+
+    def operation(self):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_attempts=3, initial_delay=0, max_delay=0)
+
+
+class TestRetryPolicy:
+    def test_reads_retry_on_unavailable(self, policy):
+        assert policy.is_retryable(ServiceUnavailable("down"), idempotent=True)
+
+    def test_writes_do_not_retry_on_unavailable(self, policy):
+        assert not policy.is_retryable(ServiceUnavailable("down"), idempotent=False)
+
+    def test_incomplete_commit_is_never_retried(self, policy):
+        assert not policy.is_retryable(IncompleteCommit("?"), idempotent=True)
+
+    def test_client_errors_are_not_retried(self, policy):
+        assert not policy.is_retryable(ClientError("bad query"), idempotent=True)
+
+    def test_transient_errors_follow_the_server(self, policy):
+        error = TransientError("deadlock")
+        error.code = "Neo.TransientError.Transaction.DeadlockDetected"
+        assert policy.is_retryable(error, idempotent=False)
+
+    def test_delay_is_capped(self):
+        policy = RetryPolicy(initial_delay=1, max_delay=2, multiplier=10)
+        assert all(0 <= policy.delay(attempt) <= 2 for attempt in range(1, 6))
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure(ServiceUnavailable("down"))
+        assert breaker.allow()
+        breaker.record_failure(ServiceUnavailable("down"))
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+    def test_query_errors_do_not_open_the_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure(ClientError("bad query"))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_trial_call_after_timeout_closes_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure(ServiceUnavailable("down"))
+
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestWorkerRetry:
+    def test_read_recovers_from_transient_failure(self, policy):
+        worker = FlakyWorker([ServiceUnavailable("blip")])
+        worker.retry_policy = policy
+
+        assert worker._call_with_retry(worker.operation) == "ok"
+        assert worker.calls == 2
+
+    def test_write_is_not_repeated_after_unavailable(self, policy):
+        worker = FlakyWorker([ServiceUnavailable("blip")], idempotent=False)
+        worker.retry_policy = policy
+
+        with pytest.raises(ServiceUnavailable):
+            worker._call_with_retry(worker.operation)
+        assert worker.calls == 1
+
+    def test_gives_up_after_max_attempts(self, policy):
+        worker = FlakyWorker([ServiceUnavailable("down")] * 5)
+        worker.retry_policy = policy
+
+        with pytest.raises(ServiceUnavailable):
+            worker._call_with_retry(worker.operation)
+        assert worker.calls == 3
+
+    def test_open_circuit_skips_the_server(self, policy):
+        worker = FlakyWorker([])
+        worker.retry_policy = policy
+        worker.circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        worker.circuit_breaker.record_failure(ServiceUnavailable("down"))
+
+        with pytest.raises(CircuitOpenError):
+            worker._call_with_retry(worker.operation)
+        assert worker.calls == 0
+
+    def test_policy_is_the_only_retry_layer(self, policy):
+        driver = MagicMock()
+        session = driver.session.return_value.__enter__.return_value
+        tx = session.begin_transaction.return_value.__enter__.return_value
+        func = MagicMock(side_effect=[ServiceUnavailable("blip"), "ok"])
+        worker = TransactionWorker(driver, func, "Oakvale")
+        worker.retry_policy = policy
+
+        assert worker._call_with_retry(worker._run) == "ok"
+        # Each attempt is one explicit transaction, never a driver-retried one
+        assert session.begin_transaction.call_count == 2
+        func.assert_called_with(tx, "Oakvale")
+        tx.commit.assert_called_once()
+        session.execute_read.assert_not_called()
+        driver.session.assert_called_with(default_access_mode=READ_ACCESS)
@@ -0,0 +1,106 @@
+import pytest
+
+from core.neo4jmodel import Neo4jModel
+from tests.conftest import FakeTransaction
+
+
+def node_data(relationship_count):
+    return {
+        "name": "Hero",
+        "description": "",
+        "tags": [],
+        "labels": ["Person"],
+        "additional_properties": {},
+        "relationships": [
+            ("KNOWS" if i % 2 else "OWNS", f"Target {i}", ">" if i % 3 else "<", {})
+            for i in range(relationship_count)
+        ],
+    }
+
+
+def round_trips(model, data):
+    tx = FakeTransaction(model.queries)
+    model._save_node_transaction(tx, data)
+    return len(tx.statements)
+
+
+class TestSetBasedSave:
+    def test_round_trips_do_not_grow_with_relationships(self, model):
+        counts = {round_trips(model, node_data(n)) for n in (6, 60, 600)}
+        assert len(counts) == 1
+
+    @pytest.mark.parametrize("settings", [{"SET_BASED_SAVE": False}])
+    def test_per_row_save_grows_with_relationships(self, model):
+        assert round_trips(model, node_data(60)) > round_trips(model, node_data(6))
+
+    def test_every_relationship_is_written(self, model, tx):
+        model._save_node_transaction(tx, node_data(60))
+
+        written = {
+            (params["rel_type"], row["target"])
+            for name in ("save.merge_outgoing_batch", "save.merge_incoming_batch")
+            for params in tx.ran(name)
+            for row in params["rels"]
+        }
+        assert written == {(rel[0], rel[1]) for rel in node_data(60)["relationships"]}
+
+    def test_relationships_are_grouped_by_type_and_direction(self):
+        groups = Neo4jModel._group_relationships(
+            [
+                ("KNOWS", "A", ">", {"since": 1}),
+                ("KNOWS", "B", "<", {}),
+                ("KNOWS", "C", ">", {}),
+            ]
+        )
+        assert groups[("KNOWS", ">")] == [
+            {"target": "A", "properties": {"since": 1}},
+            {"target": "C", "properties": {}},
+        ]
+        assert groups[("KNOWS", "<")] == [{"target": "B", "properties": {}}]
+
+    def test_stumps_are_built_once_per_target(self, model):
+        stumps = model._stump_batch(
+            [("KNOWS", "A", ">", {}), ("OWNS", "A", "<", {}), ("KNOWS", "B", ">", {})]
+        )
+        assert [stump["name"] for stump in stumps] == ["A", "B"]
+        assert all(stump["_project"] == "test" for stump in stumps)
+
+
+class TestSingleStatementSave:
+    def saved(self, model, tx, labels_to_add=(), labels_to_remove=()):
+        tx.answers["save.upsert"] = [
+            {
+                "written": True,
+                "version": 1,
+                "server": None,
+                "labels_to_add": list(labels_to_add),
+                "labels_to_remove": list(labels_to_remove),
+            }
+        ]
+        data = node_data(0)
+        data["additional_properties"] = {"rank": "captain", "_created": "then"}
+        model._save_node_transaction(tx, data)
+
+    def test_unchanged_labels_need_no_reads(self, model, tx):
+        self.saved(model, tx)
+
+        assert [name for name, _ in tx.statements] == [
+            "save.upsert",
+            "save.remove_rels",
+        ]
+        (upsert,) = tx.ran("save.upsert")
+        assert upsert["properties"] == {
+            "name": "Hero",
+            "description": "",
+            "tags": [],
+            "rank": "captain",
+        }
+        assert upsert["labels"] == ["Person"]
+
+    def test_label_changes_reported_by_upsert_are_applied(self, model, tx):
+        self.saved(model, tx, ["Person"], ["Villain"])
+
+        assert [params["label"] for params in tx.ran("save.add_label")] == ["Person"]
+        assert [params["label"] for params in tx.ran("save.remove_label")] == [
+            "Villain"
+        ]
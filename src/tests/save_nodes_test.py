@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.fast_inject_service import FastInjectService
+from tests.conftest import FakeTransaction
+
+
+def npc(i):
+    return {
+        "name": f"NPC {i}",
+        "description": "",
+        "tags": [],
+        "labels": ["Person", "NPC"],
+        "additional_properties": {"role": "villager", "_created": "then"},
+        "relationships": [("LIVES_IN", "Village", ">", {})],
+    }
+
+
+def saved(model, nodes, links=(), existing=()):
+    """Save nodes in a transaction on a database already holding ``existing``."""
+
+    def create(nodes, now, project):
+        return [
+            {"name": node["name"], "created": node["name"] not in existing}
+            for node in nodes
+        ]
+
+    tx = FakeTransaction(model.queries, {"save_nodes.create": create})
+    return tx, model._save_nodes_transaction(tx, nodes, list(links))
+
+
+class TestSaveNodes:
+    def test_statements_do_not_grow_with_nodes(self, model):
+        counts = {
+            len(saved(model, [npc(i) for i in range(n)])[0].statements)
+            for n in (3, 30, 300)
+        }
+        assert len(counts) == 1
+
+    def test_nodes_are_written_with_filtered_properties(self, model):
+        tx, _ = saved(model, [npc(1)])
+        (create,) = tx.ran("save_nodes.create")
+        (row,) = create["nodes"]
+        assert row["properties"] == {
+            "name": "NPC 1",
+            "description": "",
+            "tags": [],
+            "role": "villager",
+        }
+
+    def test_existing_nodes_are_left_unchanged_and_reported(self, model):
+        tx, summary = saved(model, [npc(1), npc(2)], existing={"NPC 1"})
+
+        assert summary == {"created": ["NPC 2"], "existing": ["NPC 1"]}
+        assert {
+            params["label"]: params["names"]
+            for params in tx.ran("save_nodes.add_label")
+        } == {"NPC": ["NPC 2"], "Person": ["NPC 2"]}
+        # Nothing is deleted; the links are merged next to existing ones
+        assert {name for name, _ in tx.statements} == {
+            "save_nodes.create",
+            "save_nodes.add_label",
+            "save.create_stumps",
+            "save_nodes.merge_rels",
+        }
+
+    def test_relationships_and_links_are_merged_once(self, model):
+        village = {**npc(0), "name": "Village", "relationships": []}
+        tx, _ = saved(
+            model,
+            [npc(1), village],
+            [
+                ("NPC 1", "LIVES_IN", "Village", {"since": 3}),
+                ("Village", "TRADES_WITH", "Port", {}),
+            ],
+        )
+        merges = {
+            params["rel_type"]: params["rels"]
+            for params in tx.ran("save_nodes.merge_rels")
+        }
+        assert merges["LIVES_IN"] == [
+            {"source": "NPC 1", "target": "Village", "properties": {"since": 3}}
+        ]
+        (stumps,) = tx.ran("save.create_stumps")
+        assert [stump["name"] for stump in stumps["stumps"]] == ["Port"]
+
+    def test_invalid_link_is_rejected_before_writing(self, model):
+        with pytest.raises(ValueError):
+            model.save_nodes([npc(1)], [("NPC 1", "", "Village", {})], MagicMock())
+
+
+class TestTemplateSubgraph:
+    TEMPLATE = {
+        "name": "Village",
+        "description": "",
+        "content": {
+            "labels": [],
+            "tags": [],
+            "properties": {},
+            "nodes": [
+                {"name": "{name} Smith", "labels": ["Person"], "tags": ["npc"]},
+            ],
+            "links": [
+                {"source": "{name} Smith", "type": "LIVES_IN", "target": "{name}"}
+            ],
+        },
+    }
+
+    def test_names_are_resolved_against_current_node(self):
+        service = FastInjectService()
+        service.validate_template(self.TEMPLATE)
+
+        nodes, links = service.build_subgraph(self.TEMPLATE, "Oakvale")
+
+        assert nodes[0]["name"] == "Oakvale Smith"
+        assert nodes[0]["tags"] == ["npc"]
+        assert links == [("Oakvale Smith", "LIVES_IN", "Oakvale", {})]
+
+    def test_placeholder_needs_a_current_node(self):
+        with pytest.raises(ValueError):
+            FastInjectService().build_subgraph(self.TEMPLATE, " ")
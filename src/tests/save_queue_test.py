@@ -0,0 +1,149 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from services.save_queue_service import SaveQueueService
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def node_operations():
+    return MagicMock()
+
+
+@pytest.fixture
+def queue(qapp, node_operations):
+    return SaveQueueService(node_operations, MagicMock(), debounce_ms=10)
+
+
+def node(name, description):
+    return {"name": name, "description": description}
+
+
+def saved(node_operations, index):
+    """Arguments of the save_node call with the given index."""
+    args, kwargs = node_operations.save_node.call_args_list[index]
+    return args[0], args[1], kwargs
+
+
+class TestSaveQueue:
+    def test_burst_of_saves_costs_one_write(self, queue, node_operations):
+        callbacks = [MagicMock() for _ in range(20)]
+        for i, callback in enumerate(callbacks):
+            queue.enqueue(node("Castle", f"v{i}"), callback, node("Castle", "loaded"))
+        queue.flush()
+
+        assert node_operations.save_node.call_count == 1
+        data, success, kwargs = saved(node_operations, 0)
+        assert data["description"] == "v19"
+        assert kwargs["original_data"]["description"] == "loaded"
+
+        success("ok")
+        callbacks[-1].assert_called_once_with("ok")
+        callbacks[0].assert_not_called()
+        assert queue.depth == 0
+
+    def test_nodes_are_written_in_order(self, queue, node_operations):
+        for name in ("A", "B", "C"):
+            queue.enqueue(node(name, "x"), MagicMock())
+        queue.enqueue(node("A", "y"), MagicMock())
+        queue.flush()
+
+        names = [c.args[0]["name"] for c in node_operations.save_node.call_args_list]
+        assert names == ["A", "B", "C"]
+
+    def test_save_waits_for_write_in_flight(self, queue, node_operations):
+        queue.enqueue(node("Castle", "first"), MagicMock(), node("Castle", "loaded"))
+        queue.flush()
+        queue.enqueue(node("Castle", "second"), MagicMock(), node("Castle", "loaded"))
+        queue.flush()
+
+        assert node_operations.save_node.call_count == 1
+        assert queue.depth == 1
+
+        _, success, _ = saved(node_operations, 0)
+        success("ok")
+        queue.flush()
+
+        data, _, kwargs = saved(node_operations, 1)
+        assert data["description"] == "second"
+        assert kwargs["original_data"]["description"] == "first"
+
+    @pytest.mark.parametrize("written_version", [4, 3])
+    def test_waiting_save_uses_version_of_previous_write(
+        self, queue, node_operations, written_version
+    ):
+        # 3 is the result of a save whose diff was empty and wrote nothing
+        queue.enqueue({**node("Castle", "first"), "version": 3}, MagicMock())
+        queue.flush()
+        queue.enqueue({**node("Castle", "second"), "version": 3}, MagicMock())
+
+        _, success, _ = saved(node_operations, 0)
+        success(written_version)
+        queue.flush()
+
+        data, _, _ = saved(node_operations, 1)
+        assert data["version"] == written_version
+
+    def test_conflict_is_passed_to_callback(self, queue, node_operations):
+        on_conflict = MagicMock()
+        queue.enqueue(node("Castle", "x"), MagicMock(), conflict_callback=on_conflict)
+        queue.flush()
+        _, _, kwargs = saved(node_operations, 0)
+
+        conflict = MagicMock()
+        kwargs["conflict_callback"](conflict)
+
+        on_conflict.assert_called_once_with(conflict)
+        assert queue.depth == 0
+
+    def test_failed_write_releases_node(self, queue, node_operations):
+        queue.enqueue(node("Castle", "first"), MagicMock())
+        queue.flush()
+        _, _, kwargs = saved(node_operations, 0)
+
+        kwargs["error_callback"]("boom")
+
+        assert queue.depth == 0
+        queue.error_handler.handle_error.assert_called_once()
+
+    def test_waiters_are_called_after_the_last_write(self, queue, node_operations):
+        results = []
+        queue.when_saved("Castle", results.append)
+        assert results == [True]
+
+        queue.enqueue(node("Castle", "first"), MagicMock())
+        queue.flush()
+        queue.enqueue(node("Castle", "second"), MagicMock())
+        queue.when_saved("Castle", results.append)
+
+        _, success, _ = saved(node_operations, 0)
+        success("ok")
+        assert results == [True]
+        queue.flush()
+        _, success, _ = saved(node_operations, 1)
+        success("ok")
+        assert results == [True, True]
+
+    def test_waiters_learn_about_a_failed_write(self, queue, node_operations):
+        results = []
+        queue.enqueue(node("Castle", "x"), MagicMock(), conflict_callback=MagicMock())
+        queue.when_saved("Castle", results.append)
+        queue.flush()
+
+        _, _, kwargs = saved(node_operations, 0)
+        kwargs["conflict_callback"](MagicMock())
+
+        assert results == [False]
+
+    def test_depth_is_announced(self, queue):
+        depths = []
+        queue.depth_changed.connect(depths.append)
+        queue.enqueue(node("A", "x"), MagicMock())
+        queue.enqueue(node("B", "x"), MagicMock())
+        assert depths == [1, 2]
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+from neo4j.exceptions import ClientError
+
+from core.schema_manager import NODE_LABEL, SchemaManager, visible_labels
+
+
+def make_driver():
+    driver = MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    return driver, session
+
+
+class TestSchemaManager:
+    def test_system_labels_are_hidden(self):
+        assert visible_labels([NODE_LABEL, "Person", "STUMP"]) == ["Person", "STUMP"]
+
+    def test_labels_are_migrated_in_batches(self):
+        driver, session = make_driver()
+        session.execute_write.side_effect = [100, 100, 40]
+        manager = SchemaManager(driver, batch_size=100)
+
+        assert manager.migrate_labels() == 240
+        assert session.execute_write.call_count == 3
+
+    def test_branch_names_are_migrated_in_batches(self):
+        driver, session = make_driver()
+        session.execute_write.side_effect = [100, 7]
+        manager = SchemaManager(driver, batch_size=100)
+
+        assert manager.migrate_branch_names() == 107
+        assert session.execute_write.call_count == 2
+
+    def test_duplicate_names_fall_back_to_index(self):
+        driver, session = make_driver()
+        queries = []
+
+        def run(query, **_):
+            queries.append(query)
+            if query == SchemaManager.NAME_CONSTRAINT_QUERY:
+                raise ClientError("duplicates")
+            return MagicMock()
+
+        session.run.side_effect = run
+        SchemaManager(driver).ensure_schema()
+
+        assert SchemaManager.NAME_INDEX_QUERY in queries
+        assert all(query in queries for query in SchemaManager.INDEXES.values())
+
+    def test_check_reports_missing_and_unused(self):
+        driver, session = make_driver()
+        session.run.return_value = [
+            {"name": "node_project_name", "state": "ONLINE", "readCount": 12},
+            {"name": "node_modified", "state": "POPULATING", "readCount": 0},
+            {"name": "calendar_name", "state": "ONLINE", "readCount": 0},
+            {"name": "event_parsed_date_year", "state": "ONLINE", "readCount": 3},
+            {"name": "node_search", "state": "ONLINE", "readCount": 5},
+            {"name": "shows_branch_count", "state": "ONLINE", "readCount": 1},
+            {"name": "shows_branch_names", "state": "ONLINE", "readCount": 1},
+        ]
+
+        report = SchemaManager(driver).check()
+
+        assert report["missing"] == ["node_modified"]
+        assert report["unused"] == ["calendar_name"]
+
+
+class TestModelLabels:
+    def test_label_changes_never_touch_system_labels(self, model):
+        queries = model._label_change_queries([NODE_LABEL, "Person"], ["Elf"])
+
+        assert [model.queries.lookup(query) for query in queries] == [
+            ("save.add_label", {"label": "Elf"}),
+            ("save.remove_label", {"label": "Person"}),
+        ]
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+from neo4j.exceptions import ServiceUnavailable
+
+from core.neo4jworkers import StreamingQueryWorker
+from core.retry_policy import RetryPolicy
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def make_driver(*results):
+    """Driver whose sessions return the given record iterables in turn."""
+    driver = MagicMock()
+    session = driver.session.return_value.__enter__.return_value
+    session.run.side_effect = [iter(result) for result in results]
+    return driver
+
+
+def failing_after(records, error):
+    yield from records
+    raise error
+
+
+def run_worker(worker):
+    chunks, totals, errors = [], [], []
+    worker.records_chunk.connect(chunks.append)
+    worker.stream_finished.connect(totals.append)
+    worker.error_occurred.connect(errors.append)
+    worker.run()
+    return chunks, totals, errors
+
+
+class TestStreamingQueryWorker:
+    def test_records_are_emitted_in_pages(self, qapp):
+        driver = make_driver(range(5))
+        worker = StreamingQueryWorker(
+            driver, "MATCH (n) RETURN n", chunk_size=2, fetch_size=50
+        )
+
+        chunks, totals, errors = run_worker(worker)
+
+        assert chunks == [[0, 1], [2, 3], [4]]
+        assert totals == [5]
+        assert not errors
+        driver.session.assert_called_once_with(fetch_size=50)
+
+    def test_empty_result_finishes_without_pages(self, qapp):
+        worker = StreamingQueryWorker(make_driver([]), "MATCH (n) RETURN n")
+
+        chunks, totals, _ = run_worker(worker)
+
+        assert chunks == []
+        assert totals == [0]
+
+    def test_failure_before_first_page_is_retried(self, qapp, monkeypatch):
+        monkeypatch.setattr(StreamingQueryWorker, "retry_policy", RetryPolicy(3, 0, 0))
+        driver = make_driver(failing_after([], ServiceUnavailable("down")), range(3))
+        worker = StreamingQueryWorker(driver, "MATCH (n) RETURN n", chunk_size=2)
+
+        chunks, totals, errors = run_worker(worker)
+
+        assert chunks == [[0, 1], [2]]
+        assert totals == [3]
+        assert not errors
+
+    def test_failure_after_first_page_is_not_retried(self, qapp, monkeypatch):
+        monkeypatch.setattr(StreamingQueryWorker, "retry_policy", RetryPolicy(3, 0, 0))
+        driver = make_driver(
+            failing_after(range(3), ServiceUnavailable("down")), range(3)
+        )
+        worker = StreamingQueryWorker(driver, "MATCH (n) RETURN n", chunk_size=2)
+
+        chunks, totals, errors = run_worker(worker)
+
+        assert chunks == [[0, 1]]
+        assert totals == []
+        assert len(errors) == 1
+        assert driver.session.call_count == 1
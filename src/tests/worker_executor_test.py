@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import QApplication
+from unittest.mock import MagicMock
+
+from core.neo4jworkers import BaseNeo4jWorker
+from core.worker_executor import CancellationToken, WorkerExecutor, WorkerPriority
+from models.worker_model import WorkerOperation
+from services.worker_manager_service import WorkerManagerService
+
+
+# Fixture for QApplication instance
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def wait_until(qapp, condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    qapp.processEvents()
+    return condition()
+
+
+class RecordingWorker(BaseNeo4jWorker):
+    def __init__(self, label, log, gate=None):
+        super().__init__(driver=None)
+        self.label = label
+        self.log = log
+        self.gate = gate
+        self.started = threading.Event()
+
+    def execute_operation(self):
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(2)
+        self.log.append(self.label)
+
+
+class ResultWorker(RecordingWorker):
+    value_ready = pyqtSignal(str)
+
+    def execute_operation(self):
+        super().execute_operation()
+        self._deliver("value_ready", self.label)
+
+
+class TestCancellationToken:
+    def test_token_starts_uncancelled(self):
+        token = CancellationToken()
+        assert not token.is_cancelled
+
+    def test_cancel_sets_flag(self):
+        token = CancellationToken()
+        token.cancel()
+        assert token.is_cancelled
+
+
+class TestWorkerExecutor:
+    def test_interactive_work_runs_before_background(self, qapp):
+        executor = WorkerExecutor(max_workers=1)
+        log = []
+        gate = threading.Event()
+        finished = []
+
+        blocker = RecordingWorker("blocker", log, gate)
+        background = RecordingWorker("background", log)
+        interactive = RecordingWorker("interactive", log)
+        for worker in (blocker, background, interactive):
+            worker.finished.connect(lambda: finished.append(True))
+
+        executor.submit(blocker)
+        executor.submit(background, WorkerPriority.BACKGROUND)
+        executor.submit(interactive, WorkerPriority.INTERACTIVE)
+        gate.set()
+
+        assert wait_until(qapp, lambda: len(finished) == 3)
+        assert log == ["blocker", "interactive", "background"]
+        assert wait_until(qapp, lambda: executor.pending_count == 0)
+
+    def test_cancelled_worker_skips_operation(self, qapp):
+        executor = WorkerExecutor(max_workers=1)
+        log = []
+        finished = []
+        worker = RecordingWorker("cancelled", log)
+        worker.finished.connect(lambda: finished.append(True))
+
+        worker.cancel()
+        executor.submit(worker)
+
+        assert wait_until(qapp, lambda: finished)
+        assert log == []
+
+
+class TestWorkerManagerService:
+    def test_cancel_does_not_block_and_ignores_stale_worker(self, qapp):
+        manager = WorkerManagerService(error_handler=MagicMock())
+        log = []
+        gate = threading.Event()
+        stale_done = MagicMock()
+        fresh_done = MagicMock()
+
+        stale = RecordingWorker("stale", log, gate)
+        manager.execute_worker(
+            "check", WorkerOperation(worker=stale, finished_callback=stale_done)
+        )
+        fresh = RecordingWorker("fresh", log)
+        manager.execute_worker(
+            "check", WorkerOperation(worker=fresh, finished_callback=fresh_done)
+        )
+
+        assert stale.is_cancelled
+        gate.set()
+        assert wait_until(qapp, lambda: fresh_done.called)
+        wait_until(qapp, lambda: "stale" in log, timeout=0.2)
+        stale_done.assert_not_called()
+
+    def test_superseded_result_is_discarded_and_counted(self, qapp):
+        manager = WorkerManagerService(error_handler=MagicMock())
+        gate = threading.Event()
+        received = []
+
+        stale = ResultWorker("stale", [], gate)
+        stale.value_ready.connect(received.append)
+        manager.execute_worker("search", WorkerOperation(worker=stale))
+        assert stale.started.wait(2)
+        fresh = ResultWorker("fresh", [])
+        fresh.value_ready.connect(received.append)
+        manager.execute_worker("search", WorkerOperation(worker=fresh))
+        gate.set()
+
+        assert wait_until(
+            qapp, lambda: manager.discarded_result_count == 1 and received
+        )
+        assert received == ["fresh"]
+        assert manager.discarded_result_counts == {"search": 1}
@@ -108,7 +108,9 @@ class LineGeometryPersistence:
                         if branch_assignments:
                             # Remove any existing branch assignments
                             keys_to_remove = [
-                                k for k in properties.keys() if k.startswith("branch_")
+                                k
+                                for k in properties.keys()
+                                if k.startswith("branch_") and k != "branch_count"
                             ]
                             for key in keys_to_remove:
                                 del properties[key]
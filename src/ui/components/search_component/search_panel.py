@@ -377,9 +377,14 @@ class SearchPanel(QWidget, DebouncedSearchMixin):
         self.clear_button.setFixedSize(20, 20)
         self.clear_button.setVisible(False)
 
+        # Fuzzy matching tolerates typos when the full-text index is used
+        self.fuzzy_search = QCheckBox("Fuzzy")
+        self.fuzzy_search.setToolTip("Also match words with small spelling errors")
+
         quick_search_layout.addWidget(search_icon)
         quick_search_layout.addWidget(self.quick_search)
         quick_search_layout.addWidget(self.clear_button)
+        quick_search_layout.addWidget(self.fuzzy_search)
 
         top_layout.addWidget(quick_search_frame)
 
@@ -501,6 +506,7 @@ class SearchPanel(QWidget, DebouncedSearchMixin):
         self.quick_search.returnPressed.connect(self._handle_search_clicked)
         self.quick_search.textChanged.connect(self._handle_quick_search_text_changed)
         self.clear_button.clicked.connect(self._clear_quick_search)
+        self.fuzzy_search.toggled.connect(lambda _: self.trigger_debounced_search())
 
         # Advanced search toggle with animation
         self.advanced_toggle.toggled.connect(self._toggle_advanced_search)
@@ -512,7 +518,7 @@ class SearchPanel(QWidget, DebouncedSearchMixin):
         """
         try:
             # Create search criteria
-            criteria = SearchCriteria()
+            criteria = SearchCriteria(fuzzy=self.fuzzy_search.isChecked())
 
             # Handle quick search
             if quick_text := self.quick_search.text().strip():
@@ -577,7 +583,8 @@ class SearchPanel(QWidget, DebouncedSearchMixin):
                     advanced_search=self.scroll_area.isVisible(),
                     criteria=criteria,
                 )
-                # Set loading state before emitting search
+                # Clear old results and set loading state before emitting search
+                self.clear_results()
                 self.set_loading_state(True)
                 self.search_requested.emit(criteria)
             else:
@@ -658,38 +665,59 @@ class SearchPanel(QWidget, DebouncedSearchMixin):
         try:
             logger.debug("displaying_search_results", result_count=len(results))
             self.clear_results()
-            self.set_loading_state(False)
-
-            if not results:
-                logger.debug("no_results_found")
-                self.status_label.setText("No results found")
-                return
-
-            for result in results:
-                try:
-                    item = QTreeWidgetItem()
-                    name = result.get("name", "")
-                    type_str = result.get("type", "")
-                    props = result.get("properties", {})
-                    props_str = ", ".join(f"{k}: {v}" for k, v in props.items())
+            self._add_result_items(results)
+            self.finish_results()
 
-                    item.setText(0, name)
-                    item.setText(1, type_str)
-                    item.setText(2, props_str)
-                    self.results_tree.addTopLevelItem(item)
-
-                except Exception as e:
-                    logger.error("result_item_error", error=str(e))
-                    continue
+        except Exception as e:
+            logger.error("display_results_error", error=str(e))
+            self.status_label.setText("Error displaying results")
+            self.set_loading_state(False)
 
+    def append_results(self, results: List[Dict[str, Any]]) -> None:
+        """Add a page of streamed search results to the tree widget."""
+        try:
+            logger.debug("appending_search_results", result_count=len(results))
+            self._add_result_items(results)
             total_count = self.results_tree.topLevelItemCount()
-            self.status_label.setText(f"Found {total_count} results")
-            self.results_tree.resizeColumnToContents(0)
+            self.status_label.setText(f"Searching... {total_count} results so far")
 
         except Exception as e:
             logger.error("display_results_error", error=str(e))
-            self.status_label.setText("Error displaying results")
-            self.set_loading_state(False)
+
+    def finish_results(self) -> None:
+        """Leave the loading state once all results have been added."""
+        self.set_loading_state(False)
+
+        total_count = self.results_tree.topLevelItemCount()
+        if not total_count:
+            logger.debug("no_results_found")
+            self.status_label.setText("No results found")
+            return
+
+        self.status_label.setText(f"Found {total_count} results")
+        self.results_tree.resizeColumnToContents(0)
+
+    def _add_result_items(self, results: List[Dict[str, Any]]) -> None:
+        """Add one tree item per search result."""
+        for result in results:
+            try:
+                item = QTreeWidgetItem()
+                name = result.get("name", "")
+                type_str = result.get("type", "")
+                props = result.get("properties", {})
+                props_str = ", ".join(f"{k}: {v}" for k, v in props.items())
+
+                item.setText(0, name)
+                item.setText(1, type_str)
+                item.setText(2, props_str)
+                if snippet := result.get("snippet"):
+                    for column in range(3):
+                        item.setToolTip(column, snippet)
+                self.results_tree.addTopLevelItem(item)
+
+            except Exception as e:
+                logger.error("result_item_error", error=str(e))
+                continue
 
     def clear_results(self) -> None:
         """Clear all search results."""
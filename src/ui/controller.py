@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import List, Tuple
 
 from PyQt6.QtCore import Qt, pyqtSlot, QTimer
-from PyQt6.QtGui import QStandardItem
+from PyQt6.QtGui import QStandardItem, QTextCursor
 from PyQt6.QtWidgets import (
     QCompleter,
     QTableWidgetItem,
@@ -14,6 +14,7 @@ from PyQt6.QtWidgets import (
     QFileDialog,
 )
 
+from core.node_diff import NodeVersionConflict, merge_node_data
 from date_parser_module.dateparser import ParsedDate, DatePrecision
 from models.completer_model import AutoCompletionUIHandler, CompleterInput
 from models.property_model import PropertyItem
@@ -82,11 +83,19 @@ class BaseController(QObject):
         self._delete_in_progress: bool = False
         self._last_delete_timestamp: float = 0.0
         self._previous_name: Optional[str] = None
+        self._llm_original_description: Optional[str] = None
+        # Node whose description the running LLM enhancement writes to
+        self._llm_target: Optional[str] = None
 
         # Required services - will be set by derived class
         self.worker_manager = None
         self.node_operations = None
         self.save_service = None
+        self.save_queue = None
+        self.connection_health_service = None
+        self.node_cleanup_service = None
+        self.llm_service = None
+        self.async_model = None
 
     # Add properties to access protected attributes
     @property
@@ -160,6 +169,9 @@ class BaseController(QObject):
         if not name:
             return
 
+        # Streamed text must not end up in the loaded node's description
+        self._abandon_llm_enhancement()
+
         # Clear all fields to populate them again
         self.ui.clear_all_fields()
 
@@ -167,10 +179,22 @@ class BaseController(QObject):
             name, self._handle_node_data, lambda: self.update_relationship_tree(name)
         )
 
+    def _abandon_llm_enhancement(self) -> None:
+        """Cancel a running LLM enhancement without touching the description."""
+        if self._llm_target is None:
+            return
+        self.worker_manager.cancel_worker("llm")
+        self._llm_original_description = None
+        self._llm_target = None
+        self.ui.show_loading(False)
+
     def rename_node(self, new_name: str) -> None:
         """
         Rename the current node using its element ID.
 
+        References to the node are counted first; the user confirms the
+        rename if other nodes or map lines will be changed.
+
         Args:
             new_name (str): The new name for the node
         """
@@ -181,11 +205,63 @@ class BaseController(QObject):
         if not self.node_operations.validate_node_name(new_name).is_valid:
             return
 
-        def handle_rename_success(success: bool) -> None:
-            if success:
-                self._handle_rename_success(new_name)
-            else:
-                self.error_handler.handle_error("Failed to rename node")
+        old_name = self.ui.name_input.text().strip()
+
+        def handle_preview(preview: Dict[str, Any]) -> None:
+            if preview["name_taken"]:
+                self.error_handler.handle_error(
+                    f'A node named "{new_name}" already exists'
+                )
+                return
+            if preview["descriptions"] or preview["map_lines"] or preview["full_scan"]:
+                message = (
+                    f'Renaming "{old_name}" to "{new_name}" also updates '
+                    f'{preview["references"]} mentions in '
+                    f'{preview["descriptions"]} descriptions and '
+                    f'{preview["map_lines"]} map lines.'
+                )
+                if preview["full_scan"]:
+                    # Without the full-text index the rename reads every description
+                    message += (
+                        " The search index is unavailable, so every description "
+                        "in the project is searched, which can take a while."
+                    )
+                reply = QMessageBox.question(
+                    self.ui,
+                    "Confirm Rename",
+                    f"{message} Continue?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.Yes,
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    return
+            self._execute_rename(new_name)
+
+        worker = self.model.preview_rename(old_name, new_name, handle_preview)
+
+        operation = WorkerOperation(
+            worker=worker,
+            success_callback=handle_preview,
+            error_callback=lambda msg: self.error_handler.handle_error(
+                f"Error preparing rename: {msg}"
+            ),
+            operation_name="preview_rename",
+        )
+
+        self.worker_manager.execute_worker("rename_preview", operation)
+
+    def _execute_rename(self, new_name: str) -> None:
+        """
+        Rename the current node and update the references to it.
+
+        Args:
+            new_name (str): The new name for the node
+        """
+
+        def handle_rename_success(summary: Dict[str, Any]) -> None:
+            logger.info("node_renamed", **summary)
+            self.search_service.clear_cache()
+            self._handle_rename_success(new_name)
 
         worker = self.model.rename_node(
             self.current_node_element_id, new_name, handle_rename_success
@@ -282,7 +358,58 @@ class BaseController(QObject):
         )
 
         if node_data:
-            self.node_operations.save_node(node_data, self._handle_save_success)
+            self.save_queue.enqueue(
+                node_data,
+                self._handle_save_success,
+                original_data=self.save_service.save_state.original_data,
+                conflict_callback=self._handle_save_conflict,
+            )
+
+    def _handle_save_conflict(self, conflict: NodeVersionConflict) -> None:
+        """
+        Let the user resolve a save rejected because the node changed meanwhile.
+
+        Merge applies the local changes to the server's copy; overwrite saves
+        the local data over it. Both are saved against the server's version,
+        so a further change in between is detected again.
+        """
+        msg_box = QMessageBox(self.ui)
+        msg_box.setIcon(QMessageBox.Icon.Warning)
+        msg_box.setWindowTitle("Save Conflict")
+        msg_box.setText(
+            f"'{conflict.name}' was changed by someone else since it was loaded."
+        )
+        msg_box.setInformativeText(
+            "Merge your changes into the current version, or overwrite it with yours?"
+        )
+        merge_button = msg_box.addButton("Merge", QMessageBox.ButtonRole.AcceptRole)
+        overwrite_button = msg_box.addButton(
+            "Overwrite", QMessageBox.ButtonRole.DestructiveRole
+        )
+        msg_box.addButton(QMessageBox.StandardButton.Cancel)
+        msg_box.exec()
+
+        if msg_box.clickedButton() is merge_button:
+            node_data = merge_node_data(
+                conflict.original_data, conflict.local_data, conflict.server_data
+            )
+        elif msg_box.clickedButton() is overwrite_button:
+            node_data = {**conflict.local_data, "version": conflict.server_version}
+        else:
+            logger.info("save_conflict_cancelled", node=conflict.name)
+            return
+
+        logger.info(
+            "save_conflict_resolved",
+            node=conflict.name,
+            merged=msg_box.clickedButton() is merge_button,
+        )
+        self.save_queue.enqueue(
+            node_data,
+            self._handle_save_success,
+            original_data=conflict.server_data,
+            conflict_callback=self._handle_save_conflict,
+        )
 
     def _handle_save_success(self, _: Any) -> None:
         """Handle successful node save with proper UI updates."""
@@ -361,6 +488,10 @@ class BaseController(QObject):
             self.name_cache_service.invalidate_cache()
             self.name_cache_service.rebuild_cache()
 
+            # The deleted node may have been the last link to some STUMPs
+            if self.node_cleanup_service:
+                self.node_cleanup_service.collect_stumps()
+
             QMessageBox.information(self.ui, "Success", "Node deleted successfully")
             self._load_empty_state()
 
@@ -377,7 +508,17 @@ class BaseController(QObject):
         Clean up resources.
         """
         self.save_service.stop_periodic_check()
-        self.worker_manager.cancel_all_workers()
+        if self.save_queue:
+            self.save_queue.drain()
+        if self.connection_health_service:
+            self.connection_health_service.stop_monitoring()
+        if self.node_cleanup_service:
+            self.node_cleanup_service.stop_collector()
+        self.worker_manager.shutdown()
+        if self.llm_service:
+            self.llm_service.close()
+        if self.async_model:
+            self.async_model.close()
         self.model.close()
 
     def _show_error_dialog(self, title: str, message: str) -> None:
@@ -397,7 +538,7 @@ class WorldBuildingController(
     TimelineMixin,
 ):
     """
-    Controller class managing interaction between UI and Neo4j model using QThread workers.
+    Controller class managing interaction between UI and Neo4j model using pooled workers.
 
     Args:
         ui (WorldBuildingUI): The UI instance.
@@ -503,6 +644,7 @@ class WorldBuildingController(
                     # Only clear if this is still the current name
                     if name == self.ui.name_input.text().strip():
                         logger.info("Wiping all_props for new node", new_name=name)
+                        self._abandon_llm_enhancement()
                         self.all_props = {}
                         self.ui.clear_all_fields()
 
@@ -774,6 +916,9 @@ class WorldBuildingController(
             self.save_service.update_save_state(self.original_node_data)
             self.ui.save_button.setStyleSheet(self.config.colors.passiveSave)
 
+            # Related nodes are the likely next click; load them in the background
+            self.node_operations.prefetch_neighbours(record["n"]["name"])
+
         except AttributeError as e:
             logger.error("invalid_data_format", error=str(e))
             self.error_handler.handle_error("Invalid data format in node properties")
@@ -820,7 +965,6 @@ class WorldBuildingController(
             # Handle TIMELINE nodes
             if "TIMELINE" in labels:
                 self._setup_timeline_tab()
-                self._setup_timeline_calendar()
 
         except Exception as e:
             self.error_handler.handle_error(f"Error populating node fields: {str(e)}")
@@ -1064,9 +1208,81 @@ class WorldBuildingController(
                         selected_properties,
                     )
                     self.update_unsaved_changes_indicator()
+
+                    if self.fast_inject_service.has_subgraph(template):
+                        self._save_template_subgraph(template)
         except Exception as e:
             self.error_handler.handle_error(f"Fast Inject Error: {str(e)}")
 
+    def _save_template_subgraph(self, template: Dict[str, Any]) -> None:
+        """
+        Create the nodes and links of a Fast Inject template in one transaction.
+
+        The current node is saved first through the save queue, checked
+        against the version it was loaded with. Once it is written, the
+        template's nodes that do not exist yet are created and its links are
+        added; nodes that already exist are left unchanged.
+
+        Args:
+            template: The applied template
+        """
+        name = self.ui.name_input.text().strip()
+        nodes, links = self.fast_inject_service.build_subgraph(template, name)
+        saved_data = self._get_current_node_data()
+
+        def save_subgraph(saved: bool) -> None:
+            if not saved:
+                self.error_handler.handle_error(
+                    f"The template's nodes were not created because '{name}' "
+                    "could not be saved."
+                )
+                return
+            self.node_operations.save_nodes(
+                nodes,
+                links,
+                lambda summary: self._handle_template_saved(
+                    name, saved_data, summary
+                ),
+            )
+
+        self.save_node()
+        self.save_queue.when_saved(name, save_subgraph)
+
+    def _handle_template_saved(
+        self,
+        name: str,
+        saved_data: Optional[Dict[str, Any]],
+        summary: Dict[str, List[str]],
+    ) -> None:
+        """
+        Report a created template subgraph and show the current node's new links.
+
+        Args:
+            name: Name of the node the template was applied to
+            saved_data: The node's data as saved before the template's nodes
+            summary: The ``created`` and ``existing`` node names
+        """
+        logger.info(
+            "template_subgraph_saved",
+            node=name,
+            created=summary["created"],
+            existing=summary["existing"],
+        )
+        if summary["existing"]:
+            QMessageBox.information(
+                self.ui,
+                "Template Applied",
+                "These nodes already existed and were left unchanged:\n"
+                + "\n".join(summary["existing"]),
+            )
+        else:
+            self._handle_save_success(summary)
+
+        # Reload the node so its new links are part of its loaded state,
+        # unless it was edited or left meanwhile
+        if name and self._get_current_node_data() == saved_data:
+            self.load_node_data()
+
     def _handle_save_state_changed(self, has_changes: bool) -> None:
         """Handle changes in save state."""
         if has_changes:
@@ -1090,17 +1306,22 @@ class WorldBuildingController(
             required_properties=criteria.required_properties,
         )
 
+        def handle_chunk(results: List[Dict[str, Any]]) -> None:
+            """Render each page of results as it arrives."""
+            self.ui.search_panel.append_results(results)
+
         def handle_results(results: List[Dict[str, Any]]) -> None:
             """Handle search results callback."""
-            self.ui.search_panel.display_results(results)
+            self.ui.search_panel.finish_results()
 
-        # Execute search using search service
+        # Execute search using search service, rendering results incrementally
         self.search_service.search_nodes(
             criteria=criteria,  # Now using the enhanced criteria directly
             result_callback=handle_results,
             error_callback=lambda msg: self.ui.search_panel.handle_error(
                 f"Search failed: {msg}"
             ),
+            chunk_callback=handle_chunk,
         )
 
     def _handle_search_result_selected(self, node_name: str) -> None:
@@ -1163,33 +1384,81 @@ class WorldBuildingController(
             return
 
         self.ui.show_loading(True)
+        self._llm_original_description = current_description
+        self._llm_target = current_node
+        separator = "<br>⬆️Old   New⬇️<br>"
+        streamed: List[str] = []
+
+        def is_stale() -> bool:
+            # Cancelled, or another node was loaded or named since the start
+            return (
+                self._llm_target != current_node
+                or self.ui.name_input.text().strip() != current_node
+            )
+
+        def handle_chunk(text: str) -> None:
+            if is_stale():
+                return
+            # Show the new text below the old one while it is generated
+            if not streamed:
+                self.ui.description_input.setHtml(current_description + separator)
+            streamed.append(text)
+            editor = self.ui.description_input.text_edit
+            editor.moveCursor(QTextCursor.MoveOperation.End)
+            editor.insertPlainText(text)
 
         def handle_completion(enhanced_text: str, error: Optional[str]) -> None:
+            if is_stale():
+                if self._llm_target == current_node:
+                    # Renamed in the form without loading another node
+                    self._abandon_llm_enhancement()
+                logger.debug("llm_enhancement_discarded", node=current_node)
+                return
+            self._llm_original_description = None
+            self._llm_target = None
             self.ui.show_loading(False)
             if error:
+                if streamed:
+                    self.ui.description_input.setHtml(current_description)
                 self.error_handler.handle_error(f"LLM Generation Error: {error}")
             elif enhanced_text:
-                current_description = self.ui.description_input.toHtml().strip()
-                payload_description = self.ui.description_input.toPlainText().strip()
-
                 logger.debug(
                     "enhanced_description",
                     current_description=current_description,
                     payload_description=payload_description,
                     enhanced_text=enhanced_text,
                 )
-                new_description = (
-                    f"{current_description}<br>⬆️Old   New⬇️<br>{enhanced_text}"
-                )
+                new_description = f"{current_description}{separator}{enhanced_text}"
                 self.ui.description_input.setHtml(new_description)
                 self.update_unsaved_changes_indicator()
 
-        # Call the enhanced LLM service
-        self.llm_service.enhance_description_with_template(
+        # Run the enhanced LLM request in the background
+        worker = self.llm_service.enhance_description_with_template(
             current_node,
             payload_description,
             template_id,
             depth,
             instructions,
             handle_completion,
+            handle_chunk,
+        )
+        operation = WorkerOperation(
+            worker=worker,
+            # Errors are reported to handle_completion by the service
+            error_callback=lambda msg: logger.debug(
+                "llm_enhancement_failed", error=msg
+            ),
+            operation_name="llm_enhancement",
         )
+        self.worker_manager.execute_worker("llm", operation)
+
+    def cancel_llm_enhancement(self) -> None:
+        """Cancel a running LLM enhancement and restore the description."""
+        if self._llm_original_description is None:
+            return
+        original_description = self._llm_original_description
+        target = self._llm_target
+        self._abandon_llm_enhancement()
+        if target == self.ui.name_input.text().strip():
+            self.ui.description_input.setHtml(original_description)
+
@@ -145,6 +145,9 @@ class WorldBuildingUI(QWidget):
         # FastInject
         self.fast_inject_button.clicked.connect(self.controller.handle_fast_inject)
 
+        # Cancel a running LLM enhancement
+        self.cancel_button.clicked.connect(self.controller.cancel_llm_enhancement)
+
     def setup_ui(self) -> None:
         """Connect signals and finalize UI setup after controller is set"""
         if not self.controller:
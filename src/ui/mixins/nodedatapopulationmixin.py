@@ -5,6 +5,8 @@ from PyQt6.QtWidgets import QTableWidgetItem
 
 from structlog import get_logger
 
+from core.node_references import visible_properties
+
 logger = get_logger(__name__)
 
 
@@ -55,5 +57,5 @@ class NodeDataPopulationMixin:
                 rel.get("type", ""),
                 rel.get("end", ""),
                 rel.get("dir", ">"),
-                json.dumps(rel.get("props", {})),
+                json.dumps(visible_properties(rel.get("props") or {})),
             )
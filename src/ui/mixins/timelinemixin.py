@@ -9,57 +9,36 @@ logger = get_logger(__name__)
 class TimelineMixin:
     """Mixin providing timeline functionality for controllers."""
 
-    def _setup_timeline_calendar(self) -> None:
-        """Set up calendar data for timeline nodes."""
-        # First ensure timeline tab exists
-        if not hasattr(self.ui, "timeline_tab") or not self.ui.timeline_tab:
-            logger.debug("Creating timeline tab")
-            from ui.components.timeline_component.timeline_widget import TimelineTab
-
-            self.ui.timeline_tab = TimelineTab(self)
-            self.ui.tabs.addTab(self.ui.timeline_tab, "Timeline")
-
-        # Now handle the event query
-        if not self.current_node_element_id:
-            logger.error("No element_id available for timeline events")
-            return
-
-        calendar_query = """
-        MATCH (n)-[r:USES_CALENDAR]->(c:CALENDAR)
-        WHERE elementId(n) = $element_id
-        AND n._project = $project
-        WITH c, properties(c) as props
-        RETURN {
-            month_names: props.calendar_month_names,
-            month_days: props.calendar_month_days,
-            weekday_names: props.calendar_weekday_names,
-            days_per_week: toInteger(props.calendar_days_per_week),
-            year_length: toInteger(props.calendar_year_length),
-            current_year: toInteger(props.calendar_current_year),
-            all_props: props
-        } as calendar_data
-        """
-
-        worker = self.model.execute_read_query(
-            calendar_query,
-            {
-                "element_id": self.current_node_element_id,
-                "project": self.config.user.PROJECT,
-            },
-        )
-
-        worker.query_finished.connect(self._handle_calendar_query_finished)
-
-        operation = WorkerOperation(
-            worker=worker,
-            success_callback=None,
-            error_callback=lambda msg: self.error_handler.handle_error(
-                f"Calendar query failed: {msg}"
-            ),
-            operation_name="calendar_lookup",
-        )
-
-        self.worker_manager.execute_worker("calendar", operation)
+    TIMELINE_CALENDAR_QUERY = """
+    MATCH (t)-[:USES_CALENDAR]->(c:CALENDAR)
+    WHERE elementId(t) = $element_id
+      AND t._project = $project
+    WITH c, properties(c) as props
+    RETURN c.name as calendar_name, {
+        month_names: props.calendar_month_names,
+        month_days: props.calendar_month_days,
+        weekday_names: props.calendar_weekday_names,
+        days_per_week: toInteger(props.calendar_days_per_week),
+        year_length: toInteger(props.calendar_year_length),
+        current_year: toInteger(props.calendar_current_year),
+        all_props: props
+    } as calendar_data
+    """
+
+    TIMELINE_EVENTS_QUERY = """
+    MATCH (t)-[:USES_CALENDAR]->(c:CALENDAR)<-[:USES_CALENDAR]-(e:EVENT)
+    WHERE elementId(t) = $element_id
+      AND t._project = $project
+    RETURN {
+        name: e.name,
+        temporal_data: e.temporal_data,
+        parsed_date_year: toInteger(e.parsed_date_year),
+        parsed_date_month: toInteger(e.parsed_date_month),
+        parsed_date_day: toInteger(e.parsed_date_day),
+        event_type: e.event_type
+    } as event
+    ORDER BY e.parsed_date_year, e.parsed_date_month, e.parsed_date_day
+    """
 
     def _handle_calendar_query_finished(self, result: list) -> None:
         """Handle the result from the calendar query worker."""
@@ -84,8 +63,10 @@ class TimelineMixin:
         """
         Set up the timeline tab and load associated data.
 
-        Creates the timeline tab if it doesn't exist and loads calendar
-        and event data for the current node.
+        Creates the timeline tab if it doesn't exist. The calendar and the
+        events of the current node do not depend on each other, so both are
+        read concurrently through the async model instead of one after the
+        other.
         """
         if not self._ensure_timeline_tab():
             return
@@ -94,141 +75,92 @@ class TimelineMixin:
             logger.error("No element_id available for timeline events")
             return
 
-        self._load_calendar_data()
-        # Don't load events here, they'll be loaded after calendar data is available
-
-    def _ensure_timeline_tab(self) -> bool:
-        """
-        Ensure the timeline tab exists and is properly initialized.
-
-        Returns:
-            bool: True if timeline tab exists or was created successfully,
-                  False otherwise.
-        """
-        if not hasattr(self.ui, "timeline_tab") or not self.ui.timeline_tab:
-            logger.debug("Creating timeline tab")
-            from ui.components.timeline_component.timeline_widget import TimelineTab
-
-            self.ui.timeline_tab = TimelineTab(self)
-            self.ui.tabs.addTab(self.ui.timeline_tab, "Timeline")
-
-        return bool(self.ui.timeline_tab)
-
-    def _load_calendar_data(self) -> None:
-        """
-        Load calendar data for the current node.
-
-        Queries the database for calendar relationships and updates
-        the timeline tab's calendar input field.
-        """
-        calendar_query = """
-        MATCH (t)-[r:USES_CALENDAR]->(c:CALENDAR)
-        WHERE elementId(t) = $element_id
-          AND t._project = $project
-        RETURN c.name as calendar_name
-        """
-
-        worker = self.model.execute_read_query(
-            calendar_query,
-            {
-                "element_id": self.current_node_element_id,
-                "project": self.config.user.PROJECT,
-            },
-        )
-
-        worker.query_finished.connect(self._handle_calendar_result)
-
-        operation = WorkerOperation(
-            worker=worker,
-            success_callback=None,
-            error_callback=self._create_error_handler("Calendar lookup failed"),
-            operation_name="calendar_lookup",
+        # A load still running for the previously shown node is of no use
+        if getattr(self, "_timeline_load", None) is not None:
+            self._timeline_load.cancel()
+
+        element_id = self.current_node_element_id
+        params = {"element_id": element_id, "project": self.config.user.PROJECT}
+        self._timeline_load = self.async_model.submit(
+            self.async_model.gather_read_queries(
+                {
+                    "calendar": (self.TIMELINE_CALENDAR_QUERY, params),
+                    "events": (self.TIMELINE_EVENTS_QUERY, params),
+                }
+            ),
+            callback=lambda results: self._handle_timeline_data(element_id, results),
+            error_callback=self._create_error_handler("Timeline lookup failed"),
         )
 
-        self.worker_manager.execute_worker("calendar_lookup", operation)
-
-    def _handle_calendar_result(self, results: list) -> None:
+    def _handle_timeline_data(self, element_id: str, results: Dict[str, Any]) -> None:
         """
-        Handle the results of the calendar query.
+        Show the calendar and events read for a timeline node.
 
         Args:
-            results: List of query results containing calendar information.
+            element_id: Element id of the node the data was read for.
+            results: Records per query, or the exception the query raised.
         """
-        if not results or not results[0].get("calendar_name"):
+        if element_id != self.current_node_element_id:
+            logger.debug("Dropping timeline data of a node no longer shown")
             return
-
         if not hasattr(self.ui, "timeline_tab") or not self.ui.timeline_tab:
             return
 
-        calendar_name = results[0]["calendar_name"]
+        for key, value in results.items():
+            if isinstance(value, Exception):
+                self.error_handler.handle_error(f"Timeline {key} query failed: {value}")
+                results[key] = []
+
+        calendar = results["calendar"]
+        if not calendar or not calendar[0].get("calendar_name"):
+            return
+
         calendar_input = self.ui.timeline_tab.calendar_input
 
         # Block signals while updating
         old_state = calendar_input.blockSignals(True)
-        calendar_input.setText(calendar_name)
+        calendar_input.setText(calendar[0]["calendar_name"])
         calendar_input.blockSignals(old_state)
 
         # Update validation state
         self.ui.timeline_tab._update_validation_state(True)
 
-        # Load the actual calendar data structure for positioning
-        self._load_detailed_calendar_data(calendar_name)
+        if not calendar[0].get("calendar_data"):
+            logger.error("No calendar data found")
+            return
 
-    def _load_detailed_calendar_data(self, calendar_name: str) -> None:
-        """Load detailed calendar data for timeline event positioning.
+        # Store calendar data for positioning the events
+        self.current_calendar_data = calendar[0]["calendar_data"]
+        self.handle_calendar_data(calendar)
 
-        Args:
-            calendar_name: Name of the calendar
-        """
-        query = """
-        MATCH (c:CALENDAR {name: $calendar_name, _project: $project})
-        WITH c, properties(c) as props
-        RETURN {
-            month_names: props.calendar_month_names,
-            month_days: props.calendar_month_days,
-            weekday_names: props.calendar_weekday_names,
-            days_per_week: toInteger(props.calendar_days_per_week),
-            year_length: toInteger(props.calendar_year_length),
-            current_year: toInteger(props.calendar_current_year),
-            all_props: props
-        } as calendar_data
-        """
+        events = self._process_event_results(results["events"])
+        if not events:
+            logger.warning("No valid events extracted from query results")
+            return
 
-        worker = self.model.execute_read_query(
-            query,
-            {
-                "calendar_name": calendar_name,
-                "project": self.config.user.PROJECT,
-            },
+        logger.debug(
+            "Setting timeline event data with calendar",
+            event_count=len(events),
+            has_calendar=True,
         )
+        self.ui.timeline_tab.set_event_data(events, self.current_calendar_data)
 
-        def handle_calendar_data(results: list) -> None:
-            if not results or not results[0].get("calendar_data"):
-                logger.error("Failed to load detailed calendar data")
-                return
-
-            # Store the calendar data
-            self.current_calendar_data = results[0]["calendar_data"]
-            logger.debug(
-                "Loaded detailed calendar data",
-                calendar_data=self.current_calendar_data,
-            )
-
-            # Now load events with this calendar context
-            self._load_timeline_events_with_calendar(self.current_calendar_data)
+    def _ensure_timeline_tab(self) -> bool:
+        """
+        Ensure the timeline tab exists and is properly initialized.
 
-        worker.query_finished.connect(handle_calendar_data)
+        Returns:
+            bool: True if timeline tab exists or was created successfully,
+                  False otherwise.
+        """
+        if not hasattr(self.ui, "timeline_tab") or not self.ui.timeline_tab:
+            logger.debug("Creating timeline tab")
+            from ui.components.timeline_component.timeline_widget import TimelineTab
 
-        operation = WorkerOperation(
-            worker=worker,
-            success_callback=handle_calendar_data,
-            error_callback=self._create_error_handler(
-                "Detailed calendar lookup failed"
-            ),
-            operation_name="detailed_calendar_lookup",
-        )
+            self.ui.timeline_tab = TimelineTab(self)
+            self.ui.tabs.addTab(self.ui.timeline_tab, "Timeline")
 
-        self.worker_manager.execute_worker("detailed_calendar", operation)
+        return bool(self.ui.timeline_tab)
 
     def _load_timeline_events_with_calendar(
         self, calendar_data: Dict[str, Any]
@@ -6,18 +6,24 @@ from structlog import get_logger
 logger = get_logger(__name__)
 
 
-def perform_application_exit(self):
-    """Perform a clean application exit."""
+def perform_application_exit(self=None):
+    """Perform a clean application exit.
+
+    Closing the top-level windows runs their close handlers, which write any
+    queued node saves before the database connection is closed.
+    """
     try:
         # Get the main window instance
-        main_window = self.app_instance
+        main_window = getattr(self, "app_instance", None)
 
         # Cleanup if possible
         if hasattr(main_window, "cleanup"):
             main_window.cleanup()
 
-        # Quit the application
-        QApplication.instance().quit()
+        # Close windows so pending saves are flushed, then quit the application
+        app = QApplication.instance()
+        app.closeAllWindows()
+        app.quit()
 
         # Force exit if needed
         sys.exit(0)
@@ -3,11 +3,13 @@ import json
 from typing import Callable, Tuple
 from typing import Dict, Any, List
 
-from PyQt6.QtWidgets import QFileDialog, QMessageBox, QTextEdit
+from PyQt6.QtWidgets import QFileDialog, QMessageBox
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 
+from utils.html_text import html_to_text
+
 
 class Exporter:
     """
@@ -134,24 +136,19 @@ class Exporter:
         """
         return "; ".join(f"{key}: {value}" for key, value in properties.items())
 
-    def _format_description(self, description_input: QTextEdit, format_type: str) -> (
-            str):
+    def _format_description(self, description: str, format_type: str) -> str:
         """
         Get description in appropriate format based on export type.
 
         Args:
-            description_input: The QTextEdit input widget containing the description
+            description: The description as HTML
             format_type: The type of export format ('json', 'txt', 'csv', 'pdf')
 
         Returns:
             str: The formatted description text
         """
-        # Only PDF should retain HTML formatting
-        if format_type == "pdf":
-            return description_input.toHtml().strip()
-
-        # All other formats get plain text
-        return description_input.toPlainText().strip()
+        # CSV rows cannot contain line breaks
+        return html_to_text(description, keep_lines=format_type != "csv")
 
     def _handle_json(self, file_name: str, nodes_data: List[Dict[str, Any]]) -> None:
         """
@@ -165,7 +162,7 @@ class Exporter:
         for node in nodes_data:
             if "description" in node:
                 node["description"] = self._format_description(
-                    self.ui.description_input, "json"
+                    node["description"], "json"
                 )
 
         with open(file_name, "w") as file:
@@ -184,7 +181,7 @@ class Exporter:
                 # Create a copy of node data with formatted description
                 node_with_formatted_desc = node_data.copy()
                 node_with_formatted_desc["description"] = self._format_description(
-                    self.ui.description_input, "txt"
+                    node_data.get("description", ""), "txt"
                 )
                 self._write_txt_node(file, node_with_formatted_desc)
                 file.write("\n")
@@ -223,7 +220,7 @@ class Exporter:
             for node_data in nodes_data:
                 # Format the description
                 formatted_desc = self._format_description(
-                    self.ui.description_input, "csv"
+                    node_data.get("description", ""), "csv"
                 )
 
                 relationships = "; ".join(
@@ -246,7 +243,18 @@ class Exporter:
             nodes_data (List[Dict[str, Any]]): The list of node data to export.
         """
         pdf_exporter = PDFExporter()
-        pdf_exporter.export_to_pdf(file_name, nodes_data)
+        pdf_exporter.export_to_pdf(
+            file_name,
+            [
+                {
+                    **node,
+                    "description": self._format_description(
+                        node.get("description", ""), "pdf"
+                    ),
+                }
+                for node in nodes_data
+            ],
+        )
 
     def _show_success_message(self, format_type: str) -> None:
         """
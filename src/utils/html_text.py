@@ -0,0 +1,167 @@
+"""
+This module provides the shared conversion of rich-text descriptions to plain
+text for the LLM context, exports and search snippets. Descriptions are the
+HTML the Qt text editor produces, so a small standard-library parser is
+enough, and converted texts are memoised by a hash of their content because
+the same descriptions are converted again and again.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+
+# Elements whose content is not text, e.g. the style sheet Qt puts in <head>
+_SKIPPED_TAGS = {"head", "script", "style", "title"}
+
+# Elements that start a new line in Qt's plain text
+_BLOCK_TAGS = {
+    "blockquote",
+    "br",
+    "div",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "table",
+    "tr",
+    "ul",
+}
+
+_MARKUP = re.compile(r"[<&]")
+
+
+class _TextCollector(HTMLParser):
+    """Parser collecting text nodes, with a line break between blocks."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def _normalize(text: str, keep_lines: bool) -> str:
+    if not keep_lines:
+        return " ".join(text.split())
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class PlainTextExtractor:
+    """
+    Converter from description HTML to plain text with a bounded cache.
+
+    Texts without markup are only normalised. Converted texts are cached
+    least recently used first, keyed by a hash of the HTML so the cache does
+    not hold on to large descriptions.
+
+    Args:
+        max_entries (int): Maximum number of cached conversions.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def to_text(self, html_text: Optional[str], keep_lines: bool = False) -> str:
+        """
+        Get the plain text of a description.
+
+        Args:
+            html_text (str, optional): The description as HTML or plain text.
+            keep_lines (bool): Keep a line per paragraph, like the editor's
+                plain text. Otherwise all whitespace becomes single spaces.
+
+        Returns:
+            str: The plain text.
+        """
+        if not html_text:
+            return ""
+        if not _MARKUP.search(html_text):
+            return _normalize(html_text, keep_lines)
+
+        digest = hashlib.blake2b(html_text.encode("utf-8"), digest_size=16)
+        digest.update(b"\n" if keep_lines else b" ")
+        key = digest.digest()
+        with self._lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                return text
+            self._stats["misses"] += 1
+
+        parser = _TextCollector()
+        parser.feed(html_text)
+        parser.close()
+        text = _normalize("".join(parser.parts), keep_lines)
+
+        with self._lock:
+            self._cache[key] = text
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return text
+
+    def clear(self) -> None:
+        """Drop all cached conversions."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses`` and the number of cached ``entries``.
+        """
+        with self._lock:
+            return {**self._stats, "entries": len(self._cache)}
+
+
+# Shared by every caller, so a description is only converted once
+plain_text = PlainTextExtractor()
+
+
+def html_to_text(html_text: Optional[str], keep_lines: bool = False) -> str:
+    """
+    Get the plain text of a description using the shared extractor.
+
+    Args:
+        html_text (str, optional): The description as HTML or plain text.
+        keep_lines (bool): Keep a line per paragraph instead of a single line.
+
+    Returns:
+        str: The plain text.
+    """
+    return plain_text.to_text(html_text, keep_lines)
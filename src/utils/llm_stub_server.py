@@ -0,0 +1,137 @@
+"""
+This module provides a local stand-in for an OpenAI-compatible chat
+completions endpoint, so the LLM features can be tried and tested offline.
+Streaming requests are answered with server-sent events, one word per event;
+other requests get a single JSON completion.
+
+Usage:
+    python -m utils.llm_stub_server --port 8765
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1/chat/completions
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+DEFAULT_REPLY = "A quiet village of timber halls, known for its river mill."
+
+
+class StubLLMServer(ThreadingHTTPServer):
+    """
+    HTTP server answering every POST with a fixed completion.
+
+    Args:
+        address (tuple): (host, port) to listen on; port 0 picks a free port.
+        reply (str): The completion text.
+        chunk_delay (float): Seconds to wait between streamed events.
+        stream (bool): Whether to honour requests for a streamed answer.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple,
+        reply: str = DEFAULT_REPLY,
+        chunk_delay: float = 0.0,
+        stream: bool = True,
+    ) -> None:
+        super().__init__(address, StubLLMHandler)
+        self.reply = reply
+        self.chunk_delay = chunk_delay
+        self.stream = stream
+        self.requests: List[dict] = []
+
+    @property
+    def url(self) -> str:
+        """The chat completions endpoint of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    """Request handler of ``StubLLMServer``."""
+
+    server: StubLLMServer
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.requests.append(payload)
+
+        if not (payload.get("stream") and self.server.stream):
+            body = json.dumps(
+                {"choices": [{"message": {"content": self.server.reply}}]}
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        try:
+            for token in re.findall(r"\S+\s*", self.server.reply):
+                event = {"choices": [{"delta": {"content": token}}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(self.server.chunk_delay)
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled the request
+            pass
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep the console quiet."""
+
+
+def start_stub_server(
+    reply: str = DEFAULT_REPLY,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    chunk_delay: float = 0.0,
+    stream: bool = True,
+) -> StubLLMServer:
+    """
+    Start a stub server in a background thread.
+
+    Args:
+        reply (str): The completion text.
+        host (str): Host to listen on.
+        port (int): Port to listen on; 0 picks a free port.
+        chunk_delay (float): Seconds to wait between streamed events.
+        stream (bool): Whether to honour requests for a streamed answer.
+
+    Returns:
+        StubLLMServer: The running server; call ``shutdown`` to stop it.
+    """
+    server = StubLLMServer((host, port), reply, chunk_delay, stream)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline stand-in for an LLM API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--reply", default=DEFAULT_REPLY)
+    parser.add_argument("--chunk-delay", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = StubLLMServer((args.host, args.port), args.reply, args.chunk_delay)
+    print(f"Stub LLM API listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()